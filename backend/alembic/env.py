@@ -29,7 +29,8 @@ from app.models import (
     Membership,
     ClubCategory,
     Announcement,
-    GallerySettings
+    GallerySettings,
+    InstagramPost
 )
 
 # this is the Alembic Config object, which provides
@@ -37,8 +38,9 @@ from app.models import (
 config = context.config
 
 # Interpret the config file for Python logging.
-# This line sets up loggers basically.
-if config.config_file_name is not None:
+# This line sets up loggers basically. Skipped when a caller runs migrations
+# in-process on its own connection, so its logging setup is left alone.
+if config.config_file_name is not None and "connection" not in config.attributes:
     fileConfig(config.config_file_name)
 
 # Set the database URL from our application settings
@@ -90,6 +92,12 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # Reuse a connection handed in by an in-process caller (init_db.py)
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run_migrations(connection)
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -97,15 +105,20 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-            compare_type=True,
-            compare_server_default=True,
-        )
-
-        with context.begin_transaction():
-            context.run_migrations()
+        _run_migrations(connection)
+
+
+def _run_migrations(connection) -> None:
+    """Run migrations on an open connection"""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        compare_type=True,
+        compare_server_default=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
 
 
 if context.is_offline_mode():
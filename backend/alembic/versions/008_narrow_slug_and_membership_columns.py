@@ -0,0 +1,53 @@
+"""Narrow club slug and membership role/status columns
+
+Revision ID: 008_narrow_columns
+Revises: 007_phase7_moderation_reports
+Create Date: 2025-11-20 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008_narrow_columns'
+down_revision = '007_phase7_moderation_reports'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Shrink declared lengths of short, heavily-indexed string columns
+
+    Slugs are validated to lowercase letters, digits and hyphens and never
+    exceed 64 characters; membership role/status hold short fixed words.
+    Tighter declared lengths keep the unique slug index compact.
+    """
+    op.alter_column('clubs', 'slug',
+                    existing_type=sa.String(length=255),
+                    type_=sa.String(length=64),
+                    existing_nullable=False)
+    op.alter_column('memberships', 'role',
+                    existing_type=sa.String(length=50),
+                    type_=sa.String(length=16),
+                    existing_nullable=False)
+    op.alter_column('memberships', 'status',
+                    existing_type=sa.String(length=50),
+                    type_=sa.String(length=16),
+                    existing_nullable=False)
+
+
+def downgrade() -> None:
+    """Restore original column lengths"""
+    op.alter_column('memberships', 'status',
+                    existing_type=sa.String(length=16),
+                    type_=sa.String(length=50),
+                    existing_nullable=False)
+    op.alter_column('memberships', 'role',
+                    existing_type=sa.String(length=16),
+                    type_=sa.String(length=50),
+                    existing_nullable=False)
+    op.alter_column('clubs', 'slug',
+                    existing_type=sa.String(length=64),
+                    type_=sa.String(length=255),
+                    existing_nullable=False)
@@ -0,0 +1,80 @@
+"""Use server-side now() defaults for audit timestamps, timestamptz for user_reports
+
+Revision ID: 009_server_timestamps
+Revises: 008_narrow_columns
+Create Date: 2025-11-20 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009_server_timestamps'
+down_revision = '008_narrow_columns'
+branch_labels = None
+depends_on = None
+
+
+# (table, column) pairs populated by the database clock, already timestamptz
+TIMESTAMP_COLUMNS = [
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+    ('clubs', 'created_at'),
+    ('clubs', 'updated_at'),
+    ('memberships', 'joined_at'),
+    ('announcements', 'created_at'),
+    ('announcements', 'updated_at'),
+    ('gallery_settings', 'created_at'),
+    ('gallery_settings', 'updated_at'),
+    ('favorites', 'created_at'),
+    ('assessments', 'created_at'),
+]
+
+# Created as naive timestamps by 007; stored values are UTC
+NAIVE_TIMESTAMP_COLUMNS = [
+    ('user_reports', 'created_at'),
+    ('user_reports', 'updated_at'),
+]
+
+
+def upgrade() -> None:
+    """Make the database clock the source of audit timestamps
+
+    Most columns are already timestamptz and only get the server default.
+    The user_reports timestamps are also converted to timestamptz,
+    reading their existing naive values AT TIME ZONE 'UTC'.
+    """
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=sa.text('now()'),
+        )
+
+    for table, column in NAIVE_TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.DateTime(),
+            type_=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=sa.text('now()'),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade() -> None:
+    """Turn the user_reports timestamps back into naive UTC
+
+    The other columns already defaulted to NOW() before 009.
+    """
+    for table, column in NAIVE_TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.DateTime(timezone=True),
+            type_=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.text('now()'),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
@@ -0,0 +1,45 @@
+"""Replace full status indexes with partial indexes on pending rows
+
+Revision ID: 010_partial_pending_indexes
+Revises: 009_server_timestamps
+Create Date: 2025-11-20 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010_partial_pending_indexes'
+down_revision = '009_server_timestamps'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index only the rows the admin queues actually scan
+
+    Almost every report and club settles into a terminal status, so a full
+    B-tree on the status column is mostly dead weight. Partial indexes over
+    the PENDING rows stay tiny and serve the moderation queues directly.
+    """
+    op.drop_index('ix_user_reports_status', table_name='user_reports')
+    op.drop_index('ix_clubs_approval_status', table_name='clubs')
+
+    op.create_index(
+        'ix_reports_pending', 'user_reports', ['created_at'],
+        unique=False, postgresql_where=sa.text("status = 'PENDING'")
+    )
+    op.create_index(
+        'ix_clubs_pending_approval', 'clubs', ['created_at'],
+        unique=False, postgresql_where=sa.text("approval_status = 'PENDING'")
+    )
+
+
+def downgrade() -> None:
+    """Restore full status indexes"""
+    op.drop_index('ix_clubs_pending_approval', table_name='clubs')
+    op.drop_index('ix_reports_pending', table_name='user_reports')
+
+    op.create_index('ix_clubs_approval_status', 'clubs', ['approval_status'], unique=False)
+    op.create_index('ix_user_reports_status', 'user_reports', ['status'], unique=False)
@@ -0,0 +1,76 @@
+"""Move cached Instagram posts from a JSON blob into their own table
+
+Revision ID: 011_instagram_posts
+Revises: 010_partial_pending_indexes
+Create Date: 2025-11-20 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '011_instagram_posts'
+down_revision = '010_partial_pending_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create instagram_posts and migrate gallery_settings.cached_posts into it
+
+    Each post becomes a row indexed by (club_id, timestamp DESC), so the
+    gallery reads the newest posts with an index range scan instead of
+    parsing a serialized JSON array.
+    """
+    op.create_table('instagram_posts',
+        sa.Column('id', sa.String(length=64), nullable=False),
+        sa.Column('club_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('media_type', sa.String(length=32), nullable=False),
+        sa.Column('media_url', sa.String(length=1000), nullable=False),
+        sa.Column('caption', sa.Text(), nullable=True),
+        sa.Column('permalink', sa.String(length=500), nullable=False),
+        sa.Column('timestamp', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.ForeignKeyConstraint(['club_id'], ['clubs.id'], ondelete='CASCADE')
+    )
+    op.create_index(
+        'ix_instagram_club_ts', 'instagram_posts',
+        ['club_id', sa.text('timestamp DESC')], unique=False
+    )
+
+    # Copy any posts cached as JSON text before dropping the column
+    op.execute("""
+        INSERT INTO instagram_posts (id, club_id, media_type, media_url, caption, permalink, timestamp)
+        SELECT post->>'id', gs.club_id, post->>'media_type', post->>'media_url',
+               post->>'caption', post->>'permalink', (post->>'timestamp')::timestamptz
+        FROM gallery_settings gs,
+             jsonb_array_elements(gs.cached_posts::jsonb) AS post
+        WHERE gs.cached_posts IS NOT NULL
+        ON CONFLICT (id) DO NOTHING;
+    """)
+
+    op.drop_column('gallery_settings', 'cached_posts')
+
+
+def downgrade() -> None:
+    """Fold instagram_posts back into gallery_settings.cached_posts"""
+    op.add_column('gallery_settings', sa.Column('cached_posts', sa.Text(), nullable=True))
+
+    op.execute("""
+        UPDATE gallery_settings gs
+        SET cached_posts = sub.posts::text
+        FROM (
+            SELECT club_id, jsonb_agg(jsonb_build_object(
+                'id', id, 'media_type', media_type, 'media_url', media_url,
+                'caption', caption, 'permalink', permalink, 'timestamp', timestamp
+            ) ORDER BY timestamp DESC) AS posts
+            FROM instagram_posts
+            GROUP BY club_id
+        ) sub
+        WHERE gs.club_id = sub.club_id;
+    """)
+
+    op.drop_index('ix_instagram_club_ts', table_name='instagram_posts')
+    op.drop_table('instagram_posts')
@@ -0,0 +1,26 @@
+"""Reference clubs by UUID foreign key from recommendations (no-op)
+
+Revision ID: 012_recommendation_club_fk
+Revises: 011_instagram_posts
+Create Date: 2025-11-21 09:00:00.000000
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '012_recommendation_club_fk'
+down_revision = '011_instagram_posts'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """No-op: recommendations.club_id is already a UUID FK to clubs.id
+
+    Migration 001 created it that way (with uq_assessment_club); only the
+    ORM mapping declared it as a slug string. The revision is kept so the
+    chain from 011 to 013 stays intact.
+    """
+
+
+def downgrade() -> None:
+    """No-op"""
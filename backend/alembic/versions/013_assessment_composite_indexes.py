@@ -0,0 +1,41 @@
+"""Add composite indexes for assessment history and recommendation lookups
+
+Revision ID: 013_assessment_indexes
+Revises: 012_recommendation_club_fk
+Create Date: 2025-11-21 12:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '013_assessment_indexes'
+down_revision = '012_recommendation_club_fk'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index assessments by (user_id, created_at) and recommendations by (assessment_id, rank)
+
+    The composite indexes cover the single-column user_id and assessment_id
+    indexes as prefixes, so those are dropped.
+    """
+    op.create_index(
+        'ix_assessments_user_created', 'assessments', ['user_id', 'created_at'], unique=False
+    )
+    op.create_index(
+        'ix_recommendations_assessment_rank', 'recommendations', ['assessment_id', 'rank'], unique=False
+    )
+
+    op.drop_index('idx_assessments_user', table_name='assessments')
+    op.drop_index('idx_recommendations_assessment', table_name='recommendations')
+
+
+def downgrade() -> None:
+    """Restore single-column indexes"""
+    op.create_index('idx_recommendations_assessment', 'recommendations', ['assessment_id'])
+    op.create_index('idx_assessments_user', 'assessments', ['user_id'])
+
+    op.drop_index('ix_recommendations_assessment_rank', table_name='recommendations')
+    op.drop_index('ix_assessments_user_created', table_name='assessments')
@@ -0,0 +1,56 @@
+"""Store keyed hashes of password reset and email verification tokens
+
+Revision ID: 014_hashed_user_tokens
+Revises: 013_assessment_indexes
+Create Date: 2025-11-22 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '014_hashed_user_tokens'
+down_revision = '013_assessment_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace plaintext token columns with indexed 16-byte hash columns
+
+    The hashes are keyed with the application's TOKEN_PEPPER, so existing
+    plaintext tokens cannot be converted here; outstanding reset and
+    verification links stop working and users request new ones.
+    """
+    op.add_column('users', sa.Column('reset_password_token_hash', sa.LargeBinary(length=16), nullable=True))
+    op.add_column('users', sa.Column('email_verification_token_hash', sa.LargeBinary(length=16), nullable=True))
+    op.create_index(op.f('ix_users_reset_password_token_hash'), 'users', ['reset_password_token_hash'], unique=False)
+    op.create_index(op.f('ix_users_email_verification_token_hash'), 'users', ['email_verification_token_hash'], unique=False)
+
+    op.drop_index(op.f('ix_users_email_verification_token'), table_name='users')
+    op.drop_index(op.f('ix_users_reset_password_token'), table_name='users')
+    op.drop_column('users', 'email_verification_token')
+    op.drop_column('users', 'reset_password_token')
+
+    # Expiries without a token are meaningless now
+    op.execute(
+        "UPDATE users SET reset_password_token_expires = NULL, email_verification_token_expires = NULL;"
+    )
+
+
+def downgrade() -> None:
+    """Restore plaintext token columns (outstanding tokens are not recoverable)"""
+    op.add_column('users', sa.Column('reset_password_token', sa.String(length=255), nullable=True))
+    op.add_column('users', sa.Column('email_verification_token', sa.String(length=255), nullable=True))
+    op.create_index(op.f('ix_users_reset_password_token'), 'users', ['reset_password_token'], unique=False)
+    op.create_index(op.f('ix_users_email_verification_token'), 'users', ['email_verification_token'], unique=False)
+
+    op.drop_index(op.f('ix_users_email_verification_token_hash'), table_name='users')
+    op.drop_index(op.f('ix_users_reset_password_token_hash'), table_name='users')
+    op.drop_column('users', 'email_verification_token_hash')
+    op.drop_column('users', 'reset_password_token_hash')
+
+    op.execute(
+        "UPDATE users SET reset_password_token_expires = NULL, email_verification_token_expires = NULL;"
+    )
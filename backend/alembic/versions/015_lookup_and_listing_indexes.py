@@ -0,0 +1,53 @@
+"""Add case-insensitive email index and partial club listing indexes
+
+Revision ID: 015_lookup_listing_indexes
+Revises: 014_hashed_user_tokens
+Create Date: 2025-11-22 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '015_lookup_listing_indexes'
+down_revision = '014_hashed_user_tokens'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index the hottest lookup and listing predicates
+
+    Email lookups match on lower(email), so they get a unique functional
+    index. The featured and popular listings get partial indexes in their
+    ORDER BY order, limited to the rows they can return.
+
+    Slug and email already have unique constraints, whose indexes serve
+    exact-match lookups, so the duplicate plain indexes from the initial
+    schema are dropped instead of adding a third copy.
+    """
+    op.create_index(
+        'ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=True
+    )
+    op.create_index(
+        'ix_clubs_featured', 'clubs', [sa.text('created_at DESC')],
+        unique=False, postgresql_where=sa.text('is_featured AND is_active')
+    )
+    op.create_index(
+        'ix_clubs_popular', 'clubs', [sa.text('member_count DESC')],
+        unique=False, postgresql_where=sa.text('is_active')
+    )
+
+    op.drop_index('idx_users_email', table_name='users')
+    op.drop_index('idx_clubs_slug', table_name='clubs')
+
+
+def downgrade() -> None:
+    """Restore plain email/slug indexes and drop the new ones"""
+    op.create_index('idx_clubs_slug', 'clubs', ['slug'])
+    op.create_index('idx_users_email', 'users', ['email'])
+
+    op.drop_index('ix_clubs_popular', table_name='clubs')
+    op.drop_index('ix_clubs_featured', table_name='clubs')
+    op.drop_index('ix_users_email_lower', table_name='users')
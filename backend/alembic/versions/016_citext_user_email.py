@@ -0,0 +1,43 @@
+"""Store user emails as citext
+
+Revision ID: 016_citext_user_email
+Revises: 015_lookup_listing_indexes
+Create Date: 2025-11-23 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '016_citext_user_email'
+down_revision = '015_lookup_listing_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Make email comparisons case-insensitive in the column type
+
+    With citext, the existing unique constraint on email already enforces
+    case-insensitive uniqueness and serves lookups. The lower(email)
+    functional index is no longer needed. Emails are lowercased once here,
+    and a CHECK keeps them stored canonically.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+
+    op.execute("UPDATE users SET email = lower(email) WHERE email <> lower(email)")
+    op.execute("ALTER TABLE users ALTER COLUMN email TYPE citext")
+    op.create_check_constraint('email_lowercase_check', 'users', 'email = lower(email)')
+
+    op.drop_index('ix_users_email_lower', table_name='users')
+
+
+def downgrade() -> None:
+    """Revert email to varchar(255) with the lower(email) index"""
+    op.create_index(
+        'ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=True
+    )
+
+    op.drop_constraint('email_lowercase_check', 'users', type_='check')
+    op.execute("ALTER TABLE users ALTER COLUMN email TYPE varchar(255)")
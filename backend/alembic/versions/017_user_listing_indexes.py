@@ -0,0 +1,49 @@
+"""Add composite indexes for user listing, memberships and profile statistics
+
+Revision ID: 017_user_listing_indexes
+Revises: 016_citext_user_email
+Create Date: 2025-11-24 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '017_user_listing_indexes'
+down_revision = '016_citext_user_email'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index the UserService filter + sort queries in their ORDER BY order
+
+    (user_id, joined_at DESC) INCLUDE (club_id, status) covers the
+    single-column user_id index as a prefix, so that index is dropped.
+    Assessments already have (user_id, created_at) from migration 013.
+    """
+    op.create_index(
+        'ix_users_active_admin_created', 'users',
+        ['is_active', 'is_admin', sa.text('created_at DESC')], unique=False
+    )
+    op.create_index(
+        'ix_memberships_user_joined', 'memberships',
+        ['user_id', sa.text('joined_at DESC')], unique=False,
+        postgresql_include=['club_id', 'status']
+    )
+    op.create_index(
+        'ix_memberships_user_active', 'memberships', ['user_id'],
+        unique=False, postgresql_where=sa.text("status = 'active'")
+    )
+
+    op.drop_index('idx_memberships_user', table_name='memberships')
+
+
+def downgrade() -> None:
+    """Restore the single-column user_id index and drop the new ones"""
+    op.create_index('idx_memberships_user', 'memberships', ['user_id'])
+
+    op.drop_index('ix_memberships_user_active', table_name='memberships')
+    op.drop_index('ix_memberships_user_joined', table_name='memberships')
+    op.drop_index('ix_users_active_admin_created', table_name='users')
@@ -0,0 +1,35 @@
+"""Add a partial index for the default club listing order
+
+Revision ID: 018_club_listing_index
+Revises: 017_user_listing_indexes
+Create Date: 2025-11-25 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '018_club_listing_index'
+down_revision = '017_user_listing_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index active clubs in the list's ORDER BY order
+
+    GET /clubs/ sorts by (is_featured, created_at, id) DESC, and its
+    cursor pages seek on the same row value, so both read the index in
+    order. slug and category are already indexed from the initial schema.
+    """
+    op.create_index(
+        'ix_clubs_active_listing', 'clubs',
+        [sa.text('is_featured DESC'), sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False, postgresql_where=sa.text('is_active')
+    )
+
+
+def downgrade() -> None:
+    """Drop the club listing index"""
+    op.drop_index('ix_clubs_active_listing', table_name='clubs')
@@ -5,7 +5,8 @@ from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc
 from typing import List
-from datetime import datetime, timedelta
+from uuid import UUID
+from datetime import datetime, timedelta, timezone
 import pandas as pd
 import io
 from slugify import slugify
@@ -36,7 +37,7 @@ async def get_dashboard_stats(
     total_assessments = db.query(Assessment).count()
 
     # New users in last 30 days
-    thirty_days_ago = datetime.utcnow() - timedelta(days=30)
+    thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
     new_users = db.query(User).filter(User.created_at >= thirty_days_ago).count()
 
     # Active clubs
@@ -110,7 +111,7 @@ async def list_users(
 
 @router.get("/users/{user_id}", response_model=UserResponse)
 async def get_user(
-    user_id: str,
+    user_id: UUID,
     db: Session = Depends(get_db),
     current_admin: User = Depends(require_admin)
 ):
@@ -126,7 +127,7 @@ async def get_user(
 
 @router.patch("/users/{user_id}/role")
 async def update_user_role(
-    user_id: str,
+    user_id: UUID,
     is_admin: bool,
     db: Session = Depends(get_db),
     current_admin: User = Depends(require_admin)
@@ -141,7 +142,6 @@ async def update_user_role(
 
     user.is_admin = is_admin
     db.commit()
-    db.refresh(user)
 
     return {
         "id": str(user.id),
@@ -153,7 +153,7 @@ async def update_user_role(
 
 @router.patch("/users/{user_id}/status")
 async def update_user_status(
-    user_id: str,
+    user_id: UUID,
     is_active: bool,
     db: Session = Depends(get_db),
     current_admin: User = Depends(require_admin)
@@ -168,7 +168,6 @@ async def update_user_status(
 
     user.is_active = is_active
     db.commit()
-    db.refresh(user)
 
     return {
         "id": str(user.id),
@@ -360,6 +359,7 @@ async def get_pending_clubs(
     clubs = (
         db.query(Club)
         .filter(Club.approval_status == ApprovalStatus.PENDING)
+        .order_by(Club.created_at)
         .offset(skip)
         .limit(limit)
         .all()
@@ -13,7 +13,6 @@ from app.schemas.assessment import (
     ClubRecommendation,
 )
 from app.services.assessment_service import assessment_service
-from app.services.club_service import club_service
 from app.api.deps import get_current_user, get_optional_user
 from app.models.user import User
 
@@ -51,9 +50,10 @@ async def submit_assessment(
             assessment_data.responses.model_dump()
         )
 
+        # Recommendations come back unvalidated; validate them once here
         return AssessmentResult(
             assessment_id=str(assessment.id),
-            recommendations=recommendations,
+            recommendations=[dict(rec) for rec in recommendations],
             created_at=assessment.created_at
         )
 
@@ -84,12 +84,11 @@ async def get_assessment(
             detail="Assessment not found"
         )
 
-    # Reconstruct recommendations from stored data by fetching club details from database
+    # Reconstruct recommendations from stored data and the linked clubs
     recommendations = []
 
     for rec in sorted(assessment.recommendations, key=lambda x: x.rank):
-        # Fetch club from database using slug
-        club = club_service.get_club_by_slug(db, rec.club_id)
+        club = rec.club
 
         if club:
             # Use actual club data from database
@@ -103,9 +102,9 @@ async def get_assessment(
         else:
             # Fallback for clubs that might have been deleted
             club_data = {
-                "id": rec.club_id,
-                "name": rec.club_id.replace("-", " ").title(),
-                "slug": rec.club_id,
+                "id": str(rec.club_id),
+                "name": "Unknown Club",
+                "slug": "",
                 "tagline": "Club information unavailable",
                 "logo_url": ""
             }
@@ -1,7 +1,7 @@
 """
 Authentication endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -25,7 +25,12 @@ router = APIRouter()
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
 @limiter.limit("3/hour")  # Strict rate limit: 3 registrations per hour per IP
-async def register(request: Request, user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(
+    request: Request,
+    user_data: UserCreate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
     """
     Register a new user with BMSCE email validation
 
@@ -39,11 +44,11 @@ async def register(request: Request, user_data: UserCreate, db: Session = Depend
     """
     try:
         # Create new user
-        user = auth_service.create_user(db, user_data)
+        user = await auth_service.create_user(db, user_data)
 
-        # Send verification email (async, don't fail if email fails)
+        # Send verification email after the response, don't fail if email fails
         try:
-            auth_service.send_verification_email(db, user)
+            auth_service.send_verification_email(db, user, background_tasks)
         except Exception as email_error:
             print(f"Failed to send verification email: {email_error}")
 
@@ -81,7 +86,7 @@ async def login(request: Request, credentials: UserLogin, db: Session = Depends(
     **Rate Limit:** 10 requests per minute per IP
     """
     # Authenticate user
-    user = auth_service.authenticate_user(db, credentials)
+    user = await auth_service.authenticate_user(db, credentials)
 
     if not user:
         raise HTTPException(
@@ -143,6 +148,7 @@ async def get_current_user_profile(current_user: User = Depends(get_current_user
 async def request_password_reset(
     request: Request,
     reset_request: PasswordResetRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
@@ -154,7 +160,7 @@ async def request_password_reset(
 
     **Rate Limit:** 3 requests per hour per IP
     """
-    auth_service.request_password_reset(db, reset_request.email)
+    auth_service.request_password_reset(db, reset_request.email, background_tasks)
 
     # Always return success to not reveal whether email exists
     return {
@@ -180,7 +186,7 @@ async def confirm_password_reset(
     **Rate Limit:** 5 requests per hour per IP
     """
     try:
-        auth_service.reset_password(db, reset_confirm.token, reset_confirm.new_password)
+        await auth_service.reset_password(db, reset_confirm.token, reset_confirm.new_password)
         return {"message": "Password has been reset successfully"}
     except HTTPException:
         raise
@@ -195,6 +201,7 @@ async def confirm_password_reset(
 @limiter.limit("3/hour")  # Rate limit: 3 verification emails per hour
 async def send_verification_email(
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -211,7 +218,7 @@ async def send_verification_email(
             detail="Email is already verified",
         )
 
-    auth_service.send_verification_email(db, current_user)
+    auth_service.send_verification_email(db, current_user, background_tasks)
 
     return {"message": "Verification email has been sent"}
 
@@ -221,6 +228,7 @@ async def send_verification_email(
 async def verify_email(
     request: Request,
     verification: EmailVerificationRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
@@ -233,7 +241,7 @@ async def verify_email(
     **Rate Limit:** 5 requests per hour per IP
     """
     try:
-        auth_service.verify_email(db, verification.token)
+        auth_service.verify_email(db, verification.token, background_tasks)
         return {"message": "Email has been verified successfully"}
     except HTTPException:
         raise
@@ -1,9 +1,10 @@
 """
 Club endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from uuid import UUID
 import math
 
 from app.database import get_db
@@ -21,7 +22,7 @@ from app.schemas.club import (
     GallerySettingsUpdate,
     GallerySettingsResponse,
 )
-from app.services.club_service import club_service, membership_service, announcement_service, gallery_service
+from app.services.club_service import club_service, membership_service, announcement_service, gallery_service, encode_club_cursor
 from app.api.deps import get_current_user
 from app.models.user import User
 from app.middleware.admin import require_admin
@@ -35,6 +36,7 @@ async def get_clubs(
     search: Optional[str] = None,
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
@@ -44,9 +46,13 @@ async def get_clubs(
     - **search**: Search clubs by name, tagline, or description
     - **page**: Page number (default: 1)
     - **per_page**: Items per page (default: 50, max: 100)
+    - **cursor**: `next_cursor` from a previous response; replaces `page`,
+      and `total`/`pages` then count only the clubs from the cursor on
 
     Returns paginated list of clubs
     """
+    if cursor is not None:
+        page = 1
     skip = (page - 1) * per_page
 
     clubs, total = club_service.get_clubs(
@@ -54,17 +60,24 @@ async def get_clubs(
         category=category,
         search=search,
         skip=skip,
-        limit=per_page
+        limit=per_page,
+        cursor=cursor
     )
 
     pages = math.ceil(total / per_page) if total > 0 else 1
 
+    # Relevance order has no stable keyset, so search results page by number only
+    next_cursor = None
+    if not search and skip + len(clubs) < total:
+        next_cursor = encode_club_cursor(clubs[-1])
+
     return ClubListResponse(
         clubs=[ClubResponse.model_validate(club) for club in clubs],
         total=total,
         page=page,
         per_page=per_page,
-        pages=pages
+        pages=pages,
+        next_cursor=next_cursor
     )
 
 
@@ -80,8 +93,7 @@ async def get_featured_clubs(
 
     Returns list of featured clubs
     """
-    clubs = club_service.get_featured_clubs(db, limit=limit)
-    return [ClubResponse.model_validate(club) for club in clubs]
+    return club_service.get_featured_club_responses(db, limit=limit)
 
 
 @router.get("/popular", response_model=List[ClubResponse])
@@ -96,12 +108,15 @@ async def get_popular_clubs(
 
     Returns list of popular clubs
     """
-    clubs = club_service.get_popular_clubs(db, limit=limit)
-    return [ClubResponse.model_validate(club) for club in clubs]
+    return club_service.get_popular_club_responses(db, limit=limit)
 
 
 @router.get("/{slug}", response_model=ClubResponse)
-async def get_club(slug: str, db: Session = Depends(get_db)):
+async def get_club(
+    slug: str,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
     """
     Get club by slug
 
@@ -109,7 +124,7 @@ async def get_club(slug: str, db: Session = Depends(get_db)):
 
     Returns club details
     """
-    club = club_service.get_club_by_slug(db, slug)
+    club = club_service.get_club_response_by_slug(db, slug)
 
     if not club:
         raise HTTPException(
@@ -118,9 +133,9 @@ async def get_club(slug: str, db: Session = Depends(get_db)):
         )
 
     # Increment view count
-    club_service.increment_view_count(db, str(club.id))
+    club_service.increment_view_count(db, club["id"], background_tasks)
 
-    return ClubResponse.model_validate(club)
+    return club
 
 
 @router.post("/", response_model=ClubResponse, status_code=status.HTTP_201_CREATED)
@@ -150,7 +165,7 @@ async def create_club(
 
 @router.patch("/{club_id}", response_model=ClubResponse)
 async def update_club(
-    club_id: str,
+    club_id: UUID,
     club_data: ClubUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
@@ -177,7 +192,7 @@ async def update_club(
 
 @router.delete("/{club_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_club(
-    club_id: str,
+    club_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
@@ -203,7 +218,7 @@ async def delete_club(
 
 @router.post("/{club_id}/join", response_model=MembershipResponse)
 async def join_club(
-    club_id: str,
+    club_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -216,13 +231,13 @@ async def join_club(
 
     Returns membership details
     """
-    membership = membership_service.join_club(db, str(current_user.id), club_id)
+    membership = membership_service.join_club(db, current_user.id, club_id)
     return MembershipResponse.model_validate(membership)
 
 
 @router.delete("/{club_id}/leave", status_code=status.HTTP_204_NO_CONTENT)
 async def leave_club(
-    club_id: str,
+    club_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -235,7 +250,7 @@ async def leave_club(
 
     Returns 204 No Content on success
     """
-    success = membership_service.leave_club(db, str(current_user.id), club_id)
+    success = membership_service.leave_club(db, current_user.id, club_id)
 
     if not success:
         raise HTTPException(
@@ -248,7 +263,7 @@ async def leave_club(
 
 @router.get("/{club_id}/announcements", response_model=List[AnnouncementResponse])
 async def get_club_announcements(
-    club_id: str,
+    club_id: UUID,
     is_published: Optional[bool] = Query(True, description="Filter by publication status"),
     limit: int = Query(10, ge=1, le=50),
     db: Session = Depends(get_db)
@@ -273,7 +288,7 @@ async def get_club_announcements(
 
 @router.post("/{club_id}/announcements", response_model=AnnouncementResponse, status_code=status.HTTP_201_CREATED)
 async def create_announcement(
-    club_id: str,
+    club_id: UUID,
     title: str,
     content: str,
     is_published: bool = True,
@@ -292,9 +307,8 @@ async def create_announcement(
 
     Returns created announcement
     """
-    from uuid import UUID
     announcement_data = AnnouncementCreate(
-        club_id=UUID(club_id),
+        club_id=club_id,
         title=title,
         content=content,
         is_published=is_published
@@ -302,14 +316,14 @@ async def create_announcement(
     announcement = announcement_service.create_announcement(
         db,
         announcement_data,
-        str(current_user.id)
+        current_user.id
     )
     return AnnouncementResponse.model_validate(announcement)
 
 
 @router.patch("/announcements/{announcement_id}", response_model=AnnouncementResponse)
 async def update_announcement(
-    announcement_id: str,
+    announcement_id: UUID,
     announcement_data: AnnouncementUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
@@ -340,7 +354,7 @@ async def update_announcement(
 
 @router.delete("/announcements/{announcement_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_announcement(
-    announcement_id: str,
+    announcement_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
@@ -366,7 +380,7 @@ async def delete_announcement(
 
 @router.get("/{club_id}/gallery", response_model=GallerySettingsResponse)
 async def get_club_gallery(
-    club_id: str,
+    club_id: UUID,
     db: Session = Depends(get_db)
 ):
     """
@@ -390,7 +404,7 @@ async def get_club_gallery(
 
 @router.post("/{club_id}/gallery", response_model=GallerySettingsResponse)
 async def create_or_update_gallery_settings(
-    club_id: str,
+    club_id: UUID,
     instagram_username: Optional[str] = None,
     display_gallery: bool = True,
     max_posts: int = 4,
@@ -409,7 +423,6 @@ async def create_or_update_gallery_settings(
 
     Returns gallery settings
     """
-    from uuid import UUID
     settings_data = GallerySettingsUpdate(
         instagram_username=instagram_username,
         display_gallery=display_gallery,
@@ -425,7 +438,7 @@ async def create_or_update_gallery_settings(
 
 @router.post("/{club_id}/gallery/refresh", response_model=GallerySettingsResponse)
 async def refresh_instagram_gallery(
-    club_id: str,
+    club_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
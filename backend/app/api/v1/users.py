@@ -59,7 +59,6 @@ async def update_current_user_profile(
         setattr(current_user, field, value)
 
     db.commit()
-    db.refresh(current_user)
 
     return UserResponse.model_validate(current_user)
 
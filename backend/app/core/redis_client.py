@@ -0,0 +1,14 @@
+"""
+Shared Redis client for application caches and counters
+"""
+import redis
+
+from app.core.config import settings
+
+# Connections are opened lazily on first command, so importing this never
+# fails; a short connect timeout keeps callers' fallbacks fast when Redis is down
+redis_client = redis.Redis.from_url(
+    settings.REDIS_URL,
+    decode_responses=True,
+    socket_connect_timeout=0.5,
+)
@@ -1,26 +1,100 @@
 """
 Security utilities for authentication and authorization
 """
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional
+import calendar
+import hashlib
+import hmac
+import secrets
+import time
 
-from jose import jwt
-from passlib.context import CryptContext
+import bcrypt
+import orjson
+from jose import jws, jwt
 
 from app.core.config import settings
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt only uses the first 72 bytes of a password
+BCRYPT_MAX_PASSWORD_BYTES = 72
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(
+        plain_password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES],
+        hashed_password.encode("utf-8"),
+    )
+
+
+# Recently verified (password, hash) pairs, keyed by an HMAC under a
+# per-process secret so plaintext passwords are never retained
+VERIFIED_PASSWORD_CACHE_SIZE = 1024
+VERIFIED_PASSWORD_TTL_SECONDS = 300
+_verified_cache_secret = secrets.token_bytes(32)
+_verified_passwords: "OrderedDict[bytes, float]" = OrderedDict()
+
+
+def _verified_cache_key(plain_password: str, hashed_password: str) -> bytes:
+    return hmac.new(
+        _verified_cache_secret,
+        plain_password.encode("utf-8") + b"\0" + hashed_password.encode("utf-8"),
+        hashlib.sha256,
+    ).digest()
+
+
+def is_password_recently_verified(plain_password: str, hashed_password: str) -> bool:
+    """Check whether this (password, hash) pair verified within the TTL"""
+    key = _verified_cache_key(plain_password, hashed_password)
+    verified_at = _verified_passwords.get(key)
+    if verified_at is None or time.monotonic() - verified_at > VERIFIED_PASSWORD_TTL_SECONDS:
+        return False
+    _verified_passwords.move_to_end(key)
+    return True
+
+
+def remember_verified_password(plain_password: str, hashed_password: str) -> None:
+    """Record a successful verification, evicting the least recent entry when full"""
+    key = _verified_cache_key(plain_password, hashed_password)
+    _verified_passwords[key] = time.monotonic()
+    _verified_passwords.move_to_end(key)
+    if len(_verified_passwords) > VERIFIED_PASSWORD_CACHE_SIZE:
+        _verified_passwords.popitem(last=False)
 
 
 def get_password_hash(password: str) -> str:
     """Generate password hash"""
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES],
+        bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS),
+    ).decode("utf-8")
+
+
+def hash_token(token: str) -> bytes:
+    """
+    Keyed 16-byte digest of an emailed token (password reset, verification)
+
+    Only the digest is stored, so tokens are looked up by an indexed
+    equality match and a database leak does not expose usable tokens.
+    """
+    return hashlib.blake2b(
+        token.encode("utf-8"),
+        key=settings.TOKEN_PEPPER.encode("utf-8"),
+        digest_size=16,
+    ).digest()
+
+
+def _encode_jwt(claims: dict) -> str:
+    """
+    Sign claims as a JWT, serializing the payload with orjson
+
+    jws.sign uses an already-serialized payload as-is, so only the header
+    still goes through jose's json.dumps. Tokens decode with jwt.decode as
+    before.
+    """
+    claims["exp"] = calendar.timegm(claims["exp"].utctimetuple())
+    return jws.sign(orjson.dumps(claims), settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -35,8 +109,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         )
 
     to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+    return _encode_jwt(to_encode)
 
 
 def create_refresh_token(data: dict) -> str:
@@ -44,8 +117,7 @@ def create_refresh_token(data: dict) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+    return _encode_jwt(to_encode)
 
 
 def decode_token(token: str) -> dict:
@@ -1,12 +1,24 @@
 """
 Database connection and session management
 """
-from sqlalchemy import create_engine
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 
+# With the psycopg 3 driver (postgresql+psycopg://), statements run this many
+# times on a connection become server-side prepared plans, so Postgres stops
+# re-parsing and re-planning the hot lookups. psycopg2 has no equivalent.
+PREPARE_THRESHOLD = 5
+
+connect_args = {}
+if make_url(settings.DATABASE_URL).get_driver_name() == "psycopg":
+    connect_args["prepare_threshold"] = PREPARE_THRESHOLD
+
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
@@ -14,10 +26,38 @@ engine = create_engine(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    query_cache_size=1200,  # Compiled SQL cache entries (default 500)
+    connect_args=connect_args,
 )
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create session factory. Instances stay loaded after commit: INSERT/UPDATE
+# ... RETURNING (eager_defaults) already hands back server-generated columns,
+# so create/update paths need no db.refresh() round-trip
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+
+def warm_connection_pool(size: int) -> None:
+    """
+    Open size pooled connections in parallel and return them to the pool
+
+    All connections are held until every handshake is done, so the pool
+    ends up with size distinct connections rather than one reused.
+    """
+    def connect():
+        connection = engine.connect()
+        connection.execute(text("SELECT 1"))
+        return connection
+
+    with ThreadPoolExecutor(max_workers=size) as executor:
+        futures = [executor.submit(connect) for _ in range(size)]
+    try:
+        for future in futures:
+            future.result()  # Re-raise the first failure
+    finally:
+        for future in futures:
+            if future.exception() is None:
+                future.result().close()
+
 
 # Create base class for models
 Base = declarative_base()
@@ -2,76 +2,109 @@
 ClubCompass FastAPI Backend
 Main application entry point
 """
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from slowapi.errors import RateLimitExceeded
 
 from app.core.config import settings
 from app.core.sentry import init_sentry
+from app.database import warm_connection_pool
 from app.api.v1 import auth, clubs, users, assessment, admin, favorites, reports
+from app.middleware.etag import ETagMiddleware
 from app.middleware.rate_limit import limiter, rate_limit_exceeded_handler
 
 # Initialize Sentry for error tracking and monitoring
 init_sentry()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open DB connections before serving so early requests skip the handshake"""
+    if settings.DB_POOL_WARM_SIZE > 0:
+        try:
+            await asyncio.to_thread(warm_connection_pool, settings.DB_POOL_WARM_SIZE)
+        except Exception as e:
+            print(f"Database pool warm-up failed, connecting on first request: {e}")
+    yield
+
+
+def create_app() -> FastAPI:
+    """
+    Build the FastAPI application with its middleware and routers
+
+    Returns:
+        Configured FastAPI application
+    """
+    app = FastAPI(
+        title=settings.PROJECT_NAME,
+        description="ClubCompass - BMSCE Club Discovery Platform API",
+        version="1.0.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        openapi_url="/openapi.json",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
+    )
+
+    # Set up rate limiter state
+    app.state.limiter = limiter
+    app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+
+    # CORS Middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.ALLOWED_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+        allow_headers=["Authorization", "Content-Type"],
+    )
+
+    # ETags for conditional GETs on the public club catalogue; added before
+    # GZip so it tags the uncompressed body
+    app.add_middleware(ETagMiddleware, path_prefix=f"{settings.API_V1_PREFIX}/clubs")
+
+    # GZip Compression
+    app.add_middleware(GZipMiddleware, minimum_size=1000)
+
+    # Health check endpoint
+    @app.get("/health", tags=["Health"])
+    async def health_check():
+        """Health check endpoint"""
+        return {
+            "status": "healthy",
+            "service": "clubcompass-api",
+            "version": "1.0.0",
+        }
+
+    # Root endpoint
+    @app.get("/", tags=["Root"])
+    async def root():
+        """Root endpoint"""
+        return {
+            "message": "ClubCompass API",
+            "version": "1.0.0",
+            "docs": "/docs",
+        }
+
+    # Include API routers
+    app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
+    app.include_router(clubs.router, prefix="/api/v1/clubs", tags=["Clubs"])
+    app.include_router(users.router, prefix="/api/v1/users", tags=["Users"])
+    app.include_router(assessment.router, prefix="/api/v1/assessments", tags=["Assessment"])
+    app.include_router(favorites.router, prefix="/api/v1/favorites", tags=["Favorites"])
+    app.include_router(reports.router, prefix="/api/v1", tags=["Reports"])
+    app.include_router(admin.router, prefix="/api/v1", tags=["Admin"])
+
+    return app
+
+
 # Create FastAPI application
-app = FastAPI(
-    title=settings.PROJECT_NAME,
-    description="ClubCompass - BMSCE Club Discovery Platform API",
-    version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json",
-)
-
-# Set up rate limiter state
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
-
-# CORS Middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.ALLOWED_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
-    allow_headers=["Authorization", "Content-Type"],
-)
-
-# GZip Compression
-app.add_middleware(GZipMiddleware, minimum_size=1000)
-
-
-# Health check endpoint
-@app.get("/health", tags=["Health"])
-async def health_check():
-    """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": "clubcompass-api",
-        "version": "1.0.0",
-    }
-
-
-# Root endpoint
-@app.get("/", tags=["Root"])
-async def root():
-    """Root endpoint"""
-    return {
-        "message": "ClubCompass API",
-        "version": "1.0.0",
-        "docs": "/docs",
-    }
-
-
-# Include API routers
-app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
-app.include_router(clubs.router, prefix="/api/v1/clubs", tags=["Clubs"])
-app.include_router(users.router, prefix="/api/v1/users", tags=["Users"])
-app.include_router(assessment.router, prefix="/api/v1/assessments", tags=["Assessment"])
-app.include_router(favorites.router, prefix="/api/v1/favorites", tags=["Favorites"])
-app.include_router(reports.router, prefix="/api/v1", tags=["Reports"])
-app.include_router(admin.router, prefix="/api/v1", tags=["Admin"])
+app = create_app()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,115 @@
+"""
+ETag middleware for conditional GET requests
+"""
+import hashlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def compute_etag(body: bytes) -> str:
+    """
+    Weak ETag for a response body
+
+    Weak, because GZipMiddleware may re-encode the body after it is tagged.
+
+    Args:
+        body: Uncompressed response body
+
+    Returns:
+        Quoted weak ETag value
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    """
+    Weak comparison of an ETag against an If-None-Match header
+
+    Args:
+        etag: ETag of the current representation
+        if_none_match: Raw If-None-Match header value
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+class ETagMiddleware:
+    """
+    Tag successful JSON GET responses under path_prefix and answer matching
+    If-None-Match requests with an empty 304 Not Modified
+
+    Requests carrying an Authorization header are passed through untouched,
+    so per-user responses are never tagged or served from a shared cache.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefix: str) -> None:
+        self.app = app
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(self.path_prefix)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        if "authorization" in request_headers:
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = request_headers.get("if-none-match")
+        start_message: Message | None = None
+        body_parts: list[bytes] = []
+        passthrough = False
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (
+                    message["status"] != 200
+                    or "etag" in headers
+                    or not headers.get("content-type", "").startswith("application/json")
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_parts)
+            etag = compute_etag(body)
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers["etag"] = etag
+
+            if if_none_match and etag_matches(etag, if_none_match):
+                del headers["content-length"]
+                del headers["content-type"]
+                start_message["status"] = 304
+                body = b""
+
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_with_etag)
@@ -3,7 +3,7 @@ Database models
 """
 from app.models.user import User
 from app.models.assessment import Assessment, Recommendation
-from app.models.club import Club, Membership, ClubCategory, Announcement, GallerySettings, Favorite, ApprovalStatus
+from app.models.club import Club, Membership, ClubCategory, Announcement, GallerySettings, InstagramPost, Favorite, ApprovalStatus
 from app.models.report import UserReport, ReportType, ReportStatus
 
 __all__ = [
@@ -15,6 +15,7 @@ __all__ = [
     "ClubCategory",
     "Announcement",
     "GallerySettings",
+    "InstagramPost",
     "Favorite",
     "ApprovalStatus",
     "UserReport",
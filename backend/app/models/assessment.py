@@ -2,8 +2,7 @@
 Assessment database models
 """
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, JSON
+from sqlalchemy import Column, DateTime, Integer, ForeignKey, Index, JSON, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -25,7 +24,13 @@ class Assessment(Base):
     responses = Column(JSON, nullable=False)
 
     # Timestamp
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    # A user's history is read newest first; scanning this index backwards
+    # serves the ORDER BY and stops at the LIMIT
+    __table_args__ = (
+        Index("ix_assessments_user_created", "user_id", "created_at"),
+    )
 
     # Relationships
     user = relationship("User", back_populates="assessments")
@@ -45,7 +50,7 @@ class Recommendation(Base):
 
     # Foreign keys
     assessment_id = Column(UUID(as_uuid=True), ForeignKey("assessments.id", ondelete="CASCADE"), nullable=False)
-    club_id = Column(String(255), nullable=False)  # Reference to club slug
+    club_id = Column(UUID(as_uuid=True), ForeignKey("clubs.id", ondelete="CASCADE"), nullable=False)
 
     # Recommendation data
     score = Column(Integer, nullable=False)
@@ -54,8 +59,15 @@ class Recommendation(Base):
     # Optional reasoning (JSON)
     reasoning = Column(JSON, nullable=True)
 
-    # Relationship
+    # Recommendations are always loaded per assessment in rank order
+    __table_args__ = (
+        Index("ix_recommendations_assessment_rank", "assessment_id", "rank"),
+        UniqueConstraint("assessment_id", "club_id", name="uq_assessment_club"),
+    )
+
+    # Relationships
     assessment = relationship("Assessment", back_populates="recommendations")
+    club = relationship("Club")
 
     def __repr__(self):
         return f"<Recommendation(id={self.id}, club_id={self.club_id}, score={self.score}, rank={self.rank})>"
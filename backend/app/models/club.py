@@ -2,8 +2,7 @@
 Club database model
 """
 import uuid
-from datetime import datetime
-from sqlalchemy import Boolean, Column, String, Integer, DateTime, Text, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Boolean, Column, String, Integer, DateTime, Text, Enum as SQLEnum, ForeignKey, Index, UniqueConstraint, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
@@ -68,7 +67,7 @@ class Club(Base):
 
     # Basic information
     name = Column(String(255), unique=True, nullable=False, index=True)
-    slug = Column(String(255), unique=True, nullable=False, index=True)
+    slug = Column(String(64), unique=True, nullable=False, index=True)
     category = Column(SQLEnum(ClubCategory), nullable=False, index=True)
     subcategory = Column(String(100), nullable=True, index=True)  # Using String instead of enum for flexibility
     tagline = Column(String(500), nullable=True)
@@ -95,15 +94,33 @@ class Club(Base):
     view_count = Column(Integer, default=0, nullable=False)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Status
     is_active = Column(Boolean, default=True, nullable=False)
     is_featured = Column(Boolean, default=False, nullable=False)
-    approval_status = Column(SQLEnum(ApprovalStatus), default=ApprovalStatus.APPROVED, nullable=False, index=True)
+    approval_status = Column(SQLEnum(ApprovalStatus), default=ApprovalStatus.APPROVED, nullable=False)
     rejection_reason = Column(Text, nullable=True)  # Reason for rejection or needed revisions
 
+    # Partial indexes: each covers only the rows its listing ever reads
+    __table_args__ = (
+        # Moderation only ever scans clubs awaiting approval
+        Index("ix_clubs_pending_approval", "created_at", postgresql_where=text("approval_status = 'PENDING'")),
+        # Featured and popular listings, already in their ORDER BY order
+        Index("ix_clubs_featured", created_at.desc(), postgresql_where=text("is_featured AND is_active")),
+        Index("ix_clubs_popular", member_count.desc(), postgresql_where=text("is_active")),
+        # Default club list order; also serves its keyset cursor seeks
+        Index(
+            "ix_clubs_active_listing",
+            is_featured.desc(), created_at.desc(), id.desc(),
+            postgresql_where=text("is_active"),
+        ),
+    )
+
+    # Fetch server-side created_at/updated_at via RETURNING on flush
+    __mapper_args__ = {"eager_defaults": True}
+
     # Relationships
     memberships = relationship("Membership", back_populates="club", cascade="all, delete-orphan")
     announcements = relationship("Announcement", back_populates="club", cascade="all, delete-orphan")
@@ -122,16 +139,30 @@ class Membership(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
     # Foreign keys
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     club_id = Column(UUID(as_uuid=True), ForeignKey("clubs.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Membership details
-    role = Column(String(50), default="member", nullable=False)  # member, coordinator, admin
-    status = Column(String(50), default="active", nullable=False)  # active, inactive, pending
+    role = Column(String(16), default="member", nullable=False)  # member, coordinator, admin
+    status = Column(String(16), default="active", nullable=False)  # active, inactive, pending
 
     # Timestamps
-    joined_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    joined_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    # A user holds at most one membership per club
+    __table_args__ = (
+        UniqueConstraint("user_id", "club_id", name="uq_user_club"),
+        # A user's memberships, newest first, without visiting the heap
+        Index("ix_memberships_user_joined", "user_id", joined_at.desc(), postgresql_include=["club_id", "status"]),
+        # Active-membership counts for profile statistics
+        Index("ix_memberships_user_active", "user_id", postgresql_where=text("status = 'active'")),
+    )
+
+    # Identify memberships by (user_id, club_id) in the ORM so lookups by that
+    # pair can use Session.get() and be served from the identity map; the
+    # surrogate id stays the table's primary key
+    __mapper_args__ = {"primary_key": [user_id, club_id], "eager_defaults": True}
 
     # Relationships
     user = relationship("User", back_populates="memberships")
@@ -159,8 +190,10 @@ class Announcement(Base):
     is_published = Column(Boolean, default=True, nullable=False)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __mapper_args__ = {"eager_defaults": True}
 
     # Relationships
     club = relationship("Club", back_populates="announcements")
@@ -186,21 +219,55 @@ class GallerySettings(Base):
     display_gallery = Column(Boolean, default=True, nullable=False)
     max_posts = Column(Integer, default=4, nullable=False)  # Number of posts to display
 
-    # Cache for Instagram posts (JSON)
-    cached_posts = Column(Text, nullable=True)  # Store JSON string of posts
+    # Cached Instagram posts live in their own table (see InstagramPost)
     cache_updated_at = Column(DateTime, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __mapper_args__ = {"eager_defaults": True}
 
     # Relationships
     club = relationship("Club", back_populates="gallery_settings")
+    cached_posts = relationship(
+        "InstagramPost",
+        primaryjoin="GallerySettings.club_id == foreign(InstagramPost.club_id)",
+        order_by="InstagramPost.timestamp.desc()",
+        lazy="selectin",
+        viewonly=True,
+    )
 
     def __repr__(self):
         return f"<GallerySettings(id={self.id}, club_id={self.club_id}, instagram_username={self.instagram_username})>"
 
 
+class InstagramPost(Base):
+    """Cached Instagram post for a club gallery"""
+
+    __tablename__ = "instagram_posts"
+
+    # Primary key (Instagram media ID)
+    id = Column(String(64), primary_key=True)
+
+    # Foreign keys
+    club_id = Column(UUID(as_uuid=True), ForeignKey("clubs.id", ondelete="CASCADE"), nullable=False)
+
+    # Post data
+    media_type = Column(String(32), nullable=False)  # IMAGE, VIDEO, CAROUSEL_ALBUM
+    media_url = Column(String(1000), nullable=False)
+    caption = Column(Text, nullable=True)
+    permalink = Column(String(500), nullable=False)
+    timestamp = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_instagram_club_ts", "club_id", timestamp.desc()),
+    )
+
+    def __repr__(self):
+        return f"<InstagramPost(id={self.id}, club_id={self.club_id}, media_type={self.media_type})>"
+
+
 class Favorite(Base):
     """Favorite model for user's favorited/bookmarked clubs"""
 
@@ -214,7 +281,7 @@ class Favorite(Base):
     club_id = Column(UUID(as_uuid=True), ForeignKey("clubs.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
 
     # Relationships
     user = relationship("User", backref="favorites")
@@ -2,8 +2,7 @@
 User Report database model for handling user-submitted reports
 """
 import uuid
-from datetime import datetime
-from sqlalchemy import Boolean, Column, String, DateTime, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Boolean, Column, String, DateTime, Text, ForeignKey, Enum as SQLEnum, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
@@ -44,7 +43,7 @@ class UserReport(Base):
     report_type = Column(SQLEnum(ReportType), nullable=False, index=True)
     reason = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    status = Column(SQLEnum(ReportStatus), default=ReportStatus.PENDING, nullable=False, index=True)
+    status = Column(SQLEnum(ReportStatus), default=ReportStatus.PENDING, nullable=False)
 
     # Admin response
     reviewed_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
@@ -52,8 +51,13 @@ class UserReport(Base):
     reviewed_at = Column(DateTime, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    # Partial index: the admin queue only ever scans pending reports
+    __table_args__ = (
+        Index("ix_reports_pending", "created_at", postgresql_where=text("status = 'PENDING'")),
+    )
 
     # Relationships
     reporter = relationship("User", foreign_keys=[reporter_id], backref="reports_made")
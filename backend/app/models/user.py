@@ -2,9 +2,8 @@
 User database model
 """
 import uuid
-from datetime import datetime
-from sqlalchemy import Boolean, Column, String, DateTime, CheckConstraint
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Boolean, Column, String, DateTime, CheckConstraint, Index, LargeBinary, func
+from sqlalchemy.dialects.postgresql import CITEXT, UUID, JSONB
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -18,28 +17,28 @@ class User(Base):
     # Primary key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
-    # User credentials
-    email = Column(String(255), unique=True, nullable=False, index=True)
+    # User credentials (citext: comparisons and the unique index are case-insensitive)
+    email = Column(CITEXT, unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=False)
 
     # User profile
     full_name = Column(String(255), nullable=False)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Status flags
     email_verified = Column(Boolean, default=False, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     is_admin = Column(Boolean, default=False, nullable=False)
 
-    # Password reset tokens
-    reset_password_token = Column(String(255), nullable=True)
+    # Password reset tokens (keyed hash only; the token itself is only emailed)
+    reset_password_token_hash = Column(LargeBinary(16), nullable=True, index=True)
     reset_password_token_expires = Column(DateTime, nullable=True)
 
-    # Email verification tokens
-    email_verification_token = Column(String(255), nullable=True)
+    # Email verification tokens (keyed hash only; the token itself is only emailed)
+    email_verification_token_hash = Column(LargeBinary(16), nullable=True, index=True)
     email_verification_token_expires = Column(DateTime, nullable=True)
 
     # User preferences (stored as JSON)
@@ -48,12 +47,21 @@ class User(Base):
 
     # Constraints
     __table_args__ = (
+        # ~* is Postgres regex syntax; other dialects (the SQLite test
+        # schema) skip this constraint
         CheckConstraint(
             "email ~* '^[A-Za-z0-9._%+-]+@bmsce\\.ac\\.in$'",
             name="email_format_check"
-        ),
+        ).ddl_if(dialect="postgresql"),
+        # Stored canonically; the schemas lowercase emails on input
+        CheckConstraint("email = lower(email)", name="email_lowercase_check"),
+        # Admin user listing: filter on the flags, newest first
+        Index("ix_users_active_admin_created", "is_active", "is_admin", created_at.desc()),
     )
 
+    # Fetch server-side created_at/updated_at via RETURNING on flush
+    __mapper_args__ = {"eager_defaults": True}
+
     # Relationships
     memberships = relationship("Membership", back_populates="user", cascade="all, delete-orphan")
     assessments = relationship("Assessment", back_populates="user")
@@ -4,14 +4,14 @@ Club Pydantic schemas for request/response validation
 from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
-from pydantic import BaseModel, Field, field_validator, field_serializer
+from pydantic import BaseModel, Field, field_validator
 
 
 class ClubBase(BaseModel):
     """Base club schema"""
 
     name: str = Field(..., min_length=1, max_length=255)
-    slug: str = Field(..., min_length=1, max_length=255)
+    slug: str = Field(..., min_length=1, max_length=64)
     category: str = Field(..., pattern="^(cocurricular|extracurricular|department)$")
     subcategory: Optional[str] = Field(None, max_length=100)
     tagline: Optional[str] = Field(None, max_length=500)
@@ -85,6 +85,7 @@ class ClubListResponse(BaseModel):
     page: int
     per_page: int
     pages: int
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page; None on the last page
 
 
 class MembershipBase(BaseModel):
@@ -178,9 +179,12 @@ class InstagramPost(BaseModel):
     caption: Optional[str] = None
     media_url: str
     permalink: str
-    timestamp: str
+    timestamp: datetime
     media_type: str  # IMAGE, VIDEO, CAROUSEL_ALBUM
 
+    class Config:
+        from_attributes = True
+
 
 class GallerySettingsResponse(GallerySettingsBase):
     """Schema for gallery settings response"""
@@ -192,19 +196,6 @@ class GallerySettingsResponse(GallerySettingsBase):
     created_at: datetime
     updated_at: datetime
 
-    @field_serializer('cached_posts')
-    def serialize_cached_posts(self, cached_posts: Optional[str], _info):
-        """Deserialize JSON string to list of dicts"""
-        if cached_posts is None:
-            return None
-        if isinstance(cached_posts, str):
-            import json
-            try:
-                return json.loads(cached_posts)
-            except:
-                return None
-        return cached_posts
-
     class Config:
         from_attributes = True
 
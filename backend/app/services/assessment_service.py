@@ -1,334 +1,353 @@
 """
 Assessment service for processing quiz responses and generating club recommendations
 """
-from typing import List, Dict, Any, Optional
-from sqlalchemy.orm import Session
+from typing import List, Dict, Any, Optional, NamedTuple
+from sqlalchemy import event, insert, inspect
+from sqlalchemy.orm import Session, selectinload
 from datetime import datetime
+import functools
+import heapq
+import re
+import time
 import uuid
 
+import numpy as np
+
 from app.models.assessment import Assessment, Recommendation
 from app.models.club import Club
-from app.schemas.assessment import AssessmentCreate, AssessmentResult, ClubRecommendation, ReasoningItem
+from app.schemas.assessment import AssessmentCreate, AssessmentResult, ClubRecommendation
+
+
+# Canonical hyphenated UUID, the only form the API hands out
+_UUID_RE = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+
+
+class ScoredClub(NamedTuple):
+    """A cached club ready to be ranked and recommended"""
+
+    row: int  # Row of the club in SCORE_TABLE
+    club: Dict[str, Any]  # Finished club dict for ClubRecommendation
+
+
+# Scoring weights for different response combinations (expanded for all major clubs)
+CLUB_SCORING_RULES = {
+    # Technical/Coding clubs - Co-Curricular
+    "acm": {
+        "enjoy": {"coding": 4, "designing": 2, "organizing": 1, "public_speaking": 1, "creative": 2},
+        "domain": {"ai": 3, "robotics": 2, "web": 3, "electronics": 1, "management": 0},
+        "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 2},
+        "past": {"coding": 3, "technical": 3, "cultural": 0, "sports": 0, "none": 1},
+    },
+    "teamcodelocked": {
+        "enjoy": {"coding": 5, "designing": 2, "organizing": 1, "public_speaking": 1, "creative": 1},
+        "domain": {"ai": 2, "robotics": 1, "web": 3, "electronics": 1, "management": 0},
+        "impact": {"tech": 5, "social": 0, "cultural": 0, "entrepreneurship": 1},
+        "past": {"coding": 4, "technical": 3, "cultural": 0, "sports": 0, "none": 1},
+    },
+    "gdscl": {
+        "enjoy": {"coding": 4, "designing": 3, "organizing": 2, "public_speaking": 2, "creative": 2},
+        "domain": {"ai": 3, "robotics": 1, "web": 4, "electronics": 1, "management": 1},
+        "impact": {"tech": 4, "social": 2, "cultural": 0, "entrepreneurship": 2},
+        "past": {"coding": 3, "technical": 3, "cultural": 0, "sports": 0, "none": 2},
+    },
+
+    # AI/ML/Data Science clubs
+    "augmentai": {
+        "enjoy": {"coding": 4, "designing": 2, "organizing": 1, "public_speaking": 1, "creative": 2},
+        "domain": {"ai": 5, "robotics": 2, "web": 2, "electronics": 1, "management": 1},
+        "impact": {"tech": 5, "social": 1, "cultural": 0, "entrepreneurship": 2},
+        "past": {"coding": 3, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
+    },
+    "varaince": {
+        "enjoy": {"coding": 4, "designing": 2, "organizing": 1, "public_speaking": 1, "creative": 1},
+        "domain": {"ai": 5, "robotics": 1, "web": 2, "electronics": 1, "management": 1},
+        "impact": {"tech": 5, "social": 1, "cultural": 0, "entrepreneurship": 2},
+        "past": {"coding": 3, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
+    },
+    "dsync": {
+        "enjoy": {"coding": 4, "designing": 1, "organizing": 1, "public_speaking": 1, "creative": 1},
+        "domain": {"ai": 5, "robotics": 1, "web": 3, "electronics": 1, "management": 1},
+        "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 2},
+        "past": {"coding": 4, "technical": 3, "cultural": 0, "sports": 0, "none": 1},
+    },
+    "gradient": {
+        "enjoy": {"coding": 4, "designing": 2, "organizing": 1, "public_speaking": 1, "creative": 1},
+        "domain": {"ai": 5, "robotics": 2, "web": 2, "electronics": 1, "management": 1},
+        "impact": {"tech": 5, "social": 1, "cultural": 0, "entrepreneurship": 2},
+        "past": {"coding": 3, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
+    },
+
+    # Robotics/Hardware/Aerospace clubs
+    "robotics": {
+        "enjoy": {"coding": 3, "designing": 4, "organizing": 1, "public_speaking": 0, "creative": 3},
+        "domain": {"ai": 3, "robotics": 5, "web": 1, "electronics": 4, "management": 0},
+        "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 2},
+        "past": {"coding": 2, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
+    },
+    "aquila": {
+        "enjoy": {"coding": 2, "designing": 4, "organizing": 1, "public_speaking": 1, "creative": 3},
+        "domain": {"ai": 1, "robotics": 5, "web": 0, "electronics": 3, "management": 1},
+        "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 2},
+        "past": {"coding": 1, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
+    },
+    "aero": {
+        "enjoy": {"coding": 2, "designing": 4, "organizing": 1, "public_speaking": 1, "creative": 3},
+        "domain": {"ai": 1, "robotics": 5, "web": 0, "electronics": 3, "management": 1},
+        "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 2},
+        "past": {"coding": 1, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
+    },
+    "rocketry": {
+        "enjoy": {"coding": 2, "designing": 5, "organizing": 1, "public_speaking": 1, "creative": 3},
+        "domain": {"ai": 1, "robotics": 4, "web": 0, "electronics": 3, "management": 1},
+        "impact": {"tech": 5, "social": 0, "cultural": 0, "entrepreneurship": 2},
+        "past": {"coding": 1, "technical": 5, "cultural": 0, "sports": 0, "none": 1},
+    },
+    "upagraha": {
+        "enjoy": {"coding": 3, "designing": 4, "organizing": 1, "public_speaking": 1, "creative": 2},
+        "domain": {"ai": 2, "robotics": 5, "web": 1, "electronics": 4, "management": 1},
+        "impact": {"tech": 5, "social": 1, "cultural": 0, "entrepreneurship": 2},
+        "past": {"coding": 2, "technical": 5, "cultural": 0, "sports": 0, "none": 1},
+    },
+    "bullz": {
+        "enjoy": {"coding": 1, "designing": 5, "organizing": 2, "public_speaking": 1, "creative": 3},
+        "domain": {"ai": 0, "robotics": 4, "web": 0, "electronics": 3, "management": 2},
+        "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 3},
+        "past": {"coding": 1, "technical": 5, "cultural": 0, "sports": 2, "none": 1},
+    },
+
+    # IEEE clubs
+    "ieee-sb": {
+        "enjoy": {"coding": 3, "designing": 2, "organizing": 1, "public_speaking": 1, "creative": 1},
+        "domain": {"ai": 2, "robotics": 3, "web": 2, "electronics": 4, "management": 0},
+        "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 2},
+        "past": {"coding": 2, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
+    },
+    "ieee-cs": {
+        "enjoy": {"coding": 4, "designing": 2, "organizing": 1, "public_speaking": 1, "creative": 1},
+        "domain": {"ai": 3, "robotics": 2, "web": 4, "electronics": 2, "management": 0},
+        "impact": {"tech": 5, "social": 1, "cultural": 0, "entrepreneurship": 1},
+        "past": {"coding": 4, "technical": 3, "cultural": 0, "sports": 0, "none": 1},
+    },
+    "ieee-wie": {
+        "enjoy": {"coding": 3, "designing": 2, "organizing": 2, "public_speaking": 2, "creative": 1},
+        "domain": {"ai": 2, "robotics": 2, "web": 2, "electronics": 3, "management": 2},
+        "impact": {"tech": 3, "social": 3, "cultural": 1, "entrepreneurship": 2},
+        "past": {"coding": 2, "technical": 3, "cultural": 1, "sports": 0, "none": 2},
+    },
+    "ieee-pes": {
+        "enjoy": {"coding": 2, "designing": 3, "organizing": 1, "public_speaking": 1, "creative": 1},
+        "domain": {"ai": 1, "robotics": 2, "web": 1, "electronics": 5, "management": 1},
+        "impact": {"tech": 4, "social": 2, "cultural": 0, "entrepreneurship": 1},
+        "past": {"coding": 1, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
+    },
+    "ieee-sps": {
+        "enjoy": {"coding": 3, "designing": 2, "organizing": 1, "public_speaking": 1, "creative": 1},
+        "domain": {"ai": 3, "robotics": 1, "web": 1, "electronics": 4, "management": 0},
+        "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 1},
+        "past": {"coding": 2, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
+    },
+
+    # Electronics & Engineering clubs
+    "elsoc": {
+        "enjoy": {"coding": 2, "designing": 4, "organizing": 1, "public_speaking": 1, "creative": 2},
+        "domain": {"ai": 2, "robotics": 3, "web": 1, "electronics": 5, "management": 0},
+        "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 1},
+        "past": {"coding": 2, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
+    },
+    "eeea": {
+        "enjoy": {"coding": 2, "designing": 3, "organizing": 1, "public_speaking": 1, "creative": 1},
+        "domain": {"ai": 1, "robotics": 2, "web": 1, "electronics": 5, "management": 1},
+        "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 1},
+        "past": {"coding": 1, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
+    },
+    "mea": {
+        "enjoy": {"coding": 1, "designing": 4, "organizing": 1, "public_speaking": 1, "creative": 2},
+        "domain": {"ai": 1, "robotics": 3, "web": 0, "electronics": 3, "management": 2},
+        "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 2},
+        "past": {"coding": 1, "technical": 5, "cultural": 0, "sports": 0, "none": 1},
+    },
+
+    # Department clubs - CS/IS
+    "codeio": {
+        "enjoy": {"coding": 5, "designing": 3, "organizing": 1, "public_speaking": 1, "creative": 2},
+        "domain": {"ai": 3, "robotics": 1, "web": 4, "electronics": 1, "management": 1},
+        "impact": {"tech": 5, "social": 1, "cultural": 0, "entrepreneurship": 2},
+        "past": {"coding": 4, "technical": 3, "cultural": 0, "sports": 0, "none": 1},
+    },
+    "protocol": {
+        "enjoy": {"coding": 4, "designing": 2, "organizing": 2, "public_speaking": 2, "creative": 2},
+        "domain": {"ai": 2, "robotics": 1, "web": 3, "electronics": 1, "management": 1},
+        "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 2},
+        "past": {"coding": 3, "technical": 3, "cultural": 0, "sports": 0, "none": 2},
+    },
+    "iseclub": {
+        "enjoy": {"coding": 4, "designing": 2, "organizing": 2, "public_speaking": 2, "creative": 2},
+        "domain": {"ai": 3, "robotics": 1, "web": 3, "electronics": 1, "management": 1},
+        "impact": {"tech": 4, "social": 2, "cultural": 1, "entrepreneurship": 2},
+        "past": {"coding": 3, "technical": 3, "cultural": 1, "sports": 0, "none": 2},
+    },
+
+    # Entrepreneurship clubs
+    "edc": {
+        "enjoy": {"coding": 1, "designing": 2, "organizing": 4, "public_speaking": 4, "creative": 3},
+        "domain": {"ai": 1, "robotics": 0, "web": 2, "electronics": 0, "management": 5},
+        "impact": {"tech": 2, "social": 2, "cultural": 1, "entrepreneurship": 5},
+        "past": {"coding": 1, "technical": 1, "cultural": 1, "sports": 1, "none": 2},
+    },
+    "ciie": {
+        "enjoy": {"coding": 1, "designing": 2, "organizing": 4, "public_speaking": 4, "creative": 2},
+        "domain": {"ai": 2, "robotics": 0, "web": 2, "electronics": 0, "management": 5},
+        "impact": {"tech": 2, "social": 2, "cultural": 0, "entrepreneurship": 5},
+        "past": {"coding": 1, "technical": 1, "cultural": 0, "sports": 0, "none": 2},
+    },
+    "iic": {
+        "enjoy": {"coding": 1, "designing": 2, "organizing": 4, "public_speaking": 3, "creative": 2},
+        "domain": {"ai": 2, "robotics": 0, "web": 2, "electronics": 0, "management": 5},
+        "impact": {"tech": 2, "social": 2, "cultural": 0, "entrepreneurship": 5},
+        "past": {"coding": 1, "technical": 1, "cultural": 0, "sports": 0, "none": 2},
+    },
+    "business-insights": {
+        "enjoy": {"coding": 1, "designing": 1, "organizing": 4, "public_speaking": 4, "creative": 2},
+        "domain": {"ai": 1, "robotics": 0, "web": 1, "electronics": 0, "management": 5},
+        "impact": {"tech": 1, "social": 2, "cultural": 0, "entrepreneurship": 5},
+        "past": {"coding": 0, "technical": 1, "cultural": 1, "sports": 0, "none": 2},
+    },
+
+    # MedTech & Biotech
+    "corrtechs": {
+        "enjoy": {"coding": 2, "designing": 3, "organizing": 2, "public_speaking": 2, "creative": 2},
+        "domain": {"ai": 3, "robotics": 2, "web": 2, "electronics": 3, "management": 2},
+        "impact": {"tech": 4, "social": 4, "cultural": 0, "entrepreneurship": 3},
+        "past": {"coding": 2, "technical": 3, "cultural": 0, "sports": 0, "none": 2},
+    },
+    "synapse": {
+        "enjoy": {"coding": 1, "designing": 2, "organizing": 2, "public_speaking": 2, "creative": 2},
+        "domain": {"ai": 2, "robotics": 1, "web": 1, "electronics": 2, "management": 2},
+        "impact": {"tech": 3, "social": 3, "cultural": 1, "entrepreneurship": 2},
+        "past": {"coding": 1, "technical": 3, "cultural": 1, "sports": 0, "none": 2},
+    },
+
+    # Mathematics
+    "pentagram": {
+        "enjoy": {"coding": 3, "designing": 1, "organizing": 2, "public_speaking": 2, "creative": 2},
+        "domain": {"ai": 3, "robotics": 1, "web": 2, "electronics": 1, "management": 1},
+        "impact": {"tech": 3, "social": 1, "cultural": 1, "entrepreneurship": 1},
+        "past": {"coding": 3, "technical": 2, "cultural": 0, "sports": 0, "none": 2},
+    },
+
+    # Social/Service clubs
+    "nss": {
+        "enjoy": {"coding": 0, "designing": 1, "organizing": 4, "public_speaking": 3, "creative": 2},
+        "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 3},
+        "impact": {"tech": 0, "social": 5, "cultural": 2, "entrepreneurship": 1},
+        "past": {"coding": 0, "technical": 0, "cultural": 2, "sports": 1, "none": 3},
+    },
+    "rotaract": {
+        "enjoy": {"coding": 0, "designing": 1, "organizing": 5, "public_speaking": 4, "creative": 2},
+        "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 4},
+        "impact": {"tech": 0, "social": 5, "cultural": 2, "entrepreneurship": 2},
+        "past": {"coding": 0, "technical": 0, "cultural": 2, "sports": 1, "none": 3},
+    },
+    "leosatva": {
+        "enjoy": {"coding": 0, "designing": 1, "organizing": 4, "public_speaking": 4, "creative": 2},
+        "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 3},
+        "impact": {"tech": 0, "social": 5, "cultural": 1, "entrepreneurship": 2},
+        "past": {"coding": 0, "technical": 0, "cultural": 1, "sports": 1, "none": 3},
+    },
+    "mountaineering": {
+        "enjoy": {"coding": 0, "designing": 1, "organizing": 2, "public_speaking": 1, "creative": 3},
+        "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 1},
+        "impact": {"tech": 0, "social": 3, "cultural": 2, "entrepreneurship": 1},
+        "past": {"coding": 0, "technical": 0, "cultural": 1, "sports": 5, "none": 2},
+    },
+    "respawn": {
+        "enjoy": {"coding": 1, "designing": 2, "organizing": 3, "public_speaking": 1, "creative": 3},
+        "domain": {"ai": 1, "robotics": 0, "web": 1, "electronics": 0, "management": 2},
+        "impact": {"tech": 2, "social": 3, "cultural": 3, "entrepreneurship": 1},
+        "past": {"coding": 1, "technical": 1, "cultural": 2, "sports": 3, "none": 2},
+    },
+
+    # Cultural clubs - Music & Dance
+    "ninaad": {
+        "enjoy": {"coding": 0, "designing": 1, "organizing": 1, "public_speaking": 3, "creative": 5},
+        "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 1},
+        "impact": {"tech": 0, "social": 2, "cultural": 5, "entrepreneurship": 0},
+        "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 0, "none": 2},
+    },
+    "groovehouse": {
+        "enjoy": {"coding": 0, "designing": 2, "organizing": 2, "public_speaking": 3, "creative": 5},
+        "domain": {"ai": 0, "robotics": 0, "web": 1, "electronics": 1, "management": 1},
+        "impact": {"tech": 0, "social": 2, "cultural": 5, "entrepreneurship": 1},
+        "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 0, "none": 2},
+    },
+    "paramvah": {
+        "enjoy": {"coding": 0, "designing": 2, "organizing": 1, "public_speaking": 2, "creative": 5},
+        "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 1},
+        "impact": {"tech": 0, "social": 2, "cultural": 5, "entrepreneurship": 0},
+        "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 1, "none": 2},
+    },
+    "danzaddix": {
+        "enjoy": {"coding": 0, "designing": 2, "organizing": 1, "public_speaking": 2, "creative": 5},
+        "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 1},
+        "impact": {"tech": 0, "social": 2, "cultural": 5, "entrepreneurship": 0},
+        "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 1, "none": 2},
+    },
+
+    # Cultural clubs - Arts & Literature
+    "inksanity": {
+        "enjoy": {"coding": 0, "designing": 1, "organizing": 2, "public_speaking": 5, "creative": 4},
+        "domain": {"ai": 0, "robotics": 0, "web": 1, "electronics": 0, "management": 2},
+        "impact": {"tech": 0, "social": 3, "cultural": 5, "entrepreneurship": 1},
+        "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 0, "none": 2},
+    },
+    "finearts": {
+        "enjoy": {"coding": 0, "designing": 3, "organizing": 1, "public_speaking": 1, "creative": 5},
+        "domain": {"ai": 0, "robotics": 0, "web": 1, "electronics": 0, "management": 0},
+        "impact": {"tech": 0, "social": 2, "cultural": 5, "entrepreneurship": 0},
+        "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 0, "none": 2},
+    },
+    "falcons": {
+        "enjoy": {"coding": 1, "designing": 4, "organizing": 2, "public_speaking": 1, "creative": 5},
+        "domain": {"ai": 1, "robotics": 1, "web": 2, "electronics": 1, "management": 1},
+        "impact": {"tech": 2, "social": 2, "cultural": 5, "entrepreneurship": 1},
+        "past": {"coding": 0, "technical": 1, "cultural": 4, "sports": 1, "none": 2},
+    },
+    "pravrutthi": {
+        "enjoy": {"coding": 0, "designing": 2, "organizing": 2, "public_speaking": 5, "creative": 5},
+        "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 1},
+        "impact": {"tech": 0, "social": 3, "cultural": 5, "entrepreneurship": 0},
+        "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 0, "none": 2},
+    },
+    "panache": {
+        "enjoy": {"coding": 0, "designing": 4, "organizing": 3, "public_speaking": 2, "creative": 5},
+        "domain": {"ai": 0, "robotics": 0, "web": 1, "electronics": 0, "management": 2},
+        "impact": {"tech": 0, "social": 2, "cultural": 5, "entrepreneurship": 2},
+        "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 0, "none": 2},
+    },
+    "chiranthana": {
+        "enjoy": {"coding": 0, "designing": 1, "organizing": 2, "public_speaking": 3, "creative": 4},
+        "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 1},
+        "impact": {"tech": 0, "social": 2, "cultural": 5, "entrepreneurship": 0},
+        "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 0, "none": 2},
+    },
+    "samskruthi": {
+        "enjoy": {"coding": 0, "designing": 2, "organizing": 2, "public_speaking": 3, "creative": 5},
+        "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 1},
+        "impact": {"tech": 0, "social": 2, "cultural": 5, "entrepreneurship": 0},
+        "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 0, "none": 2},
+    },
+    "munsoc": {
+        "enjoy": {"coding": 0, "designing": 1, "organizing": 4, "public_speaking": 5, "creative": 2},
+        "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 4},
+        "impact": {"tech": 0, "social": 4, "cultural": 3, "entrepreneurship": 2},
+        "past": {"coding": 0, "technical": 0, "cultural": 3, "sports": 0, "none": 2},
+    },
+}
 
 
 class AssessmentService:
     """Service for handling assessment operations and recommendations"""
 
-    # Scoring weights for different response combinations (expanded for all major clubs)
-    CLUB_SCORING_RULES = {
-        # Technical/Coding clubs - Co-Curricular
-        "acm": {
-            "enjoy": {"coding": 4, "designing": 2, "organizing": 1, "public_speaking": 1, "creative": 2},
-            "domain": {"ai": 3, "robotics": 2, "web": 3, "electronics": 1, "management": 0},
-            "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 2},
-            "past": {"coding": 3, "technical": 3, "cultural": 0, "sports": 0, "none": 1},
-        },
-        "teamcodelocked": {
-            "enjoy": {"coding": 5, "designing": 2, "organizing": 1, "public_speaking": 1, "creative": 1},
-            "domain": {"ai": 2, "robotics": 1, "web": 3, "electronics": 1, "management": 0},
-            "impact": {"tech": 5, "social": 0, "cultural": 0, "entrepreneurship": 1},
-            "past": {"coding": 4, "technical": 3, "cultural": 0, "sports": 0, "none": 1},
-        },
-        "gdscl": {
-            "enjoy": {"coding": 4, "designing": 3, "organizing": 2, "public_speaking": 2, "creative": 2},
-            "domain": {"ai": 3, "robotics": 1, "web": 4, "electronics": 1, "management": 1},
-            "impact": {"tech": 4, "social": 2, "cultural": 0, "entrepreneurship": 2},
-            "past": {"coding": 3, "technical": 3, "cultural": 0, "sports": 0, "none": 2},
-        },
-
-        # AI/ML/Data Science clubs
-        "augmentai": {
-            "enjoy": {"coding": 4, "designing": 2, "organizing": 1, "public_speaking": 1, "creative": 2},
-            "domain": {"ai": 5, "robotics": 2, "web": 2, "electronics": 1, "management": 1},
-            "impact": {"tech": 5, "social": 1, "cultural": 0, "entrepreneurship": 2},
-            "past": {"coding": 3, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
-        },
-        "varaince": {
-            "enjoy": {"coding": 4, "designing": 2, "organizing": 1, "public_speaking": 1, "creative": 1},
-            "domain": {"ai": 5, "robotics": 1, "web": 2, "electronics": 1, "management": 1},
-            "impact": {"tech": 5, "social": 1, "cultural": 0, "entrepreneurship": 2},
-            "past": {"coding": 3, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
-        },
-        "dsync": {
-            "enjoy": {"coding": 4, "designing": 1, "organizing": 1, "public_speaking": 1, "creative": 1},
-            "domain": {"ai": 5, "robotics": 1, "web": 3, "electronics": 1, "management": 1},
-            "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 2},
-            "past": {"coding": 4, "technical": 3, "cultural": 0, "sports": 0, "none": 1},
-        },
-        "gradient": {
-            "enjoy": {"coding": 4, "designing": 2, "organizing": 1, "public_speaking": 1, "creative": 1},
-            "domain": {"ai": 5, "robotics": 2, "web": 2, "electronics": 1, "management": 1},
-            "impact": {"tech": 5, "social": 1, "cultural": 0, "entrepreneurship": 2},
-            "past": {"coding": 3, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
-        },
-
-        # Robotics/Hardware/Aerospace clubs
-        "robotics": {
-            "enjoy": {"coding": 3, "designing": 4, "organizing": 1, "public_speaking": 0, "creative": 3},
-            "domain": {"ai": 3, "robotics": 5, "web": 1, "electronics": 4, "management": 0},
-            "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 2},
-            "past": {"coding": 2, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
-        },
-        "aquila": {
-            "enjoy": {"coding": 2, "designing": 4, "organizing": 1, "public_speaking": 1, "creative": 3},
-            "domain": {"ai": 1, "robotics": 5, "web": 0, "electronics": 3, "management": 1},
-            "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 2},
-            "past": {"coding": 1, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
-        },
-        "aero": {
-            "enjoy": {"coding": 2, "designing": 4, "organizing": 1, "public_speaking": 1, "creative": 3},
-            "domain": {"ai": 1, "robotics": 5, "web": 0, "electronics": 3, "management": 1},
-            "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 2},
-            "past": {"coding": 1, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
-        },
-        "rocketry": {
-            "enjoy": {"coding": 2, "designing": 5, "organizing": 1, "public_speaking": 1, "creative": 3},
-            "domain": {"ai": 1, "robotics": 4, "web": 0, "electronics": 3, "management": 1},
-            "impact": {"tech": 5, "social": 0, "cultural": 0, "entrepreneurship": 2},
-            "past": {"coding": 1, "technical": 5, "cultural": 0, "sports": 0, "none": 1},
-        },
-        "upagraha": {
-            "enjoy": {"coding": 3, "designing": 4, "organizing": 1, "public_speaking": 1, "creative": 2},
-            "domain": {"ai": 2, "robotics": 5, "web": 1, "electronics": 4, "management": 1},
-            "impact": {"tech": 5, "social": 1, "cultural": 0, "entrepreneurship": 2},
-            "past": {"coding": 2, "technical": 5, "cultural": 0, "sports": 0, "none": 1},
-        },
-        "bullz": {
-            "enjoy": {"coding": 1, "designing": 5, "organizing": 2, "public_speaking": 1, "creative": 3},
-            "domain": {"ai": 0, "robotics": 4, "web": 0, "electronics": 3, "management": 2},
-            "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 3},
-            "past": {"coding": 1, "technical": 5, "cultural": 0, "sports": 2, "none": 1},
-        },
-
-        # IEEE clubs
-        "ieee-sb": {
-            "enjoy": {"coding": 3, "designing": 2, "organizing": 1, "public_speaking": 1, "creative": 1},
-            "domain": {"ai": 2, "robotics": 3, "web": 2, "electronics": 4, "management": 0},
-            "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 2},
-            "past": {"coding": 2, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
-        },
-        "ieee-cs": {
-            "enjoy": {"coding": 4, "designing": 2, "organizing": 1, "public_speaking": 1, "creative": 1},
-            "domain": {"ai": 3, "robotics": 2, "web": 4, "electronics": 2, "management": 0},
-            "impact": {"tech": 5, "social": 1, "cultural": 0, "entrepreneurship": 1},
-            "past": {"coding": 4, "technical": 3, "cultural": 0, "sports": 0, "none": 1},
-        },
-        "ieee-wie": {
-            "enjoy": {"coding": 3, "designing": 2, "organizing": 2, "public_speaking": 2, "creative": 1},
-            "domain": {"ai": 2, "robotics": 2, "web": 2, "electronics": 3, "management": 2},
-            "impact": {"tech": 3, "social": 3, "cultural": 1, "entrepreneurship": 2},
-            "past": {"coding": 2, "technical": 3, "cultural": 1, "sports": 0, "none": 2},
-        },
-        "ieee-pes": {
-            "enjoy": {"coding": 2, "designing": 3, "organizing": 1, "public_speaking": 1, "creative": 1},
-            "domain": {"ai": 1, "robotics": 2, "web": 1, "electronics": 5, "management": 1},
-            "impact": {"tech": 4, "social": 2, "cultural": 0, "entrepreneurship": 1},
-            "past": {"coding": 1, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
-        },
-        "ieee-sps": {
-            "enjoy": {"coding": 3, "designing": 2, "organizing": 1, "public_speaking": 1, "creative": 1},
-            "domain": {"ai": 3, "robotics": 1, "web": 1, "electronics": 4, "management": 0},
-            "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 1},
-            "past": {"coding": 2, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
-        },
-
-        # Electronics & Engineering clubs
-        "elsoc": {
-            "enjoy": {"coding": 2, "designing": 4, "organizing": 1, "public_speaking": 1, "creative": 2},
-            "domain": {"ai": 2, "robotics": 3, "web": 1, "electronics": 5, "management": 0},
-            "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 1},
-            "past": {"coding": 2, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
-        },
-        "eeea": {
-            "enjoy": {"coding": 2, "designing": 3, "organizing": 1, "public_speaking": 1, "creative": 1},
-            "domain": {"ai": 1, "robotics": 2, "web": 1, "electronics": 5, "management": 1},
-            "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 1},
-            "past": {"coding": 1, "technical": 4, "cultural": 0, "sports": 0, "none": 1},
-        },
-        "mea": {
-            "enjoy": {"coding": 1, "designing": 4, "organizing": 1, "public_speaking": 1, "creative": 2},
-            "domain": {"ai": 1, "robotics": 3, "web": 0, "electronics": 3, "management": 2},
-            "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 2},
-            "past": {"coding": 1, "technical": 5, "cultural": 0, "sports": 0, "none": 1},
-        },
-
-        # Department clubs - CS/IS
-        "codeio": {
-            "enjoy": {"coding": 5, "designing": 3, "organizing": 1, "public_speaking": 1, "creative": 2},
-            "domain": {"ai": 3, "robotics": 1, "web": 4, "electronics": 1, "management": 1},
-            "impact": {"tech": 5, "social": 1, "cultural": 0, "entrepreneurship": 2},
-            "past": {"coding": 4, "technical": 3, "cultural": 0, "sports": 0, "none": 1},
-        },
-        "protocol": {
-            "enjoy": {"coding": 4, "designing": 2, "organizing": 2, "public_speaking": 2, "creative": 2},
-            "domain": {"ai": 2, "robotics": 1, "web": 3, "electronics": 1, "management": 1},
-            "impact": {"tech": 4, "social": 1, "cultural": 0, "entrepreneurship": 2},
-            "past": {"coding": 3, "technical": 3, "cultural": 0, "sports": 0, "none": 2},
-        },
-        "iseclub": {
-            "enjoy": {"coding": 4, "designing": 2, "organizing": 2, "public_speaking": 2, "creative": 2},
-            "domain": {"ai": 3, "robotics": 1, "web": 3, "electronics": 1, "management": 1},
-            "impact": {"tech": 4, "social": 2, "cultural": 1, "entrepreneurship": 2},
-            "past": {"coding": 3, "technical": 3, "cultural": 1, "sports": 0, "none": 2},
-        },
-
-        # Entrepreneurship clubs
-        "edc": {
-            "enjoy": {"coding": 1, "designing": 2, "organizing": 4, "public_speaking": 4, "creative": 3},
-            "domain": {"ai": 1, "robotics": 0, "web": 2, "electronics": 0, "management": 5},
-            "impact": {"tech": 2, "social": 2, "cultural": 1, "entrepreneurship": 5},
-            "past": {"coding": 1, "technical": 1, "cultural": 1, "sports": 1, "none": 2},
-        },
-        "ciie": {
-            "enjoy": {"coding": 1, "designing": 2, "organizing": 4, "public_speaking": 4, "creative": 2},
-            "domain": {"ai": 2, "robotics": 0, "web": 2, "electronics": 0, "management": 5},
-            "impact": {"tech": 2, "social": 2, "cultural": 0, "entrepreneurship": 5},
-            "past": {"coding": 1, "technical": 1, "cultural": 0, "sports": 0, "none": 2},
-        },
-        "iic": {
-            "enjoy": {"coding": 1, "designing": 2, "organizing": 4, "public_speaking": 3, "creative": 2},
-            "domain": {"ai": 2, "robotics": 0, "web": 2, "electronics": 0, "management": 5},
-            "impact": {"tech": 2, "social": 2, "cultural": 0, "entrepreneurship": 5},
-            "past": {"coding": 1, "technical": 1, "cultural": 0, "sports": 0, "none": 2},
-        },
-        "business-insights": {
-            "enjoy": {"coding": 1, "designing": 1, "organizing": 4, "public_speaking": 4, "creative": 2},
-            "domain": {"ai": 1, "robotics": 0, "web": 1, "electronics": 0, "management": 5},
-            "impact": {"tech": 1, "social": 2, "cultural": 0, "entrepreneurship": 5},
-            "past": {"coding": 0, "technical": 1, "cultural": 1, "sports": 0, "none": 2},
-        },
-
-        # MedTech & Biotech
-        "corrtechs": {
-            "enjoy": {"coding": 2, "designing": 3, "organizing": 2, "public_speaking": 2, "creative": 2},
-            "domain": {"ai": 3, "robotics": 2, "web": 2, "electronics": 3, "management": 2},
-            "impact": {"tech": 4, "social": 4, "cultural": 0, "entrepreneurship": 3},
-            "past": {"coding": 2, "technical": 3, "cultural": 0, "sports": 0, "none": 2},
-        },
-        "synapse": {
-            "enjoy": {"coding": 1, "designing": 2, "organizing": 2, "public_speaking": 2, "creative": 2},
-            "domain": {"ai": 2, "robotics": 1, "web": 1, "electronics": 2, "management": 2},
-            "impact": {"tech": 3, "social": 3, "cultural": 1, "entrepreneurship": 2},
-            "past": {"coding": 1, "technical": 3, "cultural": 1, "sports": 0, "none": 2},
-        },
-
-        # Mathematics
-        "pentagram": {
-            "enjoy": {"coding": 3, "designing": 1, "organizing": 2, "public_speaking": 2, "creative": 2},
-            "domain": {"ai": 3, "robotics": 1, "web": 2, "electronics": 1, "management": 1},
-            "impact": {"tech": 3, "social": 1, "cultural": 1, "entrepreneurship": 1},
-            "past": {"coding": 3, "technical": 2, "cultural": 0, "sports": 0, "none": 2},
-        },
-
-        # Social/Service clubs
-        "nss": {
-            "enjoy": {"coding": 0, "designing": 1, "organizing": 4, "public_speaking": 3, "creative": 2},
-            "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 3},
-            "impact": {"tech": 0, "social": 5, "cultural": 2, "entrepreneurship": 1},
-            "past": {"coding": 0, "technical": 0, "cultural": 2, "sports": 1, "none": 3},
-        },
-        "rotaract": {
-            "enjoy": {"coding": 0, "designing": 1, "organizing": 5, "public_speaking": 4, "creative": 2},
-            "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 4},
-            "impact": {"tech": 0, "social": 5, "cultural": 2, "entrepreneurship": 2},
-            "past": {"coding": 0, "technical": 0, "cultural": 2, "sports": 1, "none": 3},
-        },
-        "leosatva": {
-            "enjoy": {"coding": 0, "designing": 1, "organizing": 4, "public_speaking": 4, "creative": 2},
-            "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 3},
-            "impact": {"tech": 0, "social": 5, "cultural": 1, "entrepreneurship": 2},
-            "past": {"coding": 0, "technical": 0, "cultural": 1, "sports": 1, "none": 3},
-        },
-        "mountaineering": {
-            "enjoy": {"coding": 0, "designing": 1, "organizing": 2, "public_speaking": 1, "creative": 3},
-            "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 1},
-            "impact": {"tech": 0, "social": 3, "cultural": 2, "entrepreneurship": 1},
-            "past": {"coding": 0, "technical": 0, "cultural": 1, "sports": 5, "none": 2},
-        },
-        "respawn": {
-            "enjoy": {"coding": 1, "designing": 2, "organizing": 3, "public_speaking": 1, "creative": 3},
-            "domain": {"ai": 1, "robotics": 0, "web": 1, "electronics": 0, "management": 2},
-            "impact": {"tech": 2, "social": 3, "cultural": 3, "entrepreneurship": 1},
-            "past": {"coding": 1, "technical": 1, "cultural": 2, "sports": 3, "none": 2},
-        },
-
-        # Cultural clubs - Music & Dance
-        "ninaad": {
-            "enjoy": {"coding": 0, "designing": 1, "organizing": 1, "public_speaking": 3, "creative": 5},
-            "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 1},
-            "impact": {"tech": 0, "social": 2, "cultural": 5, "entrepreneurship": 0},
-            "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 0, "none": 2},
-        },
-        "groovehouse": {
-            "enjoy": {"coding": 0, "designing": 2, "organizing": 2, "public_speaking": 3, "creative": 5},
-            "domain": {"ai": 0, "robotics": 0, "web": 1, "electronics": 1, "management": 1},
-            "impact": {"tech": 0, "social": 2, "cultural": 5, "entrepreneurship": 1},
-            "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 0, "none": 2},
-        },
-        "paramvah": {
-            "enjoy": {"coding": 0, "designing": 2, "organizing": 1, "public_speaking": 2, "creative": 5},
-            "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 1},
-            "impact": {"tech": 0, "social": 2, "cultural": 5, "entrepreneurship": 0},
-            "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 1, "none": 2},
-        },
-        "danzaddix": {
-            "enjoy": {"coding": 0, "designing": 2, "organizing": 1, "public_speaking": 2, "creative": 5},
-            "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 1},
-            "impact": {"tech": 0, "social": 2, "cultural": 5, "entrepreneurship": 0},
-            "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 1, "none": 2},
-        },
-
-        # Cultural clubs - Arts & Literature
-        "inksanity": {
-            "enjoy": {"coding": 0, "designing": 1, "organizing": 2, "public_speaking": 5, "creative": 4},
-            "domain": {"ai": 0, "robotics": 0, "web": 1, "electronics": 0, "management": 2},
-            "impact": {"tech": 0, "social": 3, "cultural": 5, "entrepreneurship": 1},
-            "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 0, "none": 2},
-        },
-        "finearts": {
-            "enjoy": {"coding": 0, "designing": 3, "organizing": 1, "public_speaking": 1, "creative": 5},
-            "domain": {"ai": 0, "robotics": 0, "web": 1, "electronics": 0, "management": 0},
-            "impact": {"tech": 0, "social": 2, "cultural": 5, "entrepreneurship": 0},
-            "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 0, "none": 2},
-        },
-        "falcons": {
-            "enjoy": {"coding": 1, "designing": 4, "organizing": 2, "public_speaking": 1, "creative": 5},
-            "domain": {"ai": 1, "robotics": 1, "web": 2, "electronics": 1, "management": 1},
-            "impact": {"tech": 2, "social": 2, "cultural": 5, "entrepreneurship": 1},
-            "past": {"coding": 0, "technical": 1, "cultural": 4, "sports": 1, "none": 2},
-        },
-        "pravrutthi": {
-            "enjoy": {"coding": 0, "designing": 2, "organizing": 2, "public_speaking": 5, "creative": 5},
-            "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 1},
-            "impact": {"tech": 0, "social": 3, "cultural": 5, "entrepreneurship": 0},
-            "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 0, "none": 2},
-        },
-        "panache": {
-            "enjoy": {"coding": 0, "designing": 4, "organizing": 3, "public_speaking": 2, "creative": 5},
-            "domain": {"ai": 0, "robotics": 0, "web": 1, "electronics": 0, "management": 2},
-            "impact": {"tech": 0, "social": 2, "cultural": 5, "entrepreneurship": 2},
-            "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 0, "none": 2},
-        },
-        "chiranthana": {
-            "enjoy": {"coding": 0, "designing": 1, "organizing": 2, "public_speaking": 3, "creative": 4},
-            "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 1},
-            "impact": {"tech": 0, "social": 2, "cultural": 5, "entrepreneurship": 0},
-            "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 0, "none": 2},
-        },
-        "samskruthi": {
-            "enjoy": {"coding": 0, "designing": 2, "organizing": 2, "public_speaking": 3, "creative": 5},
-            "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 1},
-            "impact": {"tech": 0, "social": 2, "cultural": 5, "entrepreneurship": 0},
-            "past": {"coding": 0, "technical": 0, "cultural": 5, "sports": 0, "none": 2},
-        },
-        "munsoc": {
-            "enjoy": {"coding": 0, "designing": 1, "organizing": 4, "public_speaking": 5, "creative": 2},
-            "domain": {"ai": 0, "robotics": 0, "web": 0, "electronics": 0, "management": 4},
-            "impact": {"tech": 0, "social": 4, "cultural": 3, "entrepreneurship": 2},
-            "past": {"coding": 0, "technical": 0, "cultural": 3, "sports": 0, "none": 2},
-        },
-    }
-
     # Question mappings
     QUESTION_TEXT = {
         "enjoy": "What do you enjoy most?",
@@ -369,32 +388,40 @@ class AssessmentService:
     }
 
     @staticmethod
-    def calculate_club_score(club_slug: str, responses: Dict[str, str]) -> tuple[int, List[ReasoningItem]]:
+    def get_scored_clubs(db: Session) -> tuple[ScoredClub, ...]:
         """
-        Calculate score for a club based on assessment responses
+        Get active clubs that have scoring rules
 
-        Returns: (score, reasoning_list)
+        The slug filter runs in SQL and the result is cached in-process until
+        a club mutation bumps the clubs version or the TTL lapses (which also
+        covers changes made by other workers).
         """
-        rules = AssessmentService.CLUB_SCORING_RULES.get(club_slug, {})
-        total_score = 0
-        reasoning = []
-
-        for question_key, answer_value in responses.items():
-            if question_key == "time":  # Time commitment doesn't affect scoring
-                continue
-
-            if question_key in rules and answer_value in rules[question_key]:
-                contribution = rules[question_key][answer_value]
-                total_score += contribution
-
-                if contribution > 0:  # Only add if it contributed to the score
-                    reasoning.append(ReasoningItem(
-                        question=AssessmentService.QUESTION_TEXT[question_key],
-                        answer=AssessmentService.ANSWER_TEXT[question_key].get(answer_value, answer_value),
-                        contribution=contribution
-                    ))
-
-        return total_score, reasoning
+        cache = _scored_clubs_cache
+        now = time.monotonic()
+        if cache["version"] != _clubs_version or now - cache["loaded_at"] > SCORED_CLUBS_TTL_SECONDS:
+            # Only the columns the dicts need, as plain rows (no ORM instances)
+            db_clubs = db.query(
+                Club.id, Club.name, Club.slug, Club.tagline, Club.logo_url
+            ).filter(
+                Club.is_active == True,
+                Club.slug.in_(SCORED_SLUGS)
+            ).all()
+            # Build each club's recommendation dict (including the logo
+            # fallback) once per load rather than once per assessment
+            cache["clubs"] = tuple(
+                ScoredClub(_CLUB_ROW[c.slug], {
+                    "id": str(c.id),
+                    "name": c.name,
+                    "slug": c.slug,
+                    "tagline": c.tagline or "",
+                    "logo_url": c.logo_url or f"/images/clubs/{c.slug}.jpg"
+                })
+                for c in db_clubs
+            )
+            cache["version"] = _clubs_version
+            cache["loaded_at"] = now
+            cache["generation"] += 1
+        return cache["clubs"]
 
     @staticmethod
     def get_club_recommendations(
@@ -405,52 +432,77 @@ class AssessmentService:
         """
         Generate club recommendations based on assessment responses
 
-        Now uses real clubs from the database with comprehensive scoring rules
+        Results are memoized per (responses, top_n, scored clubs generation),
+        so repeated answer combinations skip scoring entirely. The returned
+        recommendations are shared between callers and must not be mutated.
         """
-        # Query all active clubs from the database
-        db_clubs = db.query(Club).filter(Club.is_active == True).all()
+        # Active clubs that have scoring rules; reloading them starts a new
+        # generation, which retires every memoized result
+        AssessmentService.get_scored_clubs(db)
 
-        # If no clubs in database, return empty list
-        if not db_clubs:
-            return []
+        # Responses come from AssessmentResponses.model_dump(), so item order is
+        # stable; it is kept in the key because it also orders the reasoning
+        response_key = tuple(responses.items())
+        return list(_recommend_cached(response_key, top_n, _scored_clubs_cache["generation"]))
 
-        # Convert database clubs to dict format and calculate scores
-        scored_clubs = []
-        for db_club in db_clubs:
-            # Only calculate score if we have scoring rules for this club
-            if db_club.slug in AssessmentService.CLUB_SCORING_RULES:
-                score, reasoning = AssessmentService.calculate_club_score(db_club.slug, responses)
-
-                # Convert club to dict format expected by recommendation schema
-                club_dict = {
-                    "id": str(db_club.id),
-                    "name": db_club.name,
-                    "slug": db_club.slug,
-                    "tagline": db_club.tagline or "",
-                    "logo_url": db_club.logo_url or f"/images/clubs/{db_club.slug}.jpg"
-                }
-
-                scored_clubs.append({
-                    "club": club_dict,
-                    "score": score,
-                    "reasoning": reasoning
-                })
+    @staticmethod
+    def _rank_clubs(
+        scored_clubs: tuple[ScoredClub, ...],
+        responses: Dict[str, str],
+        top_n: int
+    ) -> List[ClubRecommendation]:
+        """
+        Score and rank clubs for a set of responses
+
+        Responses are resolved to integer (question, answer) slots once; a single
+        gather over SCORE_TABLE then yields every club's per-response
+        contributions, which are summed for scoring and reused as the
+        reasoning of the top_n clubs picked by a heap.
+
+        Recommendations are built without validation and carry reasoning as
+        plain dicts; callers returning them from an endpoint validate them there.
+        """
+        response_index = _RESPONSE_INDEX
+        templates = REASONING_TEMPLATES
 
-        # If no clubs have scoring rules, return empty list
-        if not scored_clubs:
+        top_n = min(top_n, len(scored_clubs))
+        if top_n < 1:
             return []
 
-        # Sort by score (descending) and assign ranks
-        scored_clubs.sort(key=lambda x: x["score"], reverse=True)
+        # Resolve each scored response to its integer (question, answer) slot
+        # once; time commitment and unknown answers have no slot
+        slots = []
+        texts = []
+        for item in responses.items():
+            index = response_index.get(item)
+            if index is not None:
+                slots.append(index)
+                texts.append(templates[item])
+        slots = np.array(slots, dtype=np.intp).reshape(-1, 2)
+
+        # contributions[row, i] is what the i-th resolved response adds to a club
+        contributions = SCORE_TABLE[:, slots[:, 0], slots[:, 1]]
+        rows = [club.row for club in scored_clubs]
+        scores = contributions[rows].sum(axis=1, dtype=np.int32).tolist()
+
+        # Keep only the top_n best scores; nlargest is stable, so ties keep
+        # database order exactly like a full descending sort would
+        top = heapq.nlargest(top_n, range(len(scores)), key=scores.__getitem__)
 
         # Create recommendations with ranks
         recommendations = []
-        for rank, item in enumerate(scored_clubs[:top_n], start=1):
-            recommendations.append(ClubRecommendation(
-                club=item["club"],
-                score=item["score"],
+        for rank, idx in enumerate(top, start=1):
+            reasoning = [
+                {"question": question_text, "answer": answer_text, "contribution": contribution}
+                for (question_text, answer_text), contribution in zip(texts, contributions[rows[idx]].tolist())
+                if contribution > 0  # Only add if it contributed to the score
+            ]
+
+            recommendations.append(ClubRecommendation.model_construct(
+                club=scored_clubs[idx].club,
+                score=scores[idx],
                 rank=rank,
-                reasoning=[r.model_dump() for r in item["reasoning"]]
+                reasoning=reasoning
             ))
 
         return recommendations
@@ -461,34 +513,40 @@ class AssessmentService:
         assessment_data: AssessmentCreate
     ) -> Assessment:
         """Create a new assessment and store it in the database"""
+        responses = assessment_data.responses.model_dump()
+
         # Create assessment
         assessment = Assessment(
             id=uuid.uuid4(),
             user_id=assessment_data.user_id,
-            responses=assessment_data.responses.model_dump(),
+            responses=responses,
         )
 
+        # Flush (not commit) so the assessment row exists for the
+        # recommendation FKs; everything is committed together below
         db.add(assessment)
-        db.commit()
-        db.refresh(assessment)
+        db.flush()
 
         # Generate recommendations
-        recommendations = AssessmentService.get_club_recommendations(
-            db,
-            assessment_data.responses.model_dump()
-        )
-
-        # Store recommendations
-        for rec in recommendations:
-            recommendation = Recommendation(
-                assessment_id=assessment.id,
-                club_id=rec.club["slug"],
-                score=rec.score,
-                rank=rec.rank,
-                reasoning=[r.model_dump() if hasattr(r, 'model_dump') else r for r in rec.reasoning]
+        recommendations = AssessmentService.get_club_recommendations(db, responses)
+
+        # Store recommendations in a single executemany INSERT
+        if recommendations:
+            db.execute(
+                insert(Recommendation),
+                [
+                    {
+                        "assessment_id": assessment.id,
+                        "club_id": uuid.UUID(rec.club["id"]),
+                        "score": rec.score,
+                        "rank": rec.rank,
+                        "reasoning": rec.reasoning,
+                    }
+                    for rec in recommendations
+                ]
             )
-            db.add(recommendation)
 
+        # created_at comes back from the INSERT ... RETURNING at flush time
         db.commit()
 
         return assessment
@@ -499,12 +557,15 @@ class AssessmentService:
         assessment_id: str
     ) -> Optional[Assessment]:
         """Get assessment by ID"""
-        try:
-            assessment_uuid = uuid.UUID(assessment_id)
-            return db.query(Assessment).filter(Assessment.id == assessment_uuid).first()
-        except ValueError:
+        # Reject malformed IDs up front instead of catching uuid.UUID's ValueError
+        if not _UUID_RE.fullmatch(assessment_id):
             return None
 
+        return db.query(Assessment)\
+            .options(selectinload(Assessment.recommendations).selectinload(Recommendation.club))\
+            .filter(Assessment.id == uuid.UUID(assessment_id))\
+            .first()
+
     @staticmethod
     def get_user_assessments(
         db: Session,
@@ -512,16 +573,103 @@ class AssessmentService:
         limit: int = 10
     ) -> List[Assessment]:
         """Get assessments for a specific user"""
-        try:
-            user_uuid = uuid.UUID(user_id)
-            return db.query(Assessment)\
-                .filter(Assessment.user_id == user_uuid)\
-                .order_by(Assessment.created_at.desc())\
-                .limit(limit)\
-                .all()
-        except ValueError:
+        if not _UUID_RE.fullmatch(user_id):
             return []
 
+        return db.query(Assessment)\
+            .filter(Assessment.user_id == uuid.UUID(user_id))\
+            .order_by(Assessment.created_at.desc())\
+            .limit(limit)\
+            .all()
+
+
+def _build_score_table(
+    rules: Dict[str, Dict[str, Dict[str, int]]],
+    answer_text: Dict[str, Dict[str, str]],
+) -> tuple[Dict[str, int], Dict[tuple[str, str], tuple[int, int]], np.ndarray]:
+    """
+    Flatten the nested scoring rules into a dense int8 table
+
+    Returns: (club_row, response_index, table) where, for
+    (q, a) = response_index[(question, answer)],
+    table[club_row[slug], q, a] is the weight that answer contributes to
+    that club. Unused answer slots stay zero.
+    """
+    club_row = {slug: row for row, slug in enumerate(rules)}
+    response_index = {
+        (question_key, answer_value): (q, a)
+        for q, (question_key, answers) in enumerate(answer_text.items())
+        for a, answer_value in enumerate(answers)
+    }
+    max_answers = max(len(answers) for answers in answer_text.values())
+
+    table = np.zeros((len(club_row), len(answer_text), max_answers), dtype=np.int8)
+    for slug, club_rules in rules.items():
+        for question_key, weights in club_rules.items():
+            for answer_value, weight in weights.items():
+                q, a = response_index[(question_key, answer_value)]
+                table[club_row[slug], q, a] = weight
+
+    return club_row, response_index, table
+
+
+_CLUB_ROW, _RESPONSE_INDEX, SCORE_TABLE = _build_score_table(
+    CLUB_SCORING_RULES,
+    AssessmentService.ANSWER_TEXT,
+)
+
+SCORED_SLUGS = frozenset(_CLUB_ROW)
+
+# (question_key, answer_value) -> (question text, answer text) for reasoning
+REASONING_TEMPLATES = {
+    (question_key, answer_value): (AssessmentService.QUESTION_TEXT[question_key], answer_text)
+    for question_key, answers in AssessmentService.ANSWER_TEXT.items()
+    for answer_value, answer_text in answers.items()
+}
+
+
+# Process-local cache of active scored clubs, invalidated by club mutations
+SCORED_CLUBS_TTL_SECONDS = 300
+_CACHED_CLUB_COLUMNS = ("name", "slug", "tagline", "logo_url", "is_active")
+_clubs_version = 0
+_scored_clubs_cache: Dict[str, Any] = {"version": -1, "loaded_at": 0.0, "generation": 0, "clubs": ()}
+
+
+@functools.lru_cache(maxsize=4096)
+def _recommend_cached(
+    response_key: tuple[tuple[str, str], ...],
+    top_n: int,
+    clubs_generation: int
+) -> tuple[ClubRecommendation, ...]:
+    """
+    Memoized AssessmentService._rank_clubs over the current scored clubs
+
+    clubs_generation is only part of the key: callers pass the generation of
+    the clubs currently in _scored_clubs_cache.
+    """
+    return tuple(AssessmentService._rank_clubs(
+        _scored_clubs_cache["clubs"], dict(response_key), top_n
+    ))
+
+
+def _bump_clubs_version() -> None:
+    global _clubs_version
+    _clubs_version += 1
+
+
+@event.listens_for(Club, "after_insert")
+@event.listens_for(Club, "after_delete")
+def _on_club_inserted_or_deleted(mapper, connection, target) -> None:
+    _bump_clubs_version()
+
+
+@event.listens_for(Club, "after_update")
+def _on_club_updated(mapper, connection, target) -> None:
+    # View/member counter updates don't affect recommendations
+    attrs = inspect(target).attrs
+    if any(attrs[column].history.has_changes() for column in _CACHED_CLUB_COLUMNS):
+        _bump_clubs_version()
+
 
 # Create singleton instance
 assessment_service = AssessmentService()
@@ -2,21 +2,48 @@
 Authentication service for user registration and login
 """
 from datetime import timedelta, datetime
-from typing import Optional
+from typing import Any, Callable, Optional
+import asyncio
+import uuid
+
 from sqlalchemy.orm import Session
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
 
 from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin, TokenResponse
 from app.core.security import (
     get_password_hash,
     verify_password,
+    is_password_recently_verified,
+    remember_verified_password,
     create_access_token,
     create_refresh_token,
     decode_token,
+    hash_token,
 )
 from app.core.config import settings
 from app.services.email_service import email_service
+from app.services.user_service import user_service
+
+
+# bcrypt is CPU-bound but releases the GIL while hashing, so running it in
+# the default thread pool keeps the event loop free and lets concurrent
+# logins use every core, without forking worker processes (unsupported on Lambda)
+async def _run_password_hashing(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a password hashing function in a worker thread"""
+    return await asyncio.to_thread(func, *args)
+
+
+def _send_email(
+    background_tasks: Optional[BackgroundTasks],
+    send: Callable[..., bool],
+    **kwargs: Any,
+) -> bool:
+    """Render and queue an email after the response, or inline without background_tasks"""
+    if background_tasks is None:
+        return send(**kwargs)
+    background_tasks.add_task(send, **kwargs)
+    return True
 
 
 class AuthService:
@@ -24,16 +51,16 @@ class AuthService:
 
     @staticmethod
     def get_user_by_email(db: Session, email: str) -> Optional[User]:
-        """Get user by email"""
-        return db.query(User).filter(User.email == email.lower()).first()
+        """Get user by email (cached)"""
+        return user_service.get_user_by_email(db, email)
 
     @staticmethod
     def get_user_by_id(db: Session, user_id: str) -> Optional[User]:
-        """Get user by ID"""
-        return db.query(User).filter(User.id == user_id).first()
+        """Get user by ID (cached); raises ValueError if user_id is malformed"""
+        return user_service.get_user_by_id(db, uuid.UUID(user_id))
 
     @staticmethod
-    def create_user(db: Session, user_data: UserCreate) -> User:
+    async def create_user(db: Session, user_data: UserCreate) -> User:
         """Create a new user"""
         # Check if user already exists
         existing_user = AuthService.get_user_by_email(db, user_data.email)
@@ -45,27 +72,30 @@ class AuthService:
 
         # Create new user
         db_user = User(
-            email=user_data.email.lower(),
-            password_hash=get_password_hash(user_data.password),
+            email=user_data.email,
+            password_hash=await _run_password_hashing(get_password_hash, user_data.password),
             full_name=user_data.full_name,
         )
 
         db.add(db_user)
         db.commit()
-        db.refresh(db_user)
 
         return db_user
 
     @staticmethod
-    def authenticate_user(db: Session, credentials: UserLogin) -> Optional[User]:
+    async def authenticate_user(db: Session, credentials: UserLogin) -> Optional[User]:
         """Authenticate user with email and password"""
         user = AuthService.get_user_by_email(db, credentials.email)
 
         if not user:
             return None
 
-        if not verify_password(credentials.password, user.password_hash):
-            return None
+        # Repeat logins are answered from the in-process cache; everything
+        # else pays for bcrypt in a worker thread
+        if not is_password_recently_verified(credentials.password, user.password_hash):
+            if not await _run_password_hashing(verify_password, credentials.password, user.password_hash):
+                return None
+            remember_verified_password(credentials.password, user.password_hash)
 
         if not user.is_active:
             raise HTTPException(
@@ -143,13 +173,18 @@ class AuthService:
             ) from e
 
     @staticmethod
-    def request_password_reset(db: Session, email: str) -> bool:
+    def request_password_reset(
+        db: Session,
+        email: str,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> bool:
         """
         Generate password reset token and send reset email
 
         Args:
             db: Database session
             email: User email address
+            background_tasks: If given, the email is sent after the response
 
         Returns:
             True if email sent successfully
@@ -164,13 +199,15 @@ class AuthService:
         reset_token = email_service.generate_token()
         token_expiry = email_service.get_token_expiry(hours=1)  # 1 hour expiry
 
-        # Store token in database
-        user.reset_password_token = reset_token
+        # Store only the token's hash; the token itself goes out by email
+        user.reset_password_token_hash = hash_token(reset_token)
         user.reset_password_token_expires = token_expiry
         db.commit()
 
         # Send password reset email
-        email_service.send_password_reset_email(
+        _send_email(
+            background_tasks,
+            email_service.send_password_reset_email,
             to_email=user.email,
             full_name=user.full_name,
             reset_token=reset_token
@@ -179,7 +216,7 @@ class AuthService:
         return True
 
     @staticmethod
-    def reset_password(db: Session, token: str, new_password: str) -> bool:
+    async def reset_password(db: Session, token: str, new_password: str) -> bool:
         """
         Reset user password using reset token
 
@@ -193,7 +230,7 @@ class AuthService:
         """
         # Find user with this reset token
         user = db.query(User).filter(
-            User.reset_password_token == token
+            User.reset_password_token_hash == hash_token(token)
         ).first()
 
         if not user:
@@ -210,10 +247,10 @@ class AuthService:
             )
 
         # Update password
-        user.password_hash = get_password_hash(new_password)
+        user.password_hash = await _run_password_hashing(get_password_hash, new_password)
 
         # Clear reset token
-        user.reset_password_token = None
+        user.reset_password_token_hash = None
         user.reset_password_token_expires = None
 
         db.commit()
@@ -236,50 +273,62 @@ class AuthService:
         verification_token = email_service.generate_token()
         token_expiry = email_service.get_token_expiry(hours=24)  # 24 hour expiry
 
-        # Store token in database
-        user.email_verification_token = verification_token
+        # Store only the token's hash; the token itself goes out by email
+        user.email_verification_token_hash = hash_token(verification_token)
         user.email_verification_token_expires = token_expiry
         db.commit()
 
         return verification_token
 
     @staticmethod
-    def send_verification_email(db: Session, user: User) -> bool:
+    def send_verification_email(
+        db: Session,
+        user: User,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> bool:
         """
         Send email verification email to user
 
         Args:
             db: Database session
             user: User object
+            background_tasks: If given, the email is sent after the response
 
         Returns:
-            True if email sent successfully
+            True if email sent (or queued) successfully
         """
         # Generate verification token
         verification_token = AuthService.generate_verification_token(db, user)
 
         # Send verification email
-        return email_service.send_verification_email(
+        return _send_email(
+            background_tasks,
+            email_service.send_verification_email,
             to_email=user.email,
             full_name=user.full_name,
             verification_token=verification_token
         )
 
     @staticmethod
-    def verify_email(db: Session, token: str) -> bool:
+    def verify_email(
+        db: Session,
+        token: str,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> bool:
         """
         Verify user email using verification token
 
         Args:
             db: Database session
             token: Email verification token
+            background_tasks: If given, the welcome email is sent after the response
 
         Returns:
             True if email verified successfully
         """
         # Find user with this verification token
         user = db.query(User).filter(
-            User.email_verification_token == token
+            User.email_verification_token_hash == hash_token(token)
         ).first()
 
         if not user:
@@ -299,13 +348,15 @@ class AuthService:
         user.email_verified = True
 
         # Clear verification token
-        user.email_verification_token = None
+        user.email_verification_token_hash = None
         user.email_verification_token_expires = None
 
         db.commit()
 
         # Send welcome email
-        email_service.send_welcome_email(
+        _send_email(
+            background_tasks,
+            email_service.send_welcome_email,
             to_email=user.email,
             full_name=user.full_name
         )
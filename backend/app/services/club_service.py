@@ -1,32 +1,142 @@
 """
 Club service for handling club operations
 """
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
-from fastapi import HTTPException, status
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+from sqlalchemy.orm import Session, object_session, raiseload, selectinload
+from sqlalchemy import bindparam, event, inspect, literal_column, or_, func, select, true, tuple_, update
+from fastapi import BackgroundTasks, HTTPException, status
+import base64
+import functools
+import orjson
+import redis
 import uuid
 
-from app.models.club import Club, Membership, ClubCategory, Announcement, GallerySettings
-from app.schemas.club import ClubCreate, ClubUpdate, AnnouncementCreate, AnnouncementUpdate, GallerySettingsCreate, GallerySettingsUpdate
+from app.core.config import settings
+from app.core.redis_client import redis_client
+from app.database import SessionLocal
+from app.models.club import Club, Membership, ClubCategory, Announcement, GallerySettings, InstagramPost
+from app.schemas.club import ClubCreate, ClubUpdate, ClubResponse, AnnouncementCreate, AnnouncementUpdate, GallerySettingsCreate, GallerySettingsUpdate
+from app.schemas.club import InstagramPost as InstagramPostSchema
+
+
+# Stored generated tsvector over name, tagline and description with a GIN
+# index (migration 005); not mapped on Club since only Postgres has it
+CLUB_SEARCH_VECTOR = literal_column("clubs.search_vector")
+
+# IDs arrive either already parsed (typed route params) or as strings
+UUIDLike = Union[str, uuid.UUID]
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_uuid(value: str) -> uuid.UUID:
+    return uuid.UUID(value)
+
+
+def _to_uuid(value: UUIDLike) -> uuid.UUID:
+    """Coerce an ID to UUID, memoizing string parses; raises ValueError if malformed"""
+    return value if isinstance(value, uuid.UUID) else _parse_uuid(value)
+
+
+# Category query strings to enum members; a dict miss replaces the
+# ValueError raised by ClubCategory(value)
+_CLUB_CATEGORIES = {c.value: c for c in ClubCategory}
+
+
+def encode_club_cursor(club: Club) -> str:
+    """Opaque cursor for the club list, pointing just past this club"""
+    raw = orjson.dumps([club.is_featured, club.created_at.isoformat(), str(club.id)])
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_club_cursor(cursor: str) -> tuple[bool, datetime, uuid.UUID]:
+    """Club list sort key from a cursor; raises ValueError if malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        is_featured, created_at, club_id = orjson.loads(raw)
+        return bool(is_featured), datetime.fromisoformat(created_at), uuid.UUID(club_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+# Club views are buffered in Redis under VIEW_COUNT_KEY_PREFIX + club id and
+# written to clubs.view_count at most once per VIEW_COUNT_FLUSH_SECONDS
+VIEW_COUNT_KEY_PREFIX = "club:views:"
+VIEW_COUNT_FLUSH_LOCK = "club-views-flush-lock"
+VIEW_COUNT_FLUSH_SECONDS = 30
+
+# Serialized club responses for the hot read endpoints, shared across workers
+# and dropped once a transaction that changed a club row through the ORM commits
+CLUB_CACHE_PREFIX = "clubs:response:"
+CLUB_CACHE_TTL_SECONDS = 60
+
+# Featured and popular lists are cached once at the largest limit the routes
+# accept and sliced per request, so each has a single key to invalidate
+CLUB_LIST_CACHE_SIZE = 50
+CLUB_LIST_CACHE_KEYS = (f"{CLUB_CACHE_PREFIX}featured", f"{CLUB_CACHE_PREFIX}popular")
+
+# Session.info key collecting cache keys to drop when the transaction commits
+_PENDING_CLUB_CACHE_KEYS = "pending_club_cache_keys"
+
+
+def _cached(key: str, load: Callable[[], Any]) -> Any:
+    """Return the cached JSON value for key, computing and storing it on a miss"""
+    try:
+        cached = redis_client.get(key)
+    except redis.RedisError:
+        return load()  # Redis unavailable, serve straight from the database
+    if cached is not None:
+        return orjson.loads(cached)
+
+    value = load()
+    if value is not None:
+        try:
+            redis_client.set(key, orjson.dumps(value), ex=CLUB_CACHE_TTL_SECONDS)
+        except redis.RedisError:
+            pass
+    return value
+
+
+def invalidate_club_cache(keys: Iterable[str]) -> None:
+    """Drop the given cached club responses"""
+    keys = list(keys)
+    if not keys:
+        return
+    try:
+        redis_client.delete(*keys)
+    except redis.RedisError:
+        pass  # Entries expire on their own within CLUB_CACHE_TTL_SECONDS
+
+
+def _club_response(club: Club) -> Dict[str, Any]:
+    return ClubResponse.model_validate(club).model_dump(mode="json")
 
 
 class ClubService:
     """Service for handling club operations"""
 
     @staticmethod
-    def get_club_by_id(db: Session, club_id: str) -> Optional[Club]:
+    def get_club_by_id(db: Session, club_id: UUIDLike) -> Optional[Club]:
         """Get club by ID"""
         try:
-            club_uuid = uuid.UUID(club_id)
-            return db.query(Club).filter(Club.id == club_uuid).first()
+            club_uuid = _to_uuid(club_id)
+            return db.execute(select(Club).where(Club.id == club_uuid)).scalars().first()
         except ValueError:
             return None
 
     @staticmethod
     def get_club_by_slug(db: Session, slug: str) -> Optional[Club]:
         """Get club by slug"""
-        return db.query(Club).filter(Club.slug == slug).first()
+        return db.execute(select(Club).where(Club.slug == slug)).scalars().first()
+
+    @staticmethod
+    def get_club_response_by_slug(db: Session, slug: str) -> Optional[Dict[str, Any]]:
+        """Get a club's serialized response by slug (cached)"""
+        def load() -> Optional[Dict[str, Any]]:
+            club = ClubService.get_club_by_slug(db, slug)
+            return _club_response(club) if club else None
+
+        return _cached(f"{CLUB_CACHE_PREFIX}slug:{slug}", load)
 
     @staticmethod
     def get_clubs(
@@ -35,92 +145,115 @@ class ClubService:
         search: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
-        is_active: bool = True
+        is_active: bool = True,
+        cursor: Optional[str] = None
     ) -> tuple[List[Club], int]:
         """
         Get clubs with optional filtering
 
+        With a cursor (from encode_club_cursor), the list resumes just past
+        that club and total_count counts only the clubs from there on.
+        Cursors follow the default ordering, so they cannot be combined
+        with search.
+
         Returns: (clubs, total_count)
         """
-        query = db.query(Club)
+        # COUNT(*) OVER () counts every filtered row before LIMIT/OFFSET, so
+        # the page and the total come back in one query
+        stmt = select(Club, func.count().over().label("total"))
+        if settings.ENVIRONMENT == "development":
+            # ClubResponse reads no relationships; surface any future lazy load as an error
+            stmt = stmt.options(raiseload("*"))
 
         # Filter by active status
         if is_active is not None:
-            query = query.filter(Club.is_active == is_active)
+            stmt = stmt.where(Club.is_active == is_active)
 
         # Filter by category
         if category:
-            try:
-                cat_enum = ClubCategory(category)
-                query = query.filter(Club.category == cat_enum)
-            except ValueError:
-                pass  # Invalid category, skip filter
+            cat_enum = _CLUB_CATEGORIES.get(category)
+            if cat_enum is not None:  # Invalid category, skip filter
+                stmt = stmt.where(Club.category == cat_enum)
 
         # Search using PostgreSQL Full-Text Search (FTS)
         # This provides O(log n) performance compared to O(n) with ILIKE
         if search:
-            # Use PostgreSQL's Full-Text Search with ranking
-            # ts_rank orders results by relevance
-            from sqlalchemy import text
-
-            # Sanitize search query for tsquery (remove special characters)
-            # Convert to tsquery format (words separated by &)
-            search_terms = search.strip().replace("'", "''")  # Escape single quotes
-
-            # Use websearch_to_tsquery for natural language queries
-            # This handles phrases, AND/OR logic, and quoted strings
-            query = query.filter(
-                text("search_vector @@ websearch_to_tsquery('english', :search)")
-            ).params(search=search_terms)
+            # websearch_to_tsquery handles phrases, AND/OR logic and quoted
+            # strings. It is evaluated once as a FROM item and shared by the
+            # match and the ts_rank ordering; the search text is a bound
+            # parameter, so it needs no manual escaping.
+            search_query = func.websearch_to_tsquery(
+                "english", bindparam("search", search.strip())
+            ).alias("search_query")
+            stmt = stmt.join(search_query, true()).where(
+                CLUB_SEARCH_VECTOR.op("@@")(search_query.column)
+            )
 
             # Order by relevance (ts_rank) when searching
             # Higher rank = better match
-            query = query.order_by(
-                text("ts_rank(search_vector, websearch_to_tsquery('english', :search)) DESC")
-            ).params(search=search_terms)
+            stmt = stmt.order_by(func.ts_rank(CLUB_SEARCH_VECTOR, search_query.column).desc())
 
-        # Get total count
-        total = query.count()
+        # Keyset pagination: seek past the cursor's sort key instead of
+        # scanning and discarding every earlier row with OFFSET
+        if cursor is not None:
+            if search:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Cursor pagination cannot be combined with search"
+                )
+            try:
+                position = decode_club_cursor(cursor)
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid cursor"
+                )
+            stmt = stmt.where(tuple_(Club.is_featured, Club.created_at, Club.id) < tuple_(*position))
 
         # Apply pagination and sorting
         # Note: If search is active, results are already ordered by relevance (ts_rank)
-        # Otherwise, order by featured status and creation date
+        # Otherwise, order by featured status and creation date, with the id
+        # breaking ties so pages and cursors are stable
         if not search:
-            query = query.order_by(Club.is_featured.desc(), Club.created_at.desc())
+            stmt = stmt.order_by(Club.is_featured.desc(), Club.created_at.desc(), Club.id.desc())
 
-        clubs = query.offset(skip).limit(limit).all()
+        rows = db.execute(stmt.offset(skip).limit(limit)).all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
 
-        return clubs, total
+        # An empty page carries no total; only a page past the end needs a count
+        if skip > 0:
+            filtered = stmt.with_only_columns(Club.id).order_by(None).subquery()
+            return [], db.scalar(select(func.count()).select_from(filtered))
+        return [], 0
 
     @staticmethod
     def create_club(db: Session, club_data: ClubCreate) -> Club:
         """Create a new club"""
-        # Check if slug already exists
-        existing_club = ClubService.get_club_by_slug(db, club_data.slug)
-        if existing_club:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Club with this slug already exists"
-            )
-
-        # Check if name already exists
-        existing_name = db.query(Club).filter(Club.name == club_data.name).first()
-        if existing_name:
+        # Check slug and name uniqueness in one query; a slug clash wins
+        # when both match, as it did when they were checked separately
+        existing = db.execute(
+            select(Club.slug)
+            .where(or_(Club.slug == club_data.slug, Club.name == club_data.name))
+            .order_by((Club.slug == club_data.slug).desc())
+            .limit(1)
+        ).first()
+        if existing:
+            field = "slug" if existing.slug == club_data.slug else "name"
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
-                detail="Club with this name already exists"
+                detail=f"Club with this {field} already exists"
             )
 
         # Create club
         club = Club(**club_data.model_dump())
         db.add(club)
         db.commit()
-        db.refresh(club)
 
         return club
 
     @staticmethod
-    def update_club(db: Session, club_id: str, club_data: ClubUpdate) -> Optional[Club]:
+    def update_club(db: Session, club_id: UUIDLike, club_data: ClubUpdate) -> Optional[Club]:
         """Update a club"""
         club = ClubService.get_club_by_id(db, club_id)
         if not club:
@@ -132,12 +265,11 @@ class ClubService:
             setattr(club, field, value)
 
         db.commit()
-        db.refresh(club)
 
         return club
 
     @staticmethod
-    def delete_club(db: Session, club_id: str) -> bool:
+    def delete_club(db: Session, club_id: UUIDLike) -> bool:
         """Delete a club"""
         club = ClubService.get_club_by_id(db, club_id)
         if not club:
@@ -149,62 +281,175 @@ class ClubService:
         return True
 
     @staticmethod
-    def increment_view_count(db: Session, club_id: str) -> None:
+    def increment_view_count(
+        db: Session,
+        club_id: UUIDLike,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> None:
         """Increment club view count"""
-        club = ClubService.get_club_by_id(db, club_id)
-        if club:
-            club.view_count += 1
+        try:
+            club_uuid = _to_uuid(club_id)
+        except ValueError:
+            return
+
+        # Buffer the view in Redis; whichever request takes the flush lock
+        # writes all buffered views through after its response is sent (no
+        # scheduler needed, which also works on Lambda where the app
+        # lifespan is off)
+        try:
+            redis_client.incr(f"{VIEW_COUNT_KEY_PREFIX}{club_uuid}")
+            if redis_client.set(VIEW_COUNT_FLUSH_LOCK, "1", nx=True, ex=VIEW_COUNT_FLUSH_SECONDS):
+                if background_tasks is None:
+                    ClubService.flush_view_counts(db)
+                else:
+                    background_tasks.add_task(ClubService.flush_view_counts_in_background)
+            return
+        except redis.RedisError:
+            pass  # Redis unavailable, write through below
+
+        # Single atomic UPDATE: no read-modify-write, so concurrent views aren't lost
+        db.execute(
+            update(Club)
+            .where(Club.id == club_uuid)
+            .values(view_count=Club.view_count + 1)
+        )
+        db.commit()
+
+    @staticmethod
+    def flush_view_counts(db: Session) -> int:
+        """
+        Move buffered view counts from Redis into clubs.view_count
+
+        Each counter is read and removed atomically (GETDEL), so concurrent
+        flushes never apply the same views twice. If the UPDATE fails, the
+        removed counts are added back to Redis for the next flush.
+
+        Returns: number of clubs updated
+        """
+        pending = []
+        try:
+            for key in redis_client.scan_iter(match=f"{VIEW_COUNT_KEY_PREFIX}*", count=500):
+                views = redis_client.getdel(key)
+                if views:
+                    pending.append({
+                        "club_id": uuid.UUID(key[len(VIEW_COUNT_KEY_PREFIX):]),
+                        "views": int(views),
+                    })
+        except redis.RedisError as e:
+            print(f"[Club Service] Reading buffered views failed: {e}")
+
+        if not pending:
+            return 0
+
+        try:
+            clubs = Club.__table__
+            db.execute(
+                update(clubs)
+                .where(clubs.c.id == bindparam("club_id"))
+                .values(view_count=clubs.c.view_count + bindparam("views")),
+                pending
+            )
             db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"[Club Service] Writing buffered views failed, re-buffering: {e}")
+            try:
+                pipe = redis_client.pipeline(transaction=False)
+                for row in pending:
+                    pipe.incrby(f"{VIEW_COUNT_KEY_PREFIX}{row['club_id']}", row["views"])
+                pipe.execute()
+            except redis.RedisError as e:
+                print(f"[Club Service] Re-buffering views failed, {len(pending)} clubs lost views: {e}")
+            return 0
+
+        return len(pending)
+
+    @staticmethod
+    def flush_view_counts_in_background() -> None:
+        """Flush buffered views with a session of its own (BackgroundTasks entry point)"""
+        db = SessionLocal()
+        try:
+            ClubService.flush_view_counts(db)
+        finally:
+            db.close()
 
     @staticmethod
     def get_featured_clubs(db: Session, limit: int = 10) -> List[Club]:
         """Get featured clubs"""
-        return db.query(Club)\
-            .filter(Club.is_featured == True, Club.is_active == True)\
-            .order_by(Club.created_at.desc())\
-            .limit(limit)\
-            .all()
+        return db.execute(
+            select(Club)
+            .where(Club.is_featured == True, Club.is_active == True)
+            .order_by(Club.created_at.desc())
+            .limit(limit)
+        ).scalars().all()
+
+    @staticmethod
+    def get_featured_club_responses(db: Session, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get featured clubs as serialized responses (cached)"""
+        return _cached(
+            f"{CLUB_CACHE_PREFIX}featured",
+            lambda: [
+                _club_response(club)
+                for club in ClubService.get_featured_clubs(db, CLUB_LIST_CACHE_SIZE)
+            ]
+        )[:limit]
+
+    @staticmethod
+    def get_popular_club_responses(db: Session, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get popular clubs as serialized responses (cached)"""
+        return _cached(
+            f"{CLUB_CACHE_PREFIX}popular",
+            lambda: [
+                _club_response(club)
+                for club in ClubService.get_popular_clubs(db, CLUB_LIST_CACHE_SIZE)
+            ]
+        )[:limit]
 
     @staticmethod
     def get_popular_clubs(db: Session, limit: int = 10) -> List[Club]:
         """Get popular clubs by member count"""
-        return db.query(Club)\
-            .filter(Club.is_active == True)\
-            .order_by(Club.member_count.desc())\
-            .limit(limit)\
-            .all()
+        return db.execute(
+            select(Club)
+            .where(Club.is_active == True)
+            .order_by(Club.member_count.desc())
+            .limit(limit)
+        ).scalars().all()
 
 
 class MembershipService:
     """Service for handling club membership operations"""
 
     @staticmethod
-    def get_membership(db: Session, user_id: str, club_id: str) -> Optional[Membership]:
+    def get_membership(db: Session, user_id: UUIDLike, club_id: UUIDLike) -> Optional[Membership]:
         """Get membership by user and club"""
         try:
-            user_uuid = uuid.UUID(user_id)
-            club_uuid = uuid.UUID(club_id)
-            return db.query(Membership).filter(
-                Membership.user_id == user_uuid,
-                Membership.club_id == club_uuid
-            ).first()
+            user_uuid = _to_uuid(user_id)
+            club_uuid = _to_uuid(club_id)
+            return db.get(Membership, (user_uuid, club_uuid))
         except ValueError:
             return None
 
     @staticmethod
-    def get_user_memberships(db: Session, user_id: str) -> List[Membership]:
-        """Get all memberships for a user"""
+    def get_user_memberships(db: Session, user_id: UUIDLike) -> List[Membership]:
+        """Get all memberships for a user, with their clubs loaded in one extra query"""
+        options = [selectinload(Membership.club)]
+        if settings.ENVIRONMENT == "development":
+            # Surface any other relationship access as an error instead of N lazy loads
+            options.append(raiseload("*"))
+
         try:
-            user_uuid = uuid.UUID(user_id)
-            return db.query(Membership)\
-                .filter(Membership.user_id == user_uuid)\
-                .order_by(Membership.joined_at.desc())\
-                .all()
+            user_uuid = _to_uuid(user_id)
+            return db.execute(
+                select(Membership)
+                .options(*options)
+                .where(Membership.user_id == user_uuid)
+                .order_by(Membership.joined_at.desc())
+            ).scalars().all()
         except ValueError:
             return []
 
     @staticmethod
-    def join_club(db: Session, user_id: str, club_id: str, role: str = "member") -> Membership:
+    def join_club(db: Session, user_id: UUIDLike, club_id: UUIDLike, role: str = "member") -> Membership:
         """User joins a club"""
         # Check if club exists
         club = ClubService.get_club_by_id(db, club_id)
@@ -226,13 +471,12 @@ class MembershipService:
                 # Reactivate membership
                 existing.status = "active"
                 db.commit()
-                db.refresh(existing)
                 return existing
 
         # Create membership
         try:
-            user_uuid = uuid.UUID(user_id)
-            club_uuid = uuid.UUID(club_id)
+            user_uuid = _to_uuid(user_id)
+            club_uuid = _to_uuid(club_id)
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -248,30 +492,35 @@ class MembershipService:
 
         db.add(membership)
 
-        # Increment club member count
-        club.member_count += 1
+        # Increment club member count atomically in the same transaction
+        db.execute(
+            update(Club)
+            .where(Club.id == club.id)
+            .values(member_count=Club.member_count + 1)
+        )
 
+        # No refresh: the ORM UPDATE synchronizes the in-session club's
+        # member_count and committed instances are not expired
         db.commit()
-        db.refresh(membership)
 
         return membership
 
     @staticmethod
-    def leave_club(db: Session, user_id: str, club_id: str) -> bool:
+    def leave_club(db: Session, user_id: UUIDLike, club_id: UUIDLike) -> bool:
         """User leaves a club"""
         membership = MembershipService.get_membership(db, user_id, club_id)
         if not membership:
             return False
 
-        # Get club to update member count
-        club = ClubService.get_club_by_id(db, club_id)
-
         # Delete membership
         db.delete(membership)
 
-        # Decrement club member count
-        if club and club.member_count > 0:
-            club.member_count -= 1
+        # Decrement club member count atomically, never below zero
+        db.execute(
+            update(Club)
+            .where(Club.id == membership.club_id, Club.member_count > 0)
+            .values(member_count=Club.member_count - 1)
+        )
 
         db.commit()
 
@@ -282,10 +531,10 @@ class AnnouncementService:
     """Service for handling announcement operations"""
 
     @staticmethod
-    def get_announcement_by_id(db: Session, announcement_id: str) -> Optional[Announcement]:
+    def get_announcement_by_id(db: Session, announcement_id: UUIDLike) -> Optional[Announcement]:
         """Get announcement by ID"""
         try:
-            announcement_uuid = uuid.UUID(announcement_id)
+            announcement_uuid = _to_uuid(announcement_id)
             return db.query(Announcement).filter(Announcement.id == announcement_uuid).first()
         except ValueError:
             return None
@@ -293,13 +542,13 @@ class AnnouncementService:
     @staticmethod
     def get_club_announcements(
         db: Session,
-        club_id: str,
+        club_id: UUIDLike,
         is_published: Optional[bool] = True,
         limit: int = 10
     ) -> List[Announcement]:
         """Get announcements for a club"""
         try:
-            club_uuid = uuid.UUID(club_id)
+            club_uuid = _to_uuid(club_id)
             query = db.query(Announcement).filter(Announcement.club_id == club_uuid)
 
             if is_published is not None:
@@ -313,7 +562,7 @@ class AnnouncementService:
     def create_announcement(
         db: Session,
         announcement_data: AnnouncementCreate,
-        user_id: str
+        user_id: UUIDLike
     ) -> Announcement:
         """Create a new announcement"""
         # Verify club exists
@@ -325,7 +574,7 @@ class AnnouncementService:
             )
 
         try:
-            user_uuid = uuid.UUID(user_id)
+            user_uuid = _to_uuid(user_id)
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -338,14 +587,13 @@ class AnnouncementService:
         )
         db.add(announcement)
         db.commit()
-        db.refresh(announcement)
 
         return announcement
 
     @staticmethod
     def update_announcement(
         db: Session,
-        announcement_id: str,
+        announcement_id: UUIDLike,
         announcement_data: AnnouncementUpdate
     ) -> Optional[Announcement]:
         """Update an announcement"""
@@ -358,12 +606,11 @@ class AnnouncementService:
             setattr(announcement, field, value)
 
         db.commit()
-        db.refresh(announcement)
 
         return announcement
 
     @staticmethod
-    def delete_announcement(db: Session, announcement_id: str) -> bool:
+    def delete_announcement(db: Session, announcement_id: UUIDLike) -> bool:
         """Delete an announcement"""
         announcement = AnnouncementService.get_announcement_by_id(db, announcement_id)
         if not announcement:
@@ -379,19 +626,19 @@ class GalleryService:
     """Service for handling gallery/Instagram integration"""
 
     @staticmethod
-    def get_gallery_settings_by_id(db: Session, settings_id: str) -> Optional[GallerySettings]:
+    def get_gallery_settings_by_id(db: Session, settings_id: UUIDLike) -> Optional[GallerySettings]:
         """Get gallery settings by ID"""
         try:
-            settings_uuid = uuid.UUID(settings_id)
+            settings_uuid = _to_uuid(settings_id)
             return db.query(GallerySettings).filter(GallerySettings.id == settings_uuid).first()
         except ValueError:
             return None
 
     @staticmethod
-    def get_gallery_settings_by_club_id(db: Session, club_id: str) -> Optional[GallerySettings]:
+    def get_gallery_settings_by_club_id(db: Session, club_id: UUIDLike) -> Optional[GallerySettings]:
         """Get gallery settings for a club"""
         try:
-            club_uuid = uuid.UUID(club_id)
+            club_uuid = _to_uuid(club_id)
             return db.query(GallerySettings).filter(GallerySettings.club_id == club_uuid).first()
         except ValueError:
             return None
@@ -399,7 +646,7 @@ class GalleryService:
     @staticmethod
     def create_or_update_gallery_settings(
         db: Session,
-        club_id: str,
+        club_id: UUIDLike,
         settings_data: GallerySettingsCreate | GallerySettingsUpdate
     ) -> GallerySettings:
         """Create or update gallery settings for a club"""
@@ -422,12 +669,11 @@ class GalleryService:
                     setattr(existing_settings, field, value)
 
             db.commit()
-            db.refresh(existing_settings)
             return existing_settings
         else:
             # Create new settings
             try:
-                club_uuid = uuid.UUID(club_id)
+                club_uuid = _to_uuid(club_id)
             except ValueError:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -440,23 +686,26 @@ class GalleryService:
             )
             db.add(settings)
             db.commit()
-            db.refresh(settings)
             return settings
 
     @staticmethod
     def update_cached_posts(
         db: Session,
-        club_id: str,
-        posts_json: str
+        club_id: UUIDLike,
+        posts: List[InstagramPostSchema]
     ) -> Optional[GallerySettings]:
-        """Update cached Instagram posts for a club"""
+        """Replace cached Instagram posts for a club"""
         from datetime import datetime
 
         settings = GalleryService.get_gallery_settings_by_club_id(db, club_id)
         if not settings:
             return None
 
-        settings.cached_posts = posts_json
+        db.query(InstagramPost).filter(InstagramPost.club_id == settings.club_id).delete(synchronize_session=False)
+        db.add_all(
+            InstagramPost(club_id=settings.club_id, **post.model_dump())
+            for post in posts
+        )
         settings.cache_updated_at = datetime.utcnow()
 
         db.commit()
@@ -465,6 +714,28 @@ class GalleryService:
         return settings
 
 
+@event.listens_for(Club, "after_insert")
+@event.listens_for(Club, "after_update")
+@event.listens_for(Club, "after_delete")
+def _on_club_changed(mapper, connection, target) -> None:
+    # Runs mid-flush, before the change is visible to other connections;
+    # only record the keys here and drop them once the commit lands
+    slugs = {target.slug, *inspect(target).attrs.slug.history.deleted}
+    object_session(target).info.setdefault(_PENDING_CLUB_CACHE_KEYS, set()).update(
+        (*CLUB_LIST_CACHE_KEYS, *(f"{CLUB_CACHE_PREFIX}slug:{slug}" for slug in slugs))
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_clubs(session: Session) -> None:
+    invalidate_club_cache(session.info.pop(_PENDING_CLUB_CACHE_KEYS, ()))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_clubs(session: Session) -> None:
+    session.info.pop(_PENDING_CLUB_CACHE_KEYS, None)
+
+
 # Create singleton instances
 club_service = ClubService()
 membership_service = MembershipService()
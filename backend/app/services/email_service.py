@@ -1,64 +1,289 @@
 """
 Email service for sending notifications
 """
+import base64
+import hashlib
+import queue
+import re
 import smtplib
 import secrets
+import threading
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timedelta
-from typing import Optional
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import orjson
+import redis
+from cryptography.fernet import Fernet, InvalidToken
+from jinja2 import Environment, FileSystemLoader
+from markupsafe import Markup, escape
 
 from app.core.config import settings
+from app.core.redis_client import redis_client
+
+# Frontend links and sender, fixed for the life of the process
+FRONTEND_URL = settings.ALLOWED_ORIGINS[0].rstrip("/")
+VERIFY_EMAIL_URL = f"{FRONTEND_URL}/auth/verify-email?token="
+RESET_PASSWORD_URL = f"{FRONTEND_URL}/auth/reset-password?token="
+FROM_EMAIL = settings.SMTP_USER or "noreply@clubcompass.com"
+
+# Autoescaping covers user-supplied values such as full_name
+EMAIL_TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "emails"
+_email_templates = Environment(
+    loader=FileSystemLoader(EMAIL_TEMPLATE_DIR),
+    autoescape=True,
+    auto_reload=False,
+    cache_size=-1,
+)
+
+
+def _template_skeleton(name: str, *slots: str, **fixed: str) -> Callable[..., str]:
+    """
+    Pre-render an email template around its per-send slots
+
+    The templates are plain {{ value }} substitutions with no logic, so
+    rendering once with marker values leaves static segments that only
+    need the escaped slot values joined in at send time.
+
+    Args:
+        name: Template file name
+        *slots: Variables that change per email
+        **fixed: Variables baked in at import
+
+    Returns:
+        A render(**slot_values) function producing the same HTML as Jinja
+    """
+    markers = {slot: Markup(f"\x00{slot}\x00") for slot in slots}
+    parts = re.split(
+        "\x00(" + "|".join(slots) + ")\x00",
+        _email_templates.get_template(name).render(**markers, **fixed),
+    )
+    # parts alternates static text and slot names: [text, slot, text, ...]
+    segments = list(zip(parts[1::2], parts[2::2]))
+    head = parts[0]
+
+    def render(**values: str) -> str:
+        return head + "".join(str(escape(values[slot])) + text for slot, text in segments)
+
+    return render
+
+
+_render_verify_email = _template_skeleton("verify.jinja2", "full_name", "verification_url")
+_render_reset_email = _template_skeleton("reset.jinja2", "full_name", "reset_url")
+_render_welcome_email = _template_skeleton("welcome.jinja2", "full_name", site_url=FRONTEND_URL)
+
+# Reset (1 h) and verification (24 h) token lifetimes
+_TOKEN_TTLS = {hours: timedelta(hours=hours) for hours in (1, 24)}
+
+# Each email kind: subject, render(full_name, token) and, for emails that
+# carry a token, how long that token (and so a queued job) stays valid
+_EMAILS: Dict[str, Tuple[str, Callable[[str, Optional[str]], str], Optional[timedelta]]] = {
+    "verify": (
+        "Verify Your ClubCompass Email",
+        lambda full_name, token: _render_verify_email(
+            full_name=full_name, verification_url=VERIFY_EMAIL_URL + token
+        ),
+        _TOKEN_TTLS[24],
+    ),
+    "reset": (
+        "Reset Your ClubCompass Password",
+        lambda full_name, token: _render_reset_email(
+            full_name=full_name, reset_url=RESET_PASSWORD_URL + token
+        ),
+        _TOKEN_TTLS[1],
+    ),
+    "welcome": (
+        "Welcome to ClubCompass!",
+        lambda full_name, token: _render_welcome_email(full_name=full_name),
+        None,
+    ),
+}
+
+# Tokens in queued jobs are encrypted, so Redis never holds a usable reset
+# or verification link; the key is derived from SECRET_KEY
+_outbox_cipher = Fernet(base64.urlsafe_b64encode(
+    hashlib.sha256(b"email-outbox:" + settings.SECRET_KEY.encode()).digest()
+))
+
+# Emails waiting to be sent (kind and parameters, rendered at send time),
+# pushed by _send_email when EMAIL_OUTBOX_ENABLED and drained by
+# app.workers.email_worker (or the scheduled drain_email_outbox Lambda).
+# Failed SMTP sends wait in the retry sorted set, scored by when they are due.
+EMAIL_OUTBOX_KEY = "email:outbox"
+EMAIL_RETRY_KEY = "email:outbox:retry"
+EMAIL_MAX_RETRIES = 5
+EMAIL_RETRY_BASE_SECONDS = 30
+
+
+class SMTPPool:
+    """
+    Bounded pool of authenticated SMTP sessions shared across threads
+
+    At most max_connections sessions are open at once. Idle sessions are
+    health-checked with NOOP before reuse, and each one is retired after
+    max_messages sends so long-lived connections get rotated.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        max_connections: int = 5,
+        max_messages: int = 100,
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.max_messages = max_messages
+        self._idle: "queue.LifoQueue[Tuple[smtplib.SMTP, int]]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_connections)
+
+    def _open(self) -> smtplib.SMTP:
+        """Connect, upgrade to TLS and log in"""
+        conn = smtplib.SMTP(self.host, self.port, timeout=10)
+        conn.starttls()
+        conn.login(self.user, self.password)
+        return conn
+
+    @staticmethod
+    def _close(conn: smtplib.SMTP) -> None:
+        """Close a session, ignoring errors from a dead socket"""
+        try:
+            conn.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+
+    def _acquire(self) -> Tuple[smtplib.SMTP, int]:
+        """Take a live session (and its message count), opening one if none is idle"""
+        while True:
+            try:
+                conn, sent = self._idle.get_nowait()
+            except queue.Empty:
+                return self._open(), 0
+            try:
+                if conn.noop()[0] == 250:
+                    return conn, sent
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close(conn)
+
+    def send(self, msg: MIMEMultipart) -> None:
+        """
+        Send a message on a pooled session
+
+        A server that dropped the session between the health check and the
+        send gets one reconnect.
+
+        Raises:
+            smtplib.SMTPException, OSError: If the message could not be sent
+        """
+        with self._slots:
+            conn, sent = self._acquire()
+            try:
+                try:
+                    conn.send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    self._close(conn)
+                    conn, sent = self._open(), 0
+                    conn.send_message(msg)
+            except BaseException:
+                self._close(conn)
+                raise
+
+            if sent + 1 >= self.max_messages:
+                self._close(conn)
+            else:
+                self._idle.put((conn, sent + 1))
 
 
 class EmailService:
-    """Service for sending emails"""
+    """
+    Service for sending emails
+
+    Nothing here runs on the event loop: routes hand sends to BackgroundTasks
+    (threadpool). With EMAIL_OUTBOX_ENABLED, _send_email only pushes to the
+    Redis outbox and SMTP I/O happens in the outbox worker; otherwise (or if
+    Redis is down) the email is sent from that background thread.
+    """
 
     def __init__(self):
         self.smtp_host = settings.SMTP_HOST
         self.smtp_port = settings.SMTP_PORT
         self.smtp_user = settings.SMTP_USER
         self.smtp_password = settings.SMTP_PASSWORD
-        self.from_email = settings.SMTP_USER or "noreply@clubcompass.com"
 
-    def _send_email(self, to_email: str, subject: str, html_content: str) -> bool:
+        # Authenticated SMTP sessions reused across sends in this process
+        self._pool = SMTPPool(
+            self.smtp_host,
+            self.smtp_port,
+            self.smtp_user,
+            self.smtp_password,
+        )
+
+    def _deliver(self, to_email: str, subject: str, html_content: str) -> None:
         """
-        Send an email using SMTP
+        Send one message on a pooled SMTP session
+
+        Raises:
+            smtplib.SMTPException, OSError: If the message could not be sent
+        """
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = subject
+        msg['From'] = FROM_EMAIL
+        msg['To'] = to_email
+
+        # Attach HTML content
+        html_part = MIMEText(html_content, 'html')
+        msg.attach(html_part)
+
+        self._pool.send(msg)
+
+        print(f"[Email Service] Email sent successfully to {to_email}")
+
+    def _send_email(self, to_email: str, kind: str, full_name: str, token: Optional[str] = None) -> bool:
+        """
+        Queue an email on the Redis outbox, or send it now
 
         Args:
             to_email: Recipient email address
-            subject: Email subject
-            html_content: HTML email content
+            kind: Email kind, a key of _EMAILS
+            full_name: Recipient's full name
+            token: Verification or reset token the email links to, if any
 
         Returns:
-            True if email sent successfully, False otherwise
+            True if email was queued or sent, False otherwise
         """
+        subject, render, _ = _EMAILS[kind]
+
         # Skip email sending if SMTP not configured
         if not self.smtp_user or not self.smtp_password:
             print(f"[Email Service] SMTP not configured. Skipping email to {to_email}")
             print(f"[Email Service] Subject: {subject}")
-            print(f"[Email Service] Content: {html_content[:200]}...")
             return False
 
+        if settings.EMAIL_OUTBOX_ENABLED:
+            job = {
+                "to_email": to_email,
+                "kind": kind,
+                "full_name": full_name,
+                "token": _outbox_cipher.encrypt(token.encode()).decode() if token else None,
+                "attempt": 0,
+            }
+            try:
+                redis_client.rpush(EMAIL_OUTBOX_KEY, orjson.dumps(job))
+                return True
+            except redis.RedisError:
+                pass  # Redis unavailable, send inline below
+
         try:
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = self.from_email
-            msg['To'] = to_email
-
-            # Attach HTML content
-            html_part = MIMEText(html_content, 'html')
-            msg.attach(html_part)
-
-            # Send email
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_user, self.smtp_password)
-                server.send_message(msg)
-
-            print(f"[Email Service] Email sent successfully to {to_email}")
+            self._deliver(to_email, subject, render(full_name, token))
             return True
-
         except Exception as e:
             print(f"[Email Service] Failed to send email to {to_email}: {str(e)}")
             return False
@@ -75,55 +300,7 @@ class EmailService:
         Returns:
             True if email sent successfully
         """
-        verification_url = f"{settings.ALLOWED_ORIGINS[0]}/auth/verify-email?token={verification_token}"
-
-        subject = "Verify Your ClubCompass Email"
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: linear-gradient(135deg, #000000 0%, #8B0000 100%);
-                          color: white; padding: 30px; text-align: center; border-radius: 10px 10px 0 0; }}
-                .content {{ background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px; }}
-                .button {{ display: inline-block; padding: 12px 30px; background: #8B0000;
-                          color: white; text-decoration: none; border-radius: 5px; margin: 20px 0; }}
-                .footer {{ text-align: center; margin-top: 20px; font-size: 12px; color: #666; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>ClubCompass</h1>
-                    <p>Welcome to BMSCE Club Discovery Platform</p>
-                </div>
-                <div class="content">
-                    <h2>Hi {full_name},</h2>
-                    <p>Thank you for registering with ClubCompass! To complete your registration,
-                       please verify your email address by clicking the button below:</p>
-
-                    <div style="text-align: center;">
-                        <a href="{verification_url}" class="button">Verify Email Address</a>
-                    </div>
-
-                    <p>Or copy and paste this link into your browser:</p>
-                    <p style="word-break: break-all; color: #666;">{verification_url}</p>
-
-                    <p><strong>This link will expire in 24 hours.</strong></p>
-
-                    <p>If you didn't create an account with ClubCompass, you can safely ignore this email.</p>
-                </div>
-                <div class="footer">
-                    <p>&copy; 2024 ClubCompass - BMS College of Engineering</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-
-        return self._send_email(to_email, subject, html_content)
+        return self._send_email(to_email, "verify", full_name, verification_token)
 
     def send_password_reset_email(self, to_email: str, full_name: str, reset_token: str) -> bool:
         """
@@ -137,61 +314,7 @@ class EmailService:
         Returns:
             True if email sent successfully
         """
-        reset_url = f"{settings.ALLOWED_ORIGINS[0]}/auth/reset-password?token={reset_token}"
-
-        subject = "Reset Your ClubCompass Password"
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: linear-gradient(135deg, #000000 0%, #8B0000 100%);
-                          color: white; padding: 30px; text-align: center; border-radius: 10px 10px 0 0; }}
-                .content {{ background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px; }}
-                .button {{ display: inline-block; padding: 12px 30px; background: #8B0000;
-                          color: white; text-decoration: none; border-radius: 5px; margin: 20px 0; }}
-                .footer {{ text-align: center; margin-top: 20px; font-size: 12px; color: #666; }}
-                .warning {{ background: #fff3cd; border-left: 4px solid #ffc107; padding: 15px;
-                           margin: 20px 0; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>ClubCompass</h1>
-                    <p>Password Reset Request</p>
-                </div>
-                <div class="content">
-                    <h2>Hi {full_name},</h2>
-                    <p>We received a request to reset your password. Click the button below to
-                       create a new password:</p>
-
-                    <div style="text-align: center;">
-                        <a href="{reset_url}" class="button">Reset Password</a>
-                    </div>
-
-                    <p>Or copy and paste this link into your browser:</p>
-                    <p style="word-break: break-all; color: #666;">{reset_url}</p>
-
-                    <p><strong>This link will expire in 1 hour.</strong></p>
-
-                    <div class="warning">
-                        <strong>⚠️ Security Notice:</strong><br>
-                        If you didn't request a password reset, please ignore this email.
-                        Your password will remain unchanged.
-                    </div>
-                </div>
-                <div class="footer">
-                    <p>&copy; 2024 ClubCompass - BMS College of Engineering</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-
-        return self._send_email(to_email, subject, html_content)
+        return self._send_email(to_email, "reset", full_name, reset_token)
 
     def send_welcome_email(self, to_email: str, full_name: str) -> bool:
         """
@@ -204,67 +327,87 @@ class EmailService:
         Returns:
             True if email sent successfully
         """
-        subject = "Welcome to ClubCompass!"
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: linear-gradient(135deg, #000000 0%, #8B0000 100%);
-                          color: white; padding: 30px; text-align: center; border-radius: 10px 10px 0 0; }}
-                .content {{ background: #f9f9f9; padding: 30px; border-radius: 0 0 10px 10px; }}
-                .button {{ display: inline-block; padding: 12px 30px; background: #8B0000;
-                          color: white; text-decoration: none; border-radius: 5px; margin: 20px 0; }}
-                .footer {{ text-align: center; margin-top: 20px; font-size: 12px; color: #666; }}
-                .feature {{ background: white; padding: 15px; margin: 10px 0; border-radius: 5px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🎉 Welcome to ClubCompass!</h1>
-                    <p>Your Journey Begins Here</p>
-                </div>
-                <div class="content">
-                    <h2>Hi {full_name},</h2>
-                    <p>Congratulations! Your email has been verified and your account is now active.</p>
-
-                    <h3>What you can do now:</h3>
-
-                    <div class="feature">
-                        📚 <strong>Browse Clubs:</strong> Explore 60+ clubs across co-curricular,
-                        extra-curricular, and department categories.
-                    </div>
-
-                    <div class="feature">
-                        🎯 <strong>Take Assessment:</strong> Get personalized club recommendations
-                        based on your interests and goals.
-                    </div>
-
-                    <div class="feature">
-                        ✨ <strong>Join Clubs:</strong> Connect with clubs that match your passions
-                        and build your profile.
-                    </div>
-
-                    <div style="text-align: center;">
-                        <a href="{settings.ALLOWED_ORIGINS[0]}" class="button">Start Exploring</a>
-                    </div>
-                </div>
-                <div class="footer">
-                    <p>&copy; 2024 ClubCompass - BMS College of Engineering</p>
-                </div>
-            </div>
-        </body>
-        </html>
+        return self._send_email(to_email, "welcome", full_name)
+
+    def _send_job(self, raw_job: str) -> None:
+        """Render and send one outbox job, scheduling a backed-off retry on SMTP failure"""
+        job = orjson.loads(raw_job)
+        subject, render, token_ttl = _EMAILS[job["kind"]]
+
+        token = None
+        if job["token"]:
+            try:
+                token = _outbox_cipher.decrypt(
+                    job["token"].encode(), ttl=int(token_ttl.total_seconds())
+                ).decode()
+            except InvalidToken:
+                # The link inside would already have expired
+                print(f"[Email Service] Dropping expired email to {job['to_email']}")
+                return
+
+        try:
+            self._deliver(job["to_email"], subject, render(job["full_name"], token))
+        except (smtplib.SMTPException, OSError) as e:
+            job["attempt"] += 1
+            if job["attempt"] > EMAIL_MAX_RETRIES:
+                print(f"[Email Service] Giving up on email to {job['to_email']}: {str(e)}")
+                return
+            due = time.time() + EMAIL_RETRY_BASE_SECONDS * 2 ** (job["attempt"] - 1)
+            redis_client.zadd(EMAIL_RETRY_KEY, {orjson.dumps(job): due})
+            print(f"[Email Service] Retry {job['attempt']} for {job['to_email']} scheduled: {str(e)}")
+
+    def _requeue_due_retries(self) -> None:
+        """Move retries whose backoff has elapsed back onto the outbox"""
+        for raw_job in redis_client.zrangebyscore(EMAIL_RETRY_KEY, 0, time.time()):
+            # Only the worker that removes the entry requeues it
+            if redis_client.zrem(EMAIL_RETRY_KEY, raw_job):
+                redis_client.rpush(EMAIL_OUTBOX_KEY, raw_job)
+
+    def process_next(self, timeout: int = 5) -> bool:
         """
+        Block until an outbox job arrives and send it
 
-        return self._send_email(to_email, subject, html_content)
+        Args:
+            timeout: Seconds to wait for a job
+
+        Returns:
+            True if a job was processed, False on timeout
+        """
+        self._requeue_due_retries()
+        item = redis_client.blpop([EMAIL_OUTBOX_KEY], timeout=timeout)
+        if item is None:
+            return False
+        self._send_job(item[1])
+        return True
+
+    def drain_outbox(self, max_jobs: int = 100) -> int:
+        """
+        Send queued emails without blocking
+
+        Args:
+            max_jobs: Upper bound on jobs sent in this call
+
+        Returns:
+            Number of jobs processed
+        """
+        self._requeue_due_retries()
+        processed = 0
+        while processed < max_jobs:
+            raw_job = redis_client.lpop(EMAIL_OUTBOX_KEY)
+            if raw_job is None:
+                break
+            self._send_job(raw_job)
+            processed += 1
+        return processed
 
     @staticmethod
     def generate_token() -> str:
-        """Generate a secure random token"""
+        """
+        Generate a secure random token
+
+        32 random bytes, base64url-encoded once by token_urlsafe (43 chars).
+        Only its 16-byte keyed digest is stored (see security.hash_token).
+        """
         return secrets.token_urlsafe(32)
 
     @staticmethod
@@ -272,13 +415,16 @@ class EmailService:
         """
         Get token expiry datetime
 
+        Naive UTC, matching the token expiry columns.
+
         Args:
             hours: Number of hours until expiry (default: 1)
 
         Returns:
             Expiry datetime
         """
-        return datetime.utcnow() + timedelta(hours=hours)
+        ttl = _TOKEN_TTLS.get(hours) or timedelta(hours=hours)
+        return datetime.utcnow() + ttl
 
 
 # Create email service instance
@@ -4,18 +4,125 @@ User service for handling user profile and membership operations
 This service separates user profile management from authentication (AuthService)
 following the Single Responsibility Principle and Clean Code practices.
 """
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session, selectinload
-from sqlalchemy import desc
+from datetime import datetime
+from typing import Iterable, List, Optional, Dict, Any, Tuple
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session, selectinload
+from sqlalchemy import desc, event, func, inspect, literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB
 from fastapi import HTTPException, status
+import orjson
+import redis
+import time
 import uuid
 
+from app.core.redis_client import redis_client
 from app.models.user import User
 from app.models.club import Membership
 from app.models.assessment import Assessment
 from app.schemas.user import UserUpdate, UserPreferences
 
 
+# Every authenticated request resolves its token's user, so lookups by id and
+# email are served from a short-lived per-process copy backed by Redis and
+# dropped once a transaction that changed the user row commits. Only profile
+# and flag columns are cached; the password and token hashes stay in Postgres
+# and load on access.
+USER_CACHE_PREFIX = "user:id:"
+USER_EMAIL_CACHE_PREFIX = "user:email:"
+USER_CACHE_TTL_SECONDS = 60
+# Other workers cannot clear this process's copy, so it lives only briefly
+USER_LOCAL_CACHE_TTL_SECONDS = 5
+USER_LOCAL_CACHE_MAXSIZE = 10_000
+
+_CACHED_USER_COLUMNS = (
+    "email",
+    "full_name",
+    "email_verified",
+    "is_active",
+    "is_admin",
+    "created_at",
+    "updated_at",
+    "preferences",
+)
+
+_local_user_cache: Dict[str, Tuple[float, Any]] = {}
+
+# Session.info key collecting (user ids, emails) to drop when the transaction commits
+_PENDING_USER_CACHE_KEYS = "pending_user_cache_keys"
+
+
+def _cache_get(key: str) -> Any:
+    """Return the cached JSON value for key from this process or Redis"""
+    entry = _local_user_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    try:
+        cached = redis_client.get(key)
+    except redis.RedisError:
+        return None
+    if cached is None:
+        return None
+    value = orjson.loads(cached)
+    _local_put(key, value)
+    return value
+
+
+def _cache_set(key: str, value: Any) -> None:
+    _local_put(key, value)
+    try:
+        redis_client.set(key, orjson.dumps(value), ex=USER_CACHE_TTL_SECONDS)
+    except redis.RedisError:
+        pass
+
+
+def _local_put(key: str, value: Any) -> None:
+    if key not in _local_user_cache and len(_local_user_cache) >= USER_LOCAL_CACHE_MAXSIZE:
+        _local_user_cache.pop(next(iter(_local_user_cache)))  # oldest entry
+    _local_user_cache[key] = (time.monotonic() + USER_LOCAL_CACHE_TTL_SECONDS, value)
+
+
+def invalidate_user_cache(user_ids: Iterable[uuid.UUID], emails: Iterable[str] = ()) -> None:
+    """Drop cached users by id, and their email-to-id entries if given"""
+    keys = [f"{USER_CACHE_PREFIX}{user_id}" for user_id in user_ids]
+    keys += [f"{USER_EMAIL_CACHE_PREFIX}{email.lower()}" for email in emails]
+    for key in keys:
+        _local_user_cache.pop(key, None)
+    if not keys:
+        return
+    try:
+        redis_client.delete(*keys)
+    except redis.RedisError:
+        pass  # Entries expire on their own within USER_CACHE_TTL_SECONDS
+
+
+def _user_snapshot(user: User) -> Dict[str, Any]:
+    """JSON-ready copy of the cached columns of a loaded user"""
+    snapshot = {column: getattr(user, column) for column in _CACHED_USER_COLUMNS}
+    snapshot["id"] = str(user.id)
+    snapshot["created_at"] = user.created_at.isoformat()
+    snapshot["updated_at"] = user.updated_at.isoformat()
+    return snapshot
+
+
+def _user_from_snapshot(db: Session, user_id: uuid.UUID, snapshot: Dict[str, Any]) -> User:
+    """
+    Attach a cached user to the session without a query
+
+    The instance is merged as if freshly loaded, so changes to it flush as
+    usual and uncached columns load on first access.
+    """
+    existing = db.identity_map.get(db.identity_key(User, user_id))
+    if existing is not None:
+        return existing
+
+    user = User(**{column: snapshot[column] for column in _CACHED_USER_COLUMNS})
+    user.id = user_id
+    user.created_at = datetime.fromisoformat(snapshot["created_at"])
+    user.updated_at = datetime.fromisoformat(snapshot["updated_at"])
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
 class UserService:
     """
     Service for handling user profile operations
@@ -32,32 +139,53 @@ class UserService:
     """
 
     @staticmethod
-    def get_user_by_id(db: Session, user_id: str) -> Optional[User]:
+    def get_user_by_id(db: Session, user_id: uuid.UUID) -> Optional[User]:
         """
-        Get user by ID with relationships loaded
+        Get user by ID without loading relationships (cached)
+
+        Used by token authentication and the update and delete paths, which
+        never touch memberships.
 
         Args:
             db: Database session
-            user_id: User UUID as string
+            user_id: User UUID
 
         Returns:
             User object or None if not found
         """
-        try:
-            user_uuid = uuid.UUID(user_id)
-            return (
-                db.query(User)
-                .options(selectinload(User.memberships))
-                .filter(User.id == user_uuid)
-                .first()
-            )
-        except ValueError:
-            return None
+        key = f"{USER_CACHE_PREFIX}{user_id}"
+        snapshot = _cache_get(key)
+        if snapshot is not None:
+            return _user_from_snapshot(db, user_id, snapshot)
+
+        user = db.get(User, user_id)
+        if user is not None and not db.is_modified(user):
+            _cache_set(key, _user_snapshot(user))
+        return user
+
+    @staticmethod
+    def get_user_by_id_with_memberships(db: Session, user_id: uuid.UUID) -> Optional[User]:
+        """
+        Get user by ID with memberships loaded (for profile reads)
+
+        Args:
+            db: Database session
+            user_id: User UUID
+
+        Returns:
+            User object or None if not found
+        """
+        return (
+            db.query(User)
+            .options(selectinload(User.memberships))
+            .filter(User.id == user_id)
+            .first()
+        )
 
     @staticmethod
     def get_user_by_email(db: Session, email: str) -> Optional[User]:
         """
-        Get user by email
+        Get user by email (cached as a pointer to the cached user by ID)
 
         Args:
             db: Database session
@@ -66,7 +194,19 @@ class UserService:
         Returns:
             User object or None if not found
         """
-        return db.query(User).filter(User.email == email.lower()).first()
+        key = f"{USER_EMAIL_CACHE_PREFIX}{email.lower()}"
+        cached_id = _cache_get(key)
+        if cached_id is not None:
+            user = UserService.get_user_by_id(db, uuid.UUID(cached_id))
+            # The entry may outlive a bulk delete; fall through to the query
+            if user is not None and user.email == email.lower():
+                return user
+
+        user = db.query(User).filter(User.email == email).first()
+        if user is not None and not db.is_modified(user):
+            _cache_set(key, str(user.id))
+            _cache_set(f"{USER_CACHE_PREFIX}{user.id}", _user_snapshot(user))
+        return user
 
     @staticmethod
     def get_all_users(
@@ -89,38 +229,40 @@ class UserService:
         Returns:
             Tuple of (users list, total count)
         """
-        query = db.query(User)
+        # COUNT(*) OVER () counts every filtered row before LIMIT/OFFSET, so
+        # the page and the total come back in one query
+        stmt = select(User, func.count().over().label("total"))
 
         # Apply filters
         if is_active is not None:
-            query = query.filter(User.is_active == is_active)
+            stmt = stmt.where(User.is_active == is_active)
 
         if is_admin is not None:
-            query = query.filter(User.is_admin == is_admin)
-
-        # Get total count
-        total = query.count()
+            stmt = stmt.where(User.is_admin == is_admin)
 
         # Apply pagination and sorting
-        users = (
-            query.order_by(desc(User.created_at))
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
-
-        return users, total
+        rows = db.execute(
+            stmt.order_by(desc(User.created_at)).offset(skip).limit(limit)
+        ).all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+
+        # An empty page carries no total; only a page past the end needs a count
+        if skip > 0:
+            filtered = stmt.with_only_columns(User.id).subquery()
+            return [], db.scalar(select(func.count()).select_from(filtered))
+        return [], 0
 
     @staticmethod
     def update_user_profile(
-        db: Session, user_id: str, user_data: UserUpdate
+        db: Session, user_id: uuid.UUID, user_data: UserUpdate
     ) -> Optional[User]:
         """
         Update user profile information
 
         Args:
             db: Database session
-            user_id: User UUID as string
+            user_id: User UUID
             user_data: UserUpdate schema with fields to update
 
         Returns:
@@ -147,20 +289,19 @@ class UserService:
                 setattr(user, field, value)
 
         db.commit()
-        db.refresh(user)
 
         return user
 
     @staticmethod
     def update_user_preferences(
-        db: Session, user_id: str, preferences: Dict[str, Any]
+        db: Session, user_id: uuid.UUID, preferences: Dict[str, Any]
     ) -> Optional[User]:
         """
         Update user preferences (stored as JSON)
 
         Args:
             db: Database session
-            user_id: User UUID as string
+            user_id: User UUID
             preferences: Dictionary of user preferences
 
         Returns:
@@ -174,137 +315,128 @@ class UserService:
             "language": "en"
         }
         """
-        user = UserService.get_user_by_id(db, user_id)
-        if not user:
-            return None
-
-        # Update preferences (merge with existing)
-        if user.preferences is None:
-            user.preferences = {}
-
-        user.preferences.update(preferences)
-
-        # Mark as modified for SQLAlchemy to detect JSON changes
-        from sqlalchemy.orm.attributes import flag_modified
-        flag_modified(user, "preferences")
-
+        # Merge server-side with jsonb ||: one atomic round trip, so
+        # concurrent updates to different keys don't overwrite each other
+        merged = func.coalesce(User.preferences, literal({}, JSONB)).op("||")(
+            literal(preferences, JSONB)
+        )
+        user = db.scalars(
+            update(User)
+            .where(User.id == user_id)
+            .values(preferences=merged)
+            .returning(User)
+        ).first()
         db.commit()
-        db.refresh(user)
+        invalidate_user_cache([user_id])
 
         return user
 
     @staticmethod
-    def get_user_memberships(db: Session, user_id: str) -> List[Membership]:
+    def get_user_memberships(db: Session, user_id: uuid.UUID) -> List[Membership]:
         """
         Get all club memberships for a user
 
         Args:
             db: Database session
-            user_id: User UUID as string
+            user_id: User UUID
 
         Returns:
             List of Membership objects with club information loaded
         """
-        try:
-            user_uuid = uuid.UUID(user_id)
-            return (
-                db.query(Membership)
-                .options(selectinload(Membership.club))
-                .filter(Membership.user_id == user_uuid)
-                .order_by(desc(Membership.joined_at))
-                .all()
-            )
-        except ValueError:
-            return []
+        return (
+            db.query(Membership)
+            .options(selectinload(Membership.club))
+            .filter(Membership.user_id == user_id)
+            .order_by(desc(Membership.joined_at))
+            .all()
+        )
 
     @staticmethod
     def get_user_assessments(
-        db: Session, user_id: str, limit: int = 10
+        db: Session, user_id: uuid.UUID, limit: int = 10
     ) -> List[Assessment]:
         """
         Get assessment history for a user
 
         Args:
             db: Database session
-            user_id: User UUID as string
+            user_id: User UUID
             limit: Maximum number of assessments to return
 
         Returns:
             List of Assessment objects ordered by creation date (most recent first)
         """
-        try:
-            user_uuid = uuid.UUID(user_id)
-            return (
-                db.query(Assessment)
-                .options(selectinload(Assessment.recommendations))
-                .filter(Assessment.user_id == user_uuid)
-                .order_by(desc(Assessment.created_at))
-                .limit(limit)
-                .all()
-            )
-        except ValueError:
-            return []
+        return (
+            db.query(Assessment)
+            .options(selectinload(Assessment.recommendations))
+            .filter(Assessment.user_id == user_id)
+            .order_by(desc(Assessment.created_at))
+            .limit(limit)
+            .all()
+        )
 
     @staticmethod
     def update_user_status(
-        db: Session, user_id: str, is_active: bool
+        db: Session, user_id: uuid.UUID, is_active: bool
     ) -> Optional[User]:
         """
         Activate or deactivate user account (Admin only)
 
         Args:
             db: Database session
-            user_id: User UUID as string
+            user_id: User UUID
             is_active: New active status
 
         Returns:
             Updated User object or None if not found
         """
-        user = UserService.get_user_by_id(db, user_id)
-        if not user:
-            return None
-
-        user.is_active = is_active
-
+        # One UPDATE ... RETURNING instead of a SELECT followed by an UPDATE
+        user = db.scalars(
+            update(User)
+            .where(User.id == user_id)
+            .values(is_active=is_active)
+            .returning(User)
+        ).first()
         db.commit()
-        db.refresh(user)
+        invalidate_user_cache([user_id])
 
         return user
 
     @staticmethod
     def update_user_role(
-        db: Session, user_id: str, is_admin: bool
+        db: Session, user_id: uuid.UUID, is_admin: bool
     ) -> Optional[User]:
         """
         Grant or revoke admin role (Admin only)
 
         Args:
             db: Database session
-            user_id: User UUID as string
+            user_id: User UUID
             is_admin: New admin status
 
         Returns:
             Updated User object or None if not found
         """
-        user = UserService.get_user_by_id(db, user_id)
-        if not user:
-            return None
-
-        user.is_admin = is_admin
-
+        # One UPDATE ... RETURNING instead of a SELECT followed by an UPDATE
+        user = db.scalars(
+            update(User)
+            .where(User.id == user_id)
+            .values(is_admin=is_admin)
+            .returning(User)
+        ).first()
         db.commit()
-        db.refresh(user)
+        invalidate_user_cache([user_id])
 
         return user
 
     @staticmethod
-    def delete_user(db: Session, user_id: str) -> bool:
+    def delete_user(db: Session, user_id: uuid.UUID) -> bool:
         """
         Delete user account (Soft delete recommended in production)
 
         Args:
             db: Database session
-            user_id: User UUID as string
+            user_id: User UUID
 
         Returns:
             True if deleted, False if not found
@@ -326,57 +458,74 @@ class UserService:
         return True
 
     @staticmethod
-    def get_user_statistics(db: Session, user_id: str) -> Dict[str, Any]:
+    def get_user_statistics(db: Session, user_id: uuid.UUID) -> Dict[str, Any]:
         """
         Get user statistics (for profile dashboard)
 
         Args:
             db: Database session
-            user_id: User UUID as string
+            user_id: User UUID
 
         Returns:
             Dictionary with user statistics
         """
-        try:
-            user_uuid = uuid.UUID(user_id)
-
-            # Count memberships
-            memberships_count = (
-                db.query(Membership)
-                .filter(Membership.user_id == user_uuid, Membership.status == "active")
-                .count()
+        # One round trip: the active-membership count as a scalar
+        # subquery alongside a single aggregate pass over assessments
+        memberships_count = (
+            select(func.count())
+            .select_from(Membership)
+            .where(Membership.user_id == user_id, Membership.status == "active")
+            .scalar_subquery()
+        )
+        assessment_stats = (
+            select(
+                func.count().label("total"),
+                func.max(Assessment.created_at).label("latest"),
             )
-
-            # Count assessments
-            assessments_count = (
-                db.query(Assessment)
-                .filter(Assessment.user_id == user_uuid)
-                .count()
+            .where(Assessment.user_id == user_id)
+            .subquery()
+        )
+        stats = db.execute(
+            select(
+                memberships_count.label("memberships"),
+                assessment_stats.c.total,
+                assessment_stats.c.latest,
             )
+        ).one()
+
+        return {
+            "total_clubs_joined": stats.memberships,
+            "total_assessments_taken": stats.total,
+            "latest_assessment_date": (
+                stats.latest.isoformat() if stats.latest else None
+            ),
+        }
+
+
+# Core UPDATE/DELETE statements above skip these and invalidate explicitly
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _on_user_changed(mapper, connection, target) -> None:
+    # Runs mid-flush, before the change is visible to other connections;
+    # only record the keys here and drop them once the commit lands
+    user_ids, emails = object_session(target).info.setdefault(
+        _PENDING_USER_CACHE_KEYS, (set(), set())
+    )
+    user_ids.add(target.id)
+    emails.update((target.email, *inspect(target).attrs.email.history.deleted))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    pending = session.info.pop(_PENDING_USER_CACHE_KEYS, None)
+    if pending:
+        invalidate_user_cache(*pending)
 
-            # Get most recent assessment
-            latest_assessment = (
-                db.query(Assessment)
-                .filter(Assessment.user_id == user_uuid)
-                .order_by(desc(Assessment.created_at))
-                .first()
-            )
 
-            return {
-                "total_clubs_joined": memberships_count,
-                "total_assessments_taken": assessments_count,
-                "latest_assessment_date": (
-                    latest_assessment.created_at.isoformat()
-                    if latest_assessment
-                    else None
-                ),
-            }
-        except ValueError:
-            return {
-                "total_clubs_joined": 0,
-                "total_assessments_taken": 0,
-                "latest_assessment_date": None,
-            }
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_users(session: Session) -> None:
+    session.info.pop(_PENDING_USER_CACHE_KEYS, None)
 
 
 # Create singleton instance
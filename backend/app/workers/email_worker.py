@@ -0,0 +1,32 @@
+"""
+Email outbox worker
+
+Sends the emails request handlers queue on Redis. Run one or more with:
+
+    python -m app.workers.email_worker
+"""
+import time
+
+import redis
+
+from app.services.email_service import email_service
+
+
+def main() -> None:
+    """Process outbox jobs until interrupted"""
+    print("[Email Worker] Waiting for jobs")
+    while True:
+        try:
+            email_service.process_next(timeout=5)
+        except redis.RedisError as e:
+            print(f"[Email Worker] Redis unavailable: {e}")
+            time.sleep(5)
+        except Exception as e:
+            print(f"[Email Worker] Dropping malformed job: {e}")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        pass
@@ -3,11 +3,28 @@ AWS Lambda Handler for ClubCompass API
 Wraps the FastAPI application for serverless deployment
 """
 from mangum import Mangum
+from sqlalchemy import text
+
+from app.database import engine
 from app.main import app
+from app.services.email_service import email_service
+
+# Open the first pooled DB connection during Lambda init instead of on the
+# first request; pool_pre_ping revalidates it after a freeze/thaw
+try:
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+except Exception as e:
+    print(f"[Lambda] Database warm-up failed, connecting on first request: {e}")
 
 # Create Lambda handler
 handler = Mangum(app, lifespan="off")
 
+
+def drain_email_outbox(event, context):
+    """Scheduled handler: send emails queued by the API"""
+    return {"sent": email_service.drain_outbox(max_jobs=200)}
+
 # For local testing
 if __name__ == "__main__":
     import uvicorn
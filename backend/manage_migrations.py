@@ -12,11 +12,20 @@ Usage:
     python manage_migrations.py current        # Show current revision
     python manage_migrations.py history        # Show migration history
     python manage_migrations.py check          # Check if migrations are needed
+    python manage_migrations.py repl           # Run several commands in one session
 """
+import functools
+import shlex
 import sys
-import subprocess
 from pathlib import Path
 
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
+BACKEND_DIR = Path(__file__).parent
+
 # Color codes for terminal output
 GREEN = '\033[92m'
 YELLOW = '\033[93m'
@@ -30,15 +39,19 @@ def print_colored(message: str, color: str = RESET):
     print(f"{color}{message}{RESET}")
 
 
-def run_alembic_command(command: list[str]) -> int:
-    """Run an alembic command and return exit code"""
+@functools.lru_cache(maxsize=None)
+def get_alembic_config() -> Config:
+    """Load alembic.ini with paths resolved relative to this script (once per process)"""
+    cfg = Config(str(BACKEND_DIR / "alembic.ini"))
+    cfg.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    return cfg
+
+
+def run_alembic_command(func, *args, **kwargs) -> int:
+    """Run an alembic command in-process and return an exit code"""
     try:
-        result = subprocess.run(
-            ["python", "-m", "alembic"] + command,
-            cwd=Path(__file__).parent,
-            check=False
-        )
-        return result.returncode
+        func(get_alembic_config(), *args, **kwargs)
+        return 0
     except Exception as e:
         print_colored(f"Error running alembic: {e}", RED)
         return 1
@@ -57,7 +70,7 @@ def cmd_init():
 
     # Stamp the database at head revision
     print_colored("\n📌 Stamping database at 'head' revision...", BLUE)
-    return run_alembic_command(["stamp", "head"])
+    return run_alembic_command(command.stamp, "head")
 
 
 def cmd_create(message: str = None):
@@ -68,13 +81,13 @@ def cmd_create(message: str = None):
         return 1
 
     print_colored(f"📝 Creating new migration: {message}", BLUE)
-    return run_alembic_command(["revision", "--autogenerate", "-m", message])
+    return run_alembic_command(command.revision, message=message, autogenerate=True)
 
 
 def cmd_upgrade(revision: str = "head"):
     """Upgrade database to a specific revision or head"""
     print_colored(f"⬆️  Upgrading database to: {revision}", BLUE)
-    return run_alembic_command(["upgrade", revision])
+    return run_alembic_command(command.upgrade, revision)
 
 
 def cmd_downgrade(revision: str = "-1"):
@@ -87,54 +100,91 @@ def cmd_downgrade(revision: str = "-1"):
         print_colored("Aborted.", RED)
         return 1
 
-    return run_alembic_command(["downgrade", revision])
+    return run_alembic_command(command.downgrade, revision)
 
 
 def cmd_current():
     """Show current database revision"""
     print_colored("📍 Current database revision:", BLUE)
-    return run_alembic_command(["current"])
+    return run_alembic_command(command.current)
 
 
 def cmd_history():
     """Show migration history"""
     print_colored("📚 Migration history:", BLUE)
-    return run_alembic_command(["history", "--verbose"])
+    return run_alembic_command(command.history, verbose=True)
 
 
 def cmd_check():
     """Check if database is up to date"""
     print_colored("🔍 Checking migration status...", BLUE)
 
-    # Get current revision
-    result = subprocess.run(
-        ["python", "-m", "alembic", "current"],
-        cwd=Path(__file__).parent,
-        capture_output=True,
-        text=True
-    )
-
-    current = result.stdout.strip()
-
-    # Get head revision
-    result = subprocess.run(
-        ["python", "-m", "alembic", "heads"],
-        cwd=Path(__file__).parent,
-        capture_output=True,
-        text=True
-    )
-
-    head = result.stdout.strip()
+    try:
+        from app.database import engine
+
+        # Head revisions come from the scripts, current ones from alembic_version
+        cfg = get_alembic_config()
+        head = set(ScriptDirectory.from_config(cfg).get_heads())
+        connection = cfg.attributes.get("connection")
+        if connection is not None:
+            current = set(MigrationContext.configure(connection).get_current_heads())
+        else:
+            with engine.connect() as connection:
+                current = set(MigrationContext.configure(connection).get_current_heads())
+    except Exception as e:
+        print_colored(f"Error checking migrations: {e}", RED)
+        return 1
 
     if current == head:
         print_colored("✅ Database is up to date!", GREEN)
         return 0
     else:
         print_colored("⚠️  Database needs migration!", YELLOW)
-        print(f"Current: {current}")
-        print(f"Head: {head}")
+        print(f"Current: {', '.join(sorted(current)) or 'none'}")
+        print(f"Head: {', '.join(sorted(head))}")
+        return 1
+
+
+def cmd_repl():
+    """Run commands interactively, sharing one Alembic config and DB connection"""
+    from app.database import engine
+
+    print_colored("🔁 Migration shell - type a command (e.g. check, upgrade head), or 'exit'", BLUE)
+    cfg = get_alembic_config()
+    try:
+        connection = engine.connect()
+    except Exception as e:
+        print_colored(f"Error connecting to database: {e}", RED)
         return 1
 
+    with connection:
+        # env.py and cmd_check pick up this connection instead of opening their own
+        cfg.attributes["connection"] = connection
+        try:
+            while True:
+                try:
+                    argv = shlex.split(input("migrate> "))
+                except EOFError:
+                    print()
+                    break
+                if not argv:
+                    continue
+                if argv[0].lower() in ("exit", "quit"):
+                    break
+                if argv[0].lower() == "repl":
+                    continue
+
+                dispatch(argv)
+                # Commit whatever the command left open; Alembic does not
+                # commit a transaction it found already begun
+                if connection.in_transaction():
+                    connection.commit()
+        finally:
+            if connection.in_transaction():
+                connection.rollback()
+            del cfg.attributes["connection"]
+    return 0
+
 
 def print_usage():
     """Print usage information"""
@@ -148,6 +198,7 @@ def print_usage():
     print(f"  {GREEN}python manage_migrations.py current{RESET}            Show current revision")
     print(f"  {GREEN}python manage_migrations.py history{RESET}            Show migration history")
     print(f"  {GREEN}python manage_migrations.py check{RESET}              Check if migrations needed")
+    print(f"  {GREEN}python manage_migrations.py repl{RESET}               Run several commands in one session")
     print()
     print("Examples:")
     print(f'  {YELLOW}python manage_migrations.py create "Add user roles"{RESET}')
@@ -155,31 +206,38 @@ def print_usage():
     print(f'  {YELLOW}python manage_migrations.py downgrade -1{RESET}')
 
 
-def main():
-    """Main entry point"""
-    if len(sys.argv) < 2:
-        print_usage()
-        return 1
-
-    command = sys.argv[1].lower()
+def dispatch(argv: list[str]) -> int:
+    """Run one command given as [name, *args]"""
+    command_name = argv[0].lower()
+    arg = argv[1] if len(argv) > 1 else None
 
     commands = {
         "init": cmd_init,
-        "create": lambda: cmd_create(sys.argv[2] if len(sys.argv) > 2 else None),
-        "upgrade": lambda: cmd_upgrade(sys.argv[2] if len(sys.argv) > 2 else "head"),
-        "downgrade": lambda: cmd_downgrade(sys.argv[2] if len(sys.argv) > 2 else "-1"),
+        "create": lambda: cmd_create(arg),
+        "upgrade": lambda: cmd_upgrade(arg or "head"),
+        "downgrade": lambda: cmd_downgrade(arg or "-1"),
         "current": cmd_current,
         "history": cmd_history,
         "check": cmd_check,
+        "repl": cmd_repl,
         "help": lambda: (print_usage(), 0)[1],
     }
 
-    if command not in commands:
-        print_colored(f"Unknown command: {command}", RED)
+    if command_name not in commands:
+        print_colored(f"Unknown command: {command_name}", RED)
+        print_usage()
+        return 1
+
+    return commands[command_name]()
+
+
+def main():
+    """Main entry point"""
+    if len(sys.argv) < 2:
         print_usage()
         return 1
 
-    return commands[command]()
+    return dispatch(sys.argv[1:])
 
 
 if __name__ == "__main__":
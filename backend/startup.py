@@ -4,10 +4,31 @@ Startup script for backend with automatic database migration.
 Uses Python to avoid bash line ending issues on Windows.
 """
 import os
+import socket
 import sys
 import time
 import subprocess
-import psycopg2
+from urllib.parse import urlparse
+
+
+def _port_open(address) -> bool:
+    """Cheap TCP probe of the database host and port."""
+    try:
+        socket.create_connection(address, timeout=0.5).close()
+        return True
+    except OSError:
+        return False
+
+
+def _login_succeeds(db_url: str) -> bool:
+    """Full connection check; psycopg2 (and libpq) is only loaded here."""
+    import psycopg2
+
+    try:
+        psycopg2.connect(db_url, connect_timeout=2).close()
+        return True
+    except psycopg2.OperationalError:
+        return False
 
 
 def wait_for_db():
@@ -17,23 +38,24 @@ def wait_for_db():
     print("⏳ Waiting for database to be ready...")
 
     db_url = os.getenv("DATABASE_URL", "postgresql://postgres:password@db:5432/clubcompass")
+    parsed = urlparse(db_url)
+    address = (parsed.hostname or "localhost", parsed.port or 5432)
     max_retries = 30
+    deadline = time.monotonic() + 60
     retry_count = 0
 
-    while retry_count < max_retries:
-        try:
-            # Try to connect to the database
-            conn = psycopg2.connect(db_url)
-            conn.close()
+    while retry_count < max_retries and time.monotonic() < deadline:
+        if _port_open(address) and _login_succeeds(db_url):
             print("✅ Database is ready!")
             print("")
             return True
-        except psycopg2.OperationalError:
-            retry_count += 1
-            print(f"Postgres is unavailable - sleeping (attempt {retry_count}/{max_retries})")
-            time.sleep(1)
 
-    print("❌ Failed to connect to database after 30 attempts")
+        retry_count += 1
+        delay = min(2.0, 0.1 * 2 ** (retry_count - 1))
+        print(f"Postgres is unavailable - sleeping {delay:.1f}s (attempt {retry_count}/{max_retries})")
+        time.sleep(delay)
+
+    print(f"❌ Failed to connect to database after {retry_count} attempts")
     sys.exit(1)
 
 
@@ -64,14 +86,21 @@ def start_server():
     print("✅ Backend setup complete! Starting server...")
     print("")
 
-    # Use os.execvp to replace the current process with uvicorn
-    os.execvp("uvicorn", [
-        "uvicorn",
+    # Serve from this interpreter rather than exec'ing a fresh one; code
+    # reloading is for development only (UVICORN_RELOAD=1). A single worker
+    # process avoids uvicorn's spawn-based multiprocess startup entirely;
+    # loop/http "auto" pick uvloop and httptools from uvicorn[standard].
+    import uvicorn
+
+    uvicorn.run(
         "app.main:app",
-        "--host", "0.0.0.0",
-        "--port", "8000",
-        "--reload"
-    ])
+        host="0.0.0.0",
+        port=8000,
+        reload=os.getenv("UVICORN_RELOAD", "0") == "1",
+        workers=1,
+        lifespan="on",
+        server_header=False,
+    )
 
 
 if __name__ == "__main__":
@@ -1,10 +1,23 @@
 """
 Pytest configuration and shared fixtures
 """
+import functools
+import os
+import uuid
+
+# Minimum bcrypt cost for test fixtures (~256x cheaper than the default 12);
+# hashes are still real $2b$ bcrypt. Set before the app reads its settings.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+import orjson
 import pytest
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import CITEXT, JSONB, UUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import functions
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -15,39 +28,173 @@ from app.models.club import Club, Membership
 from app.core.security import get_password_hash, create_access_token
 
 
-# Create in-memory SQLite database for testing
+# Fixed ids for the fixture users, so their access tokens can be minted once
+TEST_USER_ID = uuid.UUID("00000000-0000-4000-8000-000000000001")
+TEST_ADMIN_ID = uuid.UUID("00000000-0000-4000-8000-000000000002")
+
+def _fast_json(response):
+    """Parse response bodies with orjson instead of the stdlib json module"""
+    response.json = lambda **kwargs: orjson.loads(response.content)
+    return response
+
+
+class FastClient(TestClient):
+    """TestClient whose responses parse JSON with orjson"""
+
+    def request(self, *args, **kwargs):
+        return _fast_json(super().request(*args, **kwargs))
+
+
+class FastAsyncClient(AsyncClient):
+    """AsyncClient whose responses parse JSON with orjson"""
+
+    async def request(self, *args, **kwargs):
+        return _fast_json(await super().request(*args, **kwargs))
+
+
+# Create in-memory SQLite database for testing. It lives in this process's
+# single StaticPool connection, so each pytest-xdist worker (`pytest -n auto`)
+# gets its own private database without any per-worker naming.
 SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///:memory:"
 
 engine = create_engine(
     SQLALCHEMY_TEST_DATABASE_URL,
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
+    query_cache_size=1200,  # Same compiled SQL cache size as app.database.engine
 )
 
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Mirrors app.database.SessionLocal, including keeping instances loaded on commit
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 
-@pytest.fixture(scope="function")
-def db_session() -> Generator:
+# SQLite stand-ins for the Postgres-only column types, so create_all can
+# build the schema: case-insensitive text like CITEXT, and SQLite's JSON.
+# UUIDs are stored as 32 hex characters; a bare "UUID" column would get
+# numeric affinity and turn all-digit ids into floats.
+@compiles(UUID, "sqlite")
+def _compile_uuid_sqlite(type_, compiler, **kw):
+    return "CHAR(32)"
+
+
+@compiles(CITEXT, "sqlite")
+def _compile_citext_sqlite(type_, compiler, **kw):
+    return "TEXT COLLATE NOCASE"
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+# now() in SQLite's own DATETIME text format, so server-generated
+# timestamps compare correctly with bound datetimes (CURRENT_TIMESTAMP
+# drops the fraction, and sorts before an equal bound value)
+@compiles(functions.now, "sqlite")
+def _compile_now_sqlite(element, compiler, **kw):
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+# pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy
+# emit BEGIN itself so the per-test nested transactions work. StaticPool
+# keeps this one connection, so the PRAGMAs hold for the whole session:
+# no journal or sync work on commit, and foreign keys enforced like Postgres.
+@event.listens_for(engine, "connect")
+def _configure_sqlite(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+    for pragma in (
+        "synchronous=OFF",
+        "journal_mode=MEMORY",
+        "temp_store=MEMORY",
+        "foreign_keys=ON",
+    ):
+        dbapi_connection.execute(f"PRAGMA {pragma}")
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(connection):
+    connection.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session")
+def db_schema() -> Generator:
     """
-    Create a fresh database session for each test
+    Create the tables once for the whole test session
     """
-    # Create tables
     Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
 
-    session = TestingSessionLocal()
+@pytest.fixture(scope="function")
+def db_session(db_schema) -> Generator:
+    """
+    Create a database session whose changes are rolled back after each test
+
+    The session joins an outer transaction and turns its own commits into
+    SAVEPOINT releases, so code under test can commit freely.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
     try:
         yield session
     finally:
         session.close()
-        # Drop all tables after test
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def app_instance():
+    """
+    The application under test, with its OpenAPI schema built up front
+    """
+    app.openapi()
+    return app
+
+
+@pytest.fixture(scope="session")
+def app_client(app_instance) -> Generator:
+    """
+    Create one test client, and run the app lifespan once, for the session
+    """
+    with FastClient(app_instance) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+async def async_client(app_instance) -> AsyncGenerator:
+    """
+    Async client calling the app in-process, for firing requests concurrently
+
+    No lifespan and no database override; tests that need the test
+    database use async_db_client instead.
+    """
+    async with FastAsyncClient(transport=ASGITransport(app=app_instance), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture
+async def async_db_client(app_instance, async_client, db_session) -> AsyncGenerator:
+    """
+    Async client whose requests use this test's database session
+    """
+    def override_get_db():
+        try:
+            yield db_session
+        finally:
+            pass
+
+    app_instance.dependency_overrides[get_db] = override_get_db
+    yield async_client
+    app_instance.dependency_overrides.clear()
 
 
 @pytest.fixture(scope="function")
-def client(db_session) -> Generator:
+def client(app_instance, app_client, db_session) -> Generator:
     """
-    Create a test client with database session override
+    Share the session test client with this test's database session
     """
     def override_get_db():
         try:
@@ -55,50 +202,63 @@ def client(db_session) -> Generator:
         finally:
             pass
 
-    app.dependency_overrides[get_db] = override_get_db
+    app_instance.dependency_overrides[get_db] = override_get_db
+    yield app_client
+    app_instance.dependency_overrides.clear()
+
+
+@functools.lru_cache(maxsize=None)
+def hash_fixture_password(password: str) -> str:
+    """
+    bcrypt hash of a fixture password, computed once per test session
+    """
+    return get_password_hash(password)
 
-    with TestClient(app) as test_client:
-        yield test_client
 
-    app.dependency_overrides.clear()
+@pytest.fixture
+def make_user(db_session):
+    """
+    Factory for users inserted directly through the ORM
+
+    Seeds users without going through /auth/register; each distinct
+    password is hashed only once per session.
+    """
+    def _make_user(email: str, password: str = "TestPass123!", **overrides) -> User:
+        fields = {
+            "full_name": "Test User",
+            "email_verified": True,
+            "is_active": True,
+            "is_admin": False,
+            **overrides,
+        }
+        user = User(email=email, password_hash=hash_fixture_password(password), **fields)
+        db_session.add(user)
+        db_session.commit()
+        return user
+
+    return _make_user
 
 
 @pytest.fixture
-def test_user(db_session) -> User:
+def test_user(make_user) -> User:
     """
     Create a test user
     """
-    user = User(
-        email="test@bmsce.ac.in",
-        password_hash=get_password_hash("TestPass123!"),
-        full_name="Test User",
-        email_verified=True,
-        is_active=True,
-        is_admin=False
-    )
-    db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
-    return user
+    return make_user("test@bmsce.ac.in", id=TEST_USER_ID)
 
 
 @pytest.fixture
-def test_admin(db_session) -> User:
+def test_admin(make_user) -> User:
     """
     Create a test admin user
     """
-    admin = User(
-        email="admin@bmsce.ac.in",
-        password_hash=get_password_hash("AdminPass123!"),
+    return make_user(
+        "admin@bmsce.ac.in",
+        id=TEST_ADMIN_ID,
+        password="AdminPass123!",
         full_name="Admin User",
-        email_verified=True,
-        is_active=True,
-        is_admin=True
+        is_admin=True,
     )
-    db_session.add(admin)
-    db_session.commit()
-    db_session.refresh(admin)
-    return admin
 
 
 @pytest.fixture
@@ -121,22 +281,36 @@ def test_club(db_session) -> Club:
     return club
 
 
+@pytest.fixture(scope="session")
+def user_token() -> str:
+    """
+    Access token for test_user, minted once per session
+    """
+    return create_access_token(data={"sub": str(TEST_USER_ID), "email": "test@bmsce.ac.in"})
+
+
+@pytest.fixture(scope="session")
+def admin_token() -> str:
+    """
+    Access token for test_admin, minted once per session
+    """
+    return create_access_token(data={"sub": str(TEST_ADMIN_ID), "email": "admin@bmsce.ac.in"})
+
+
 @pytest.fixture
-def auth_headers(test_user) -> dict:
+def auth_headers(test_user, user_token) -> dict:
     """
     Create authentication headers for regular user
     """
-    access_token = create_access_token(data={"sub": test_user.email})
-    return {"Authorization": f"Bearer {access_token}"}
+    return {"Authorization": f"Bearer {user_token}"}
 
 
 @pytest.fixture
-def admin_headers(test_admin) -> dict:
+def admin_headers(test_admin, admin_token) -> dict:
     """
     Create authentication headers for admin user
     """
-    access_token = create_access_token(data={"sub": test_admin.email})
-    return {"Authorization": f"Bearer {access_token}"}
+    return {"Authorization": f"Bearer {admin_token}"}
 
 
 @pytest.fixture
@@ -177,12 +351,8 @@ def sample_clubs(db_session) -> list[Club]:
         ),
     ]
 
-    for club in clubs:
-        db_session.add(club)
-
+    # One multi-row INSERT ... RETURNING; instances stay loaded after commit
+    db_session.add_all(clubs)
     db_session.commit()
 
-    for club in clubs:
-        db_session.refresh(club)
-
     return clubs
@@ -2,21 +2,18 @@
 Integration tests for authentication flow
 Tests complete auth workflows with real database
 """
+import asyncio
+
 import pytest
-from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
-from app.main import app
 from app.models.user import User
 
 
-client = TestClient(app)
-
-
 class TestAuthenticationFlow:
     """Integration tests for complete authentication flows"""
 
-    def test_complete_registration_login_flow(self, db_session: Session):
+    def test_complete_registration_login_flow(self, client, db_session: Session):
         """Test complete user registration and login flow"""
         # Step 1: Register a new user
         register_data = {
@@ -66,17 +63,10 @@ class TestAuthenticationFlow:
         assert me_json["email"] == register_data["email"]
         assert me_json["full_name"] == register_data["full_name"]
 
-    def test_duplicate_registration_prevented(self, db_session: Session):
+    def test_duplicate_registration_prevented(self, client, make_user):
         """Test that duplicate email registration is prevented"""
-        # Register first user
-        register_data = {
-            "full_name": "First User",
-            "email": "duplicate@bmsce.ac.in",
-            "password": "TestPassword123",
-        }
-
-        first_response = client.post("/api/v1/auth/register", json=register_data)
-        assert first_response.status_code == 201
+        # Seed the first user directly; only the second registration is under test
+        make_user("duplicate@bmsce.ac.in", full_name="First User")
 
         # Try to register with same email
         duplicate_data = {
@@ -88,7 +78,7 @@ class TestAuthenticationFlow:
         duplicate_response = client.post("/api/v1/auth/register", json=duplicate_data)
         assert duplicate_response.status_code == 409
 
-    def test_invalid_credentials_login(self, test_user):
+    def test_invalid_credentials_login(self, client, test_user):
         """Test that invalid credentials are rejected"""
         # Try to login with wrong password
         login_data = {
@@ -99,7 +89,7 @@ class TestAuthenticationFlow:
         response = client.post("/api/v1/auth/login", json=login_data)
         assert response.status_code == 401
 
-    def test_non_bmsce_email_rejected(self):
+    async def test_non_bmsce_email_rejected(self, async_client):
         """Test that non-BMSCE emails are rejected"""
         register_data = {
             "full_name": "External User",
@@ -107,10 +97,10 @@ class TestAuthenticationFlow:
             "password": "TestPassword123",
         }
 
-        response = client.post("/api/v1/auth/register", json=register_data)
+        response = await async_client.post("/api/v1/auth/register", json=register_data)
         assert response.status_code == 422  # Validation error
 
-    def test_weak_password_rejected(self):
+    async def test_weak_password_rejected(self, async_client):
         """Test that weak passwords are rejected"""
         register_data = {
             "full_name": "Weak Password User",
@@ -118,10 +108,24 @@ class TestAuthenticationFlow:
             "password": "weak",
         }
 
-        response = client.post("/api/v1/auth/register", json=register_data)
+        response = await async_client.post("/api/v1/auth/register", json=register_data)
         assert response.status_code == 422  # Validation error
 
-    def test_token_refresh_flow(self, auth_headers):
+    async def test_invalid_registrations_rejected_concurrently(self, async_client):
+        """Test that concurrent invalid registrations are each rejected"""
+        invalid_registrations = [
+            {"full_name": "External User", "email": "user@gmail.com", "password": "TestPassword123"},
+            {"full_name": "Weak Password User", "email": "weakpass@bmsce.ac.in", "password": "weak"},
+            {"full_name": "No Password User", "email": "nopass@bmsce.ac.in"},
+        ]
+
+        responses = await asyncio.gather(*(
+            async_client.post("/api/v1/auth/register", json=register_data)
+            for register_data in invalid_registrations
+        ))
+        assert [response.status_code for response in responses] == [422, 422, 422]
+
+    def test_token_refresh_flow(self, client, auth_headers):
         """Test token refresh flow"""
         # First, get a valid token by logging in
         # (auth_headers fixture provides this)
@@ -137,7 +141,7 @@ class TestAuthenticationFlow:
 class TestUserProfileFlow:
     """Integration tests for user profile operations"""
 
-    def test_get_current_user_profile(self, auth_headers):
+    def test_get_current_user_profile(self, client, auth_headers):
         """Test getting current user profile"""
         response = client.get("/api/v1/auth/me", headers=auth_headers)
 
@@ -148,22 +152,22 @@ class TestUserProfileFlow:
         assert "full_name" in user_data
         assert "is_admin" in user_data
 
-    def test_unauthorized_access_blocked(self):
+    def test_unauthorized_access_blocked(self, app_client):
         """Test that unauthorized access is blocked"""
-        response = client.get("/api/v1/auth/me")
+        response = app_client.get("/api/v1/auth/me")
         assert response.status_code == 401
 
-    def test_invalid_token_rejected(self):
+    def test_invalid_token_rejected(self, app_client):
         """Test that invalid tokens are rejected"""
         headers = {"Authorization": "Bearer invalid_token"}
-        response = client.get("/api/v1/auth/me", headers=headers)
+        response = app_client.get("/api/v1/auth/me", headers=headers)
         assert response.status_code == 401
 
 
 class TestPasswordSecurity:
     """Integration tests for password security"""
 
-    def test_password_hashed_in_database(self, db_session: Session):
+    def test_password_hashed_in_database(self, client, db_session: Session):
         """Test that passwords are hashed in database"""
         register_data = {
             "full_name": "Hashed Password User",
@@ -183,7 +187,7 @@ class TestPasswordSecurity:
         assert user_in_db.password_hash != register_data["password"]
         assert user_in_db.password_hash.startswith("$2b$")  # bcrypt hash prefix
 
-    def test_password_not_returned_in_response(self):
+    def test_password_not_returned_in_response(self, app_client):
         """Test that password is not returned in API responses"""
         register_data = {
             "full_name": "No Password Response User",
@@ -191,7 +195,7 @@ class TestPasswordSecurity:
             "password": "MySecretPassword123",
         }
 
-        response = client.post("/api/v1/auth/register", json=register_data)
+        response = app_client.post("/api/v1/auth/register", json=register_data)
         assert response.status_code == 201
 
         user_data = response.json()["user"]
@@ -2,23 +2,25 @@
 Integration tests for club management flow
 Tests complete club workflows with real database
 """
+import asyncio
+
 import pytest
-from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
-from app.main import app
 from app.models.club import Club
 
 
-client = TestClient(app)
+pytestmark = [pytest.mark.integration, pytest.mark.slow]
+
+CLUBS_URL = "/api/v1/clubs/"
 
 
 class TestClubBrowsingFlow:
     """Integration tests for club browsing functionality"""
 
-    def test_get_all_clubs(self):
+    async def test_get_all_clubs(self, async_client):
         """Test getting all clubs"""
-        response = client.get("/api/v1/clubs/")
+        response = await async_client.get(CLUBS_URL)
 
         assert response.status_code == 200
         data = response.json()
@@ -26,9 +28,9 @@ class TestClubBrowsingFlow:
         assert "meta" in data
         assert isinstance(data["data"], list)
 
-    def test_filter_clubs_by_category(self, test_club):
+    async def test_filter_clubs_by_category(self, async_db_client, test_club):
         """Test filtering clubs by category"""
-        response = client.get("/api/v1/clubs/?category=cocurricular")
+        response = await async_db_client.get(f"{CLUBS_URL}?category=cocurricular")
 
         assert response.status_code == 200
         data = response.json()
@@ -38,9 +40,9 @@ class TestClubBrowsingFlow:
         for club in data["data"]:
             assert club["category"] == "cocurricular"
 
-    def test_search_clubs(self, test_club):
+    async def test_search_clubs(self, async_db_client, test_club):
         """Test searching clubs by name"""
-        response = client.get(f"/api/v1/clubs/?search={test_club['name'][:5]}")
+        response = await async_db_client.get(f"{CLUBS_URL}?search={test_club['name'][:5]}")
 
         assert response.status_code == 200
         data = response.json()
@@ -50,34 +52,34 @@ class TestClubBrowsingFlow:
         club_names = [club["name"] for club in data["data"]]
         assert any(test_club["name"] in name for name in club_names)
 
-    def test_pagination_works(self):
+    async def test_pagination_works(self, async_client):
         """Test club list pagination"""
-        # Get first page
-        response1 = client.get("/api/v1/clubs/?page=1&per_page=5")
+        # The two pages are independent reads; fetch them concurrently
+        response1, response2 = await asyncio.gather(
+            async_client.get(f"{CLUBS_URL}?page=1&per_page=5"),
+            async_client.get(f"{CLUBS_URL}?page=2&per_page=5"),
+        )
         assert response1.status_code == 200
-        data1 = response1.json()
-
-        # Get second page
-        response2 = client.get("/api/v1/clubs/?page=2&per_page=5")
         assert response2.status_code == 200
+        data1 = response1.json()
         data2 = response2.json()
 
         # Pages should have different clubs (if enough clubs exist)
         if data1["meta"]["total"] > 5:
             assert data1["data"] != data2["data"]
 
-    def test_get_club_by_slug(self, test_club):
+    async def test_get_club_by_slug(self, async_db_client, test_club):
         """Test getting a specific club by slug"""
-        response = client.get(f"/api/v1/clubs/{test_club['slug']}")
+        response = await async_db_client.get(f"{CLUBS_URL}{test_club['slug']}")
 
         assert response.status_code == 200
         club_data = response.json()
         assert club_data["slug"] == test_club["slug"]
         assert club_data["name"] == test_club["name"]
 
-    def test_get_nonexistent_club(self):
+    async def test_get_nonexistent_club(self, async_client):
         """Test getting a club that doesn't exist"""
-        response = client.get("/api/v1/clubs/nonexistent-club-slug")
+        response = await async_client.get(f"{CLUBS_URL}nonexistent-club-slug")
 
         # Should return 404 or null
         assert response.status_code in [200, 404]
@@ -89,7 +91,7 @@ class TestClubBrowsingFlow:
 class TestClubManagementFlow:
     """Integration tests for club management (admin operations)"""
 
-    def test_create_club_as_admin(self, admin_headers, db_session: Session):
+    async def test_create_club_as_admin(self, async_db_client, admin_headers, db_session: Session):
         """Test creating a new club as admin"""
         club_data = {
             "name": "Integration Test Club",
@@ -99,8 +101,8 @@ class TestClubManagementFlow:
             "description": "This club is created during integration tests",
         }
 
-        response = client.post(
-            "/api/v1/clubs/",
+        response = await async_db_client.post(
+            CLUBS_URL,
             json=club_data,
             headers=admin_headers,
         )
@@ -117,7 +119,7 @@ class TestClubManagementFlow:
         assert club_in_db is not None
         assert club_in_db.name == club_data["name"]
 
-    def test_create_club_without_auth_blocked(self):
+    async def test_create_club_without_auth_blocked(self, async_client):
         """Test that creating club without auth is blocked"""
         club_data = {
             "name": "Unauthorized Club",
@@ -125,10 +127,10 @@ class TestClubManagementFlow:
             "category": "cocurricular",
         }
 
-        response = client.post("/api/v1/clubs/", json=club_data)
+        response = await async_client.post(CLUBS_URL, json=club_data)
         assert response.status_code in [401, 403, 422]
 
-    def test_create_club_as_regular_user_blocked(self, auth_headers):
+    async def test_create_club_as_regular_user_blocked(self, async_db_client, auth_headers):
         """Test that creating club as regular user is blocked"""
         club_data = {
             "name": "Regular User Club",
@@ -136,23 +138,23 @@ class TestClubManagementFlow:
             "category": "cocurricular",
         }
 
-        response = client.post(
-            "/api/v1/clubs/",
+        response = await async_db_client.post(
+            CLUBS_URL,
             json=club_data,
             headers=auth_headers,
         )
 
         assert response.status_code == 403
 
-    def test_update_club_as_admin(self, test_club, admin_headers, db_session: Session):
+    async def test_update_club_as_admin(self, async_db_client, test_club, admin_headers, db_session: Session):
         """Test updating a club as admin"""
         update_data = {
             "tagline": "Updated tagline for integration test",
             "description": "Updated description",
         }
 
-        response = client.patch(
-            f"/api/v1/clubs/{test_club['id']}",
+        response = await async_db_client.patch(
+            f"{CLUBS_URL}{test_club['id']}",
             json=update_data,
             headers=admin_headers,
         )
@@ -169,7 +171,7 @@ class TestClubManagementFlow:
         assert club_in_db is not None
         assert club_in_db.tagline == update_data["tagline"]
 
-    def test_delete_club_as_admin(self, admin_headers, db_session: Session):
+    async def test_delete_club_as_admin(self, async_db_client, admin_headers, db_session: Session):
         """Test deleting a club as admin"""
         # First create a club to delete
         club_data = {
@@ -178,8 +180,8 @@ class TestClubManagementFlow:
             "category": "cocurricular",
         }
 
-        create_response = client.post(
-            "/api/v1/clubs/",
+        create_response = await async_db_client.post(
+            CLUBS_URL,
             json=club_data,
             headers=admin_headers,
         )
@@ -187,8 +189,8 @@ class TestClubManagementFlow:
         club_id = create_response.json()["id"]
 
         # Delete the club
-        delete_response = client.delete(
-            f"/api/v1/clubs/{club_id}",
+        delete_response = await async_db_client.delete(
+            f"{CLUBS_URL}{club_id}",
             headers=admin_headers,
         )
         assert delete_response.status_code == 204
@@ -203,10 +205,10 @@ class TestClubManagementFlow:
 class TestClubMembershipFlow:
     """Integration tests for club membership operations"""
 
-    def test_join_club(self, test_club, auth_headers):
+    async def test_join_club(self, async_db_client, test_club, auth_headers):
         """Test joining a club"""
-        response = client.post(
-            f"/api/v1/clubs/{test_club['id']}/join",
+        response = await async_db_client.post(
+            f"{CLUBS_URL}{test_club['id']}/join",
             headers=auth_headers,
         )
 
@@ -215,39 +217,39 @@ class TestClubMembershipFlow:
         assert membership_data["club_id"] == test_club["id"]
         assert membership_data["role"] == "member"
 
-    def test_join_club_without_auth_blocked(self, test_club):
+    async def test_join_club_without_auth_blocked(self, async_db_client, test_club):
         """Test that joining club without auth is blocked"""
-        response = client.post(f"/api/v1/clubs/{test_club['id']}/join")
+        response = await async_db_client.post(f"{CLUBS_URL}{test_club['id']}/join")
         assert response.status_code == 401
 
-    def test_leave_club(self, test_club, auth_headers):
+    async def test_leave_club(self, async_db_client, test_club, auth_headers):
         """Test leaving a club"""
         # First join the club
-        join_response = client.post(
-            f"/api/v1/clubs/{test_club['id']}/join",
+        join_response = await async_db_client.post(
+            f"{CLUBS_URL}{test_club['id']}/join",
             headers=auth_headers,
         )
         assert join_response.status_code in [200, 201, 409]  # 409 if already member
 
         # Then leave the club
-        leave_response = client.delete(
-            f"/api/v1/clubs/{test_club['id']}/leave",
+        leave_response = await async_db_client.delete(
+            f"{CLUBS_URL}{test_club['id']}/leave",
             headers=auth_headers,
         )
         assert leave_response.status_code == 204
 
-    def test_join_same_club_twice(self, test_club, auth_headers):
+    async def test_join_same_club_twice(self, async_db_client, test_club, auth_headers):
         """Test that joining the same club twice is handled properly"""
         # Join first time
-        response1 = client.post(
-            f"/api/v1/clubs/{test_club['id']}/join",
+        response1 = await async_db_client.post(
+            f"{CLUBS_URL}{test_club['id']}/join",
             headers=auth_headers,
         )
         assert response1.status_code in [200, 201]
 
         # Join second time
-        response2 = client.post(
-            f"/api/v1/clubs/{test_club['id']}/join",
+        response2 = await async_db_client.post(
+            f"{CLUBS_URL}{test_club['id']}/join",
             headers=auth_headers,
         )
         # Should either succeed (idempotent) or return conflict
@@ -257,33 +259,33 @@ class TestClubMembershipFlow:
 class TestClubSearchAndFilter:
     """Integration tests for club search and filtering"""
 
-    def test_empty_search_returns_all_clubs(self):
+    async def test_empty_search_returns_all_clubs(self, async_client):
         """Test that empty search returns all clubs"""
-        response = client.get("/api/v1/clubs/?search=")
+        response = await async_client.get(f"{CLUBS_URL}?search=")
         assert response.status_code == 200
         data = response.json()
         assert "data" in data
 
-    def test_search_case_insensitive(self, test_club):
+    async def test_search_case_insensitive(self, async_db_client, test_club):
         """Test that search is case insensitive"""
         # Search with lowercase
-        response1 = client.get(f"/api/v1/clubs/?search={test_club['name'].lower()[:5]}")
+        response1 = await async_db_client.get(f"{CLUBS_URL}?search={test_club['name'].lower()[:5]}")
         assert response1.status_code == 200
 
         # Search with uppercase
-        response2 = client.get(f"/api/v1/clubs/?search={test_club['name'].upper()[:5]}")
+        response2 = await async_db_client.get(f"{CLUBS_URL}?search={test_club['name'].upper()[:5]}")
         assert response2.status_code == 200
 
-    def test_filter_by_invalid_category(self):
+    async def test_filter_by_invalid_category(self, async_client):
         """Test filtering by invalid category"""
-        response = client.get("/api/v1/clubs/?category=invalid_category")
+        response = await async_client.get(f"{CLUBS_URL}?category=invalid_category")
         # Should return empty list or validation error
         assert response.status_code in [200, 422]
 
-    def test_combined_search_and_filter(self, test_club):
+    async def test_combined_search_and_filter(self, async_db_client, test_club):
         """Test combining search and category filter"""
-        response = client.get(
-            f"/api/v1/clubs/?category={test_club['category']}&search={test_club['name'][:3]}"
+        response = await async_db_client.get(
+            f"{CLUBS_URL}?category={test_club['category']}&search={test_club['name'][:3]}"
         )
 
         assert response.status_code == 200
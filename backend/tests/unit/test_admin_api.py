@@ -1,49 +1,102 @@
 """
 Unit tests for Admin API endpoints
 """
+from uuid import UUID
+
 import pytest
 from fastapi import status
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.models.user import User
 from app.models.club import Club
 from app.models.assessment import Assessment
+from app.schemas.club import ClubResponse
+from app.schemas.user import UserResponse
 
 
 pytestmark = pytest.mark.admin
 
+DASHBOARD_STATS_URL = "/api/v1/admin/dashboard/stats"
+USERS_URL = "/api/v1/admin/users"
+CLUBS_URL = "/api/v1/admin/clubs"
+ACTIVITY_URL = "/api/v1/admin/activity"
+
+USER_KEYS = ("id", "email", "full_name", "is_admin", "is_active")
+CLUB_KEYS = ("id", "name", "slug", "category", "is_active", "is_featured")
+
+
+class PopularClub(BaseModel):
+    """Expected shape of a popular club entry in the dashboard stats"""
+
+    id: UUID
+    name: str
+    slug: str
+    category: str
+    member_count: int
+    view_count: int
+
+
+class DashboardStats(BaseModel):
+    """Expected shape of the dashboard stats response"""
+
+    total_users: int
+    total_clubs: int
+    total_memberships: int
+    total_assessments: int
+    new_users_30d: int
+    active_clubs: int
+    featured_clubs: int
+    popular_clubs: list[PopularClub]
+    recent_assessments_count: int
+    category_distribution: dict[str, int]
+
+
+# Built once per module; reusing a TypeAdapter skips rebuilding its validator
+USER_LIST_ADAPTER = TypeAdapter(list[UserResponse])
+CLUB_LIST_ADAPTER = TypeAdapter(list[ClubResponse])
+STATS_ADAPTER = TypeAdapter(DashboardStats)
+
+
+def _assert_list_shape(response, adapter, keys):
+    """Assert a 200 list response that validates and whose first item has every key, and return the list"""
+    assert response.status_code == status.HTTP_200_OK
+    items = response.json()
+
+    adapter.validate_python(items)
+    for item in items[:1]:
+        for key in keys:
+            assert key in item
+    return items
+
+
+@pytest.fixture
+def seeded_assessment(db_session: Session, test_user):
+    """Create a completed assessment for the test user"""
+    assessment = Assessment(
+        user_id=test_user.id,
+        responses={"enjoy": "coding", "time": "medium"}
+    )
+    db_session.add(assessment)
+    db_session.commit()
+    return assessment
+
 
 class TestAdminDashboardStats:
     """Tests for admin dashboard statistics endpoint"""
 
-    def test_get_dashboard_stats_as_admin(self, client, admin_headers, sample_clubs, test_user, db_session):
+    def test_get_dashboard_stats_as_admin(self, client, admin_headers, sample_clubs, seeded_assessment):
         """Test getting dashboard stats as admin - should succeed"""
-        # Create an assessment
-        assessment = Assessment(
-            user_id=test_user.id,
-            responses={"enjoy": "coding", "time": "medium"}
-        )
-        db_session.add(assessment)
-        db_session.commit()
-
         response = client.get(
-            "/api/v1/admin/dashboard/stats",
+            DASHBOARD_STATS_URL,
             headers=admin_headers
         )
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
 
-        # Verify structure
-        assert "total_users" in data
-        assert "total_clubs" in data
-        assert "total_memberships" in data
-        assert "total_assessments" in data
-        assert "new_users_30d" in data
-        assert "active_clubs" in data
-        assert "featured_clubs" in data
-        assert "popular_clubs" in data
-        assert "category_distribution" in data
+        # Verify structure, including each popular club entry
+        STATS_ADAPTER.validate_python(data)
 
         # Verify counts
         assert data["total_users"] >= 2  # admin + test_user
@@ -52,19 +105,10 @@ class TestAdminDashboardStats:
         assert data["active_clubs"] == 2  # 2 active clubs in sample_clubs
         assert data["featured_clubs"] == 1  # 1 featured club in sample_clubs
 
-        # Verify popular clubs structure
-        assert isinstance(data["popular_clubs"], list)
-        if len(data["popular_clubs"]) > 0:
-            club = data["popular_clubs"][0]
-            assert "id" in club
-            assert "name" in club
-            assert "slug" in club
-            assert "member_count" in club
-
     def test_get_dashboard_stats_as_user(self, client, auth_headers):
         """Test getting dashboard stats as regular user - should fail"""
         response = client.get(
-            "/api/v1/admin/dashboard/stats",
+            DASHBOARD_STATS_URL,
             headers=auth_headers
         )
 
@@ -73,7 +117,7 @@ class TestAdminDashboardStats:
 
     def test_get_dashboard_stats_without_auth(self, client):
         """Test getting dashboard stats without authentication - should fail"""
-        response = client.get("/api/v1/admin/dashboard/stats")
+        response = client.get(DASHBOARD_STATS_URL)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
@@ -84,28 +128,17 @@ class TestAdminUserManagement:
     def test_list_users_as_admin(self, client, admin_headers, test_user):
         """Test listing users as admin - should succeed"""
         response = client.get(
-            "/api/v1/admin/users",
+            USERS_URL,
             headers=admin_headers
         )
 
-        assert response.status_code == status.HTTP_200_OK
-        users = response.json()
-
-        assert isinstance(users, list)
+        users = _assert_list_shape(response, USER_LIST_ADAPTER, USER_KEYS)
         assert len(users) >= 2  # admin + test_user
 
-        # Verify user structure
-        user = users[0]
-        assert "id" in user
-        assert "email" in user
-        assert "full_name" in user
-        assert "is_admin" in user
-        assert "is_active" in user
-
     def test_list_users_with_pagination(self, client, admin_headers):
         """Test user listing with pagination"""
         response = client.get(
-            "/api/v1/admin/users?skip=0&limit=1",
+            f"{USERS_URL}?skip=0&limit=1",
             headers=admin_headers
         )
 
@@ -117,7 +150,7 @@ class TestAdminUserManagement:
     def test_get_user_by_id_as_admin(self, client, admin_headers, test_user):
         """Test getting specific user as admin - should succeed"""
         response = client.get(
-            f"/api/v1/admin/users/{test_user.id}",
+            f"{USERS_URL}/{test_user.id}",
             headers=admin_headers
         )
 
@@ -132,72 +165,35 @@ class TestAdminUserManagement:
         """Test getting non-existent user - should return 404"""
         fake_uuid = "00000000-0000-0000-0000-000000000000"
         response = client.get(
-            f"/api/v1/admin/users/{fake_uuid}",
+            f"{USERS_URL}/{fake_uuid}",
             headers=admin_headers
         )
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
-    def test_update_user_role(self, client, admin_headers, test_user, db_session):
-        """Test updating user admin role"""
-        # Make user an admin
-        response = client.patch(
-            f"/api/v1/admin/users/{test_user.id}/role?is_admin=true",
-            headers=admin_headers
-        )
-
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-
-        assert data["is_admin"] is True
-
-        # Verify in database
-        db_session.refresh(test_user)
-        assert test_user.is_admin is True
-
-        # Remove admin role
-        response = client.patch(
-            f"/api/v1/admin/users/{test_user.id}/role?is_admin=false",
-            headers=admin_headers
-        )
-
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-
-        assert data["is_admin"] is False
-
-    def test_update_user_status(self, client, admin_headers, test_user, db_session):
-        """Test activating/deactivating user"""
-        # Deactivate user
-        response = client.patch(
-            f"/api/v1/admin/users/{test_user.id}/status?is_active=false",
-            headers=admin_headers
-        )
-
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-
-        assert data["is_active"] is False
-
-        # Verify in database
+    @pytest.mark.parametrize("route, field, values", [
+        ("role", "is_admin", (True, False)),
+        ("status", "is_active", (False, True)),
+    ])
+    def test_update_user_flag(self, client, admin_headers, test_user, db_session, route, field, values):
+        """Test toggling a user's admin role or active status and back"""
+        for value in values:
+            response = client.patch(
+                f"{USERS_URL}/{test_user.id}/{route}?{field}={str(value).lower()}",
+                headers=admin_headers
+            )
+
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json()[field] is value
+
+        # Verify the final state in database
         db_session.refresh(test_user)
-        assert test_user.is_active is False
-
-        # Reactivate user
-        response = client.patch(
-            f"/api/v1/admin/users/{test_user.id}/status?is_active=true",
-            headers=admin_headers
-        )
-
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-
-        assert data["is_active"] is True
+        assert getattr(test_user, field) is values[-1]
 
     def test_list_users_as_regular_user(self, client, auth_headers):
         """Test listing users as regular user - should fail"""
         response = client.get(
-            "/api/v1/admin/users",
+            USERS_URL,
             headers=auth_headers
         )
 
@@ -210,29 +206,17 @@ class TestAdminClubManagement:
     def test_list_all_clubs_as_admin(self, client, admin_headers, sample_clubs):
         """Test listing all clubs including inactive as admin"""
         response = client.get(
-            "/api/v1/admin/clubs",
+            CLUBS_URL,
             headers=admin_headers
         )
 
-        assert response.status_code == status.HTTP_200_OK
-        clubs = response.json()
-
-        assert isinstance(clubs, list)
+        clubs = _assert_list_shape(response, CLUB_LIST_ADAPTER, CLUB_KEYS)
         assert len(clubs) == 3  # All clubs including inactive
 
-        # Verify club structure
-        club = clubs[0]
-        assert "id" in club
-        assert "name" in club
-        assert "slug" in club
-        assert "category" in club
-        assert "is_active" in club
-        assert "is_featured" in club
-
     def test_list_clubs_filter_inactive(self, client, admin_headers, sample_clubs):
         """Test filtering out inactive clubs"""
         response = client.get(
-            "/api/v1/admin/clubs?include_inactive=false",
+            f"{CLUBS_URL}?include_inactive=false",
             headers=admin_headers
         )
 
@@ -247,7 +231,7 @@ class TestAdminClubManagement:
         """Test toggling club featured status"""
         # Make club featured
         response = client.patch(
-            f"/api/v1/admin/clubs/{test_club.id}/featured?is_featured=true",
+            f"{CLUBS_URL}/{test_club.id}/featured?is_featured=true",
             headers=admin_headers
         )
 
@@ -262,7 +246,7 @@ class TestAdminClubManagement:
 
         # Remove featured status
         response = client.patch(
-            f"/api/v1/admin/clubs/{test_club.id}/featured?is_featured=false",
+            f"{CLUBS_URL}/{test_club.id}/featured?is_featured=false",
             headers=admin_headers
         )
 
@@ -275,7 +259,7 @@ class TestAdminClubManagement:
         """Test toggling club active status"""
         # Deactivate club
         response = client.patch(
-            f"/api/v1/admin/clubs/{test_club.id}/active?is_active=false",
+            f"{CLUBS_URL}/{test_club.id}/active?is_active=false",
             headers=admin_headers
         )
 
@@ -293,7 +277,7 @@ class TestAdminClubManagement:
         club_id = test_club.id
 
         response = client.delete(
-            f"/api/v1/admin/clubs/{club_id}",
+            f"{CLUBS_URL}/{club_id}",
             headers=admin_headers
         )
 
@@ -308,7 +292,7 @@ class TestAdminClubManagement:
         """Test deleting non-existent club - should return 404"""
         fake_uuid = "00000000-0000-0000-0000-000000000000"
         response = client.delete(
-            f"/api/v1/admin/clubs/{fake_uuid}",
+            f"{CLUBS_URL}/{fake_uuid}",
             headers=admin_headers
         )
 
@@ -318,14 +302,14 @@ class TestAdminClubManagement:
         """Test club operations as regular user - should fail"""
         # Try to toggle featured
         response = client.patch(
-            f"/api/v1/admin/clubs/{test_club.id}/featured?is_featured=true",
+            f"{CLUBS_URL}/{test_club.id}/featured?is_featured=true",
             headers=auth_headers
         )
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
         # Try to delete
         response = client.delete(
-            f"/api/v1/admin/clubs/{test_club.id}",
+            f"{CLUBS_URL}/{test_club.id}",
             headers=auth_headers
         )
         assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -337,7 +321,7 @@ class TestAdminActivityLog:
     def test_get_recent_activity(self, client, admin_headers, test_user, sample_clubs):
         """Test getting recent activity as admin"""
         response = client.get(
-            "/api/v1/admin/activity",
+            ACTIVITY_URL,
             headers=admin_headers
         )
 
@@ -356,7 +340,7 @@ class TestAdminActivityLog:
     def test_get_activity_with_limit(self, client, admin_headers):
         """Test getting activity with custom limit"""
         response = client.get(
-            "/api/v1/admin/activity?limit=5",
+            f"{ACTIVITY_URL}?limit=5",
             headers=admin_headers
         )
 
@@ -368,7 +352,7 @@ class TestAdminActivityLog:
     def test_get_activity_as_regular_user(self, client, auth_headers):
         """Test getting activity as regular user - should fail"""
         response = client.get(
-            "/api/v1/admin/activity",
+            ACTIVITY_URL,
             headers=auth_headers
         )
 
@@ -0,0 +1,39 @@
+"""
+Unit tests for the assessment scoring table
+"""
+import pytest
+
+from app.services.assessment_service import (
+    CLUB_SCORING_RULES,
+    SCORE_TABLE,
+    _CLUB_ROW,
+    _RESPONSE_INDEX,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+class TestScoreTable:
+    """Tests for the flattened scoring rules"""
+
+    def test_score_table_round_trips_rules(self):
+        """Test that every rule weight lands in its table slot"""
+        assert set(_CLUB_ROW) == set(CLUB_SCORING_RULES)
+
+        for slug, club_rules in CLUB_SCORING_RULES.items():
+            for question_key, weights in club_rules.items():
+                for answer_value, weight in weights.items():
+                    q, a = _RESPONSE_INDEX[(question_key, answer_value)]
+                    assert SCORE_TABLE[_CLUB_ROW[slug], q, a] == weight
+
+    def test_score_table_has_no_other_weights(self):
+        """Test that slots without a rule stay zero"""
+        total = sum(
+            weight
+            for club_rules in CLUB_SCORING_RULES.values()
+            for weights in club_rules.values()
+            for weight in weights.values()
+        )
+
+        assert int(SCORE_TABLE.sum()) == total
@@ -3,6 +3,7 @@ Unit tests for Clubs API endpoints
 """
 import pytest
 from fastapi import status
+from sqlalchemy import event
 
 pytestmark = pytest.mark.clubs
 
@@ -46,6 +47,45 @@ class TestListClubs:
 
         assert len(clubs) <= 1
 
+    def test_list_clubs_single_query(self, client, db_session, sample_clubs):
+        """Test that the list loads clubs and total in one query, with no per-club loads"""
+        selects = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            # Ignore the SAVEPOINT statements from the per-test transaction
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        engine = db_session.get_bind().engine
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            response = client.get("/api/v1/clubs/")
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["clubs"]) == 2
+        assert len(selects) == 1
+
+    def test_list_clubs_cursor_pagination(self, client, sample_clubs):
+        """Test walking the clubs list with next_cursor"""
+        first = client.get("/api/v1/clubs/?per_page=1").json()
+
+        assert len(first["clubs"]) == 1
+        assert first["next_cursor"]
+
+        second = client.get(f"/api/v1/clubs/?per_page=1&cursor={first['next_cursor']}").json()
+
+        assert len(second["clubs"]) == 1
+        assert second["clubs"][0]["id"] != first["clubs"][0]["id"]
+        assert second["next_cursor"] is None  # Only 2 active clubs in sample_clubs
+
+    def test_list_clubs_invalid_cursor(self, app_client):
+        """Test that a malformed cursor is rejected"""
+        response = app_client.get("/api/v1/clubs/?cursor=not-a-cursor")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_list_clubs_search(self, client, sample_clubs):
         """Test searching clubs by name"""
         response = client.get("/api/v1/clubs/?search=ACM")
@@ -89,7 +129,7 @@ class TestGetClubBySlug:
             is_active=False
         )
         db_session.add(inactive_club)
-        db_session.commit()
+        db_session.flush()  # The request shares this session, so no commit is needed
 
         response = client.get(f"/api/v1/clubs/{inactive_club.slug}")
 
@@ -191,3 +231,35 @@ class TestFeaturedClubs:
         # Should only return featured clubs (1 in sample_clubs)
         if len(clubs) > 0:
             assert all(club.get("is_featured", False) for club in clubs)
+
+
+class TestClubETags:
+    """Tests for conditional GETs on the clubs API"""
+
+    def test_etag_conditional_get(self, client, sample_clubs):
+        """Test that a matching If-None-Match gets an empty 304"""
+        response = client.get("/api/v1/clubs/featured")
+        etag = response.headers.get("etag")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert etag
+
+        response = client.get("/api/v1/clubs/featured", headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["etag"] == etag
+        assert len(response.content) == 0
+
+    def test_etag_mismatch_returns_body(self, client, sample_clubs):
+        """Test that a stale If-None-Match gets the full response"""
+        response = client.get("/api/v1/clubs/featured", headers={"If-None-Match": 'W/"stale"'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert isinstance(response.json(), list)
+
+    def test_no_etag_with_authorization(self, client, auth_headers, sample_clubs):
+        """Test that authenticated requests are never tagged"""
+        response = client.get("/api/v1/clubs/featured", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "etag" not in response.headers
@@ -3,13 +3,17 @@ Unit tests for Security module
 """
 import pytest
 from datetime import timedelta
+from jose import JWTError
 
 from app.core.security import (
     get_password_hash,
     verify_password,
+    is_password_recently_verified,
+    remember_verified_password,
     create_access_token,
     create_refresh_token,
-    decode_token
+    decode_token,
+    hash_token
 )
 
 
@@ -55,6 +59,24 @@ class TestPasswordHashing:
 
         assert verify_password("", hashed) is False
 
+    def test_remember_verified_password(self):
+        """Test a remembered pair is recognised and other passwords are not"""
+        password = "TestPassword123!"
+        hashed = get_password_hash(password)
+
+        assert is_password_recently_verified(password, hashed) is False
+        remember_verified_password(password, hashed)
+        assert is_password_recently_verified(password, hashed) is True
+        assert is_password_recently_verified("WrongPassword123!", hashed) is False
+
+    def test_remembered_password_after_password_change(self):
+        """Test a remembered pair is not recognised against a new hash"""
+        password = "TestPassword123!"
+        remember_verified_password(password, get_password_hash(password))
+
+        new_hash = get_password_hash("NewPassword123!")
+        assert is_password_recently_verified(password, new_hash) is False
+
 
 class TestTokenGeneration:
     """Tests for JWT token generation"""
@@ -116,6 +138,15 @@ class TestTokenGeneration:
 
         assert decoded is None
 
+    def test_decode_tampered_token_rejected(self):
+        """Test that a token with a modified payload fails verification"""
+        token = create_access_token({"sub": "test@bmsce.ac.in"})
+        header, _, signature = token.split(".")
+        forged = create_access_token({"sub": "admin@bmsce.ac.in"}).split(".")[1]
+
+        with pytest.raises(JWTError):
+            decode_token(f"{header}.{forged}.{signature}")
+
     def test_token_contains_required_fields(self):
         """Test that token contains all required fields"""
         email = "test@bmsce.ac.in"
@@ -129,3 +160,16 @@ class TestTokenGeneration:
         assert "exp" in decoded
         assert decoded["sub"] == email
         assert decoded.get("extra") == "data"  # Extra data should be preserved
+
+
+class TestTokenHashing:
+    """Tests for emailed token hashing"""
+
+    def test_hash_token_is_deterministic(self):
+        """Test that the same token always maps to the same 16-byte digest"""
+        assert hash_token("reset-token") == hash_token("reset-token")
+        assert len(hash_token("reset-token")) == 16
+
+    def test_hash_token_differs_per_token(self):
+        """Test that different tokens produce different digests"""
+        assert hash_token("reset-token") != hash_token("other-token")
@@ -3,35 +3,39 @@ Unit tests for security headers validation
 Tests OWASP security headers and CORS configuration
 """
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
+from app.middleware.rate_limit import redis_client
 
 
-client = TestClient(app)
+def _redis_available() -> bool:
+    """Whether the rate limiter's Redis backend answers a ping"""
+    try:
+        return redis_client is not None and redis_client.ping()
+    except Exception:
+        return False
 
 
 class TestSecurityHeaders:
     """Test suite for security headers"""
 
-    def test_security_headers_on_root_endpoint(self):
+    async def test_security_headers_on_root_endpoint(self, async_client):
         """Test that security headers are present on root endpoint"""
-        response = client.get("/")
+        response = await async_client.get("/")
 
         # Should have CORS headers
         assert "access-control-allow-origin" in response.headers
         assert response.status_code == 200
 
-    def test_security_headers_on_api_endpoint(self):
+    async def test_security_headers_on_api_endpoint(self, async_client):
         """Test that security headers are present on API endpoints"""
-        response = client.get("/api/v1/clubs/")
+        response = await async_client.get("/api/v1/clubs/")
 
         # Should have CORS headers
         assert "access-control-allow-origin" in response.headers
         assert response.status_code == 200
 
-    def test_cors_allow_credentials(self):
+    async def test_cors_allow_credentials(self, async_client):
         """Test that CORS allows credentials"""
-        response = client.options(
+        response = await async_client.options(
             "/api/v1/clubs/",
             headers={
                 "Origin": "http://localhost:3000",
@@ -42,9 +46,9 @@ class TestSecurityHeaders:
         assert "access-control-allow-credentials" in response.headers
         assert response.headers["access-control-allow-credentials"] == "true"
 
-    def test_cors_allowed_methods(self):
+    async def test_cors_allowed_methods(self, async_client):
         """Test that CORS allows required methods"""
-        response = client.options(
+        response = await async_client.options(
             "/api/v1/clubs/",
             headers={
                 "Origin": "http://localhost:3000",
@@ -58,9 +62,9 @@ class TestSecurityHeaders:
         for method in required_methods:
             assert method in allowed_methods
 
-    def test_cors_allowed_headers(self):
+    async def test_cors_allowed_headers(self, async_client):
         """Test that CORS allows required headers"""
-        response = client.options(
+        response = await async_client.options(
             "/api/v1/clubs/",
             headers={
                 "Origin": "http://localhost:3000",
@@ -73,10 +77,10 @@ class TestSecurityHeaders:
         assert "authorization" in allowed_headers
         assert "content-type" in allowed_headers
 
-    def test_compression_enabled(self):
+    async def test_compression_enabled(self, async_client):
         """Test that GZip compression is enabled for large responses"""
         # Make a request that should return a large response
-        response = client.get("/api/v1/clubs/")
+        response = await async_client.get("/api/v1/clubs/")
 
         # GZip middleware should add vary header
         if len(response.content) > 1000:
@@ -84,56 +88,62 @@ class TestSecurityHeaders:
             # Note: The actual compression header depends on the client's Accept-Encoding
             assert response.status_code == 200
 
-    def test_json_content_type(self):
+    async def test_json_content_type(self, async_client):
         """Test that API endpoints return JSON content type"""
-        response = client.get("/api/v1/clubs/")
+        response = await async_client.get("/api/v1/clubs/")
 
         content_type = response.headers.get("content-type", "")
         assert "application/json" in content_type
 
-    def test_health_endpoint_accessible(self):
+    async def test_health_endpoint_accessible(self, async_client):
         """Test that health check endpoint is accessible"""
-        response = client.get("/health")
+        response = await async_client.get("/health")
 
         assert response.status_code == 200
         assert response.json()["status"] == "healthy"
         assert response.json()["service"] == "clubcompass-api"
 
-    def test_api_documentation_accessible(self):
+    async def test_no_etag_outside_clubs(self, async_client):
+        """Test that ETags are only added to the clubs API"""
+        response = await async_client.get("/health")
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+
+    async def test_api_documentation_accessible(self, async_client):
         """Test that API documentation is accessible"""
         # Test OpenAPI JSON
-        response = client.get("/openapi.json")
+        response = await async_client.get("/openapi.json")
         assert response.status_code == 200
         assert "openapi" in response.json()
 
         # Test Swagger UI
-        response = client.get("/docs")
+        response = await async_client.get("/docs")
         assert response.status_code == 200
 
         # Test ReDoc
-        response = client.get("/redoc")
+        response = await async_client.get("/redoc")
         assert response.status_code == 200
 
 
 class TestRateLimiting:
     """Test suite for rate limiting"""
 
-    def test_rate_limiter_configured(self):
+    async def test_rate_limiter_configured(self, async_client):
         """Test that rate limiter is configured"""
         # Make a request to verify rate limiter is set up
-        response = client.get("/api/v1/clubs/")
+        response = await async_client.get("/api/v1/clubs/")
         assert response.status_code == 200
 
         # Rate limit headers should be present (from slowapi)
         # Note: Actual rate limiting behavior depends on Redis configuration
         # This test just verifies the endpoint is accessible
 
-    def test_excessive_requests_rate_limited(self):
+    @pytest.mark.skipif(not _redis_available(), reason="Rate limiting requires Redis")
+    async def test_excessive_requests_rate_limited(self, async_client):
         """Test that excessive requests are rate limited"""
-        # This test would require Redis to be configured
-        # For now, just verify the endpoint responds correctly
         for _ in range(5):
-            response = client.get("/api/v1/clubs/")
+            response = await async_client.get("/api/v1/clubs/")
             assert response.status_code in [200, 429]  # 200 or rate limited
 
             if response.status_code == 429:
@@ -145,14 +155,14 @@ class TestRateLimiting:
 class TestCSRFProtection:
     """Test suite for CSRF protection"""
 
-    def test_get_requests_allowed_without_token(self):
+    async def test_get_requests_allowed_without_token(self, async_client):
         """Test that GET requests work without CSRF token"""
-        response = client.get("/api/v1/clubs/")
+        response = await async_client.get("/api/v1/clubs/")
         assert response.status_code == 200
 
-    def test_post_requests_require_authentication(self):
+    async def test_post_requests_require_authentication(self, async_client):
         """Test that POST requests require authentication"""
-        response = client.post(
+        response = await async_client.post(
             "/api/v1/clubs/",
             json={
                 "name": "Test Club",
@@ -168,9 +178,9 @@ class TestCSRFProtection:
 class TestInputValidation:
     """Test suite for input validation"""
 
-    def test_invalid_club_category_rejected(self):
+    async def test_invalid_club_category_rejected(self, async_client):
         """Test that invalid club category is rejected"""
-        response = client.get("/api/v1/clubs/?category=invalid")
+        response = await async_client.get("/api/v1/clubs/?category=invalid")
 
         # Should either reject or return empty list
         assert response.status_code in [200, 422]
@@ -180,63 +190,54 @@ class TestInputValidation:
             data = response.json()
             assert "data" in data
 
-    def test_sql_injection_prevented(self):
-        """Test that SQL injection attempts are prevented"""
-        # Try SQL injection in search parameter
-        response = client.get(
-            "/api/v1/clubs/?search=' OR '1'='1"
-        )
-
-        # Should not cause an error (SQLAlchemy prevents injection)
-        assert response.status_code == 200
-
-    def test_xss_prevention_in_search(self):
-        """Test that XSS attempts in search are handled safely"""
-        xss_payload = "<script>alert('XSS')</script>"
-        response = client.get(
-            f"/api/v1/clubs/?search={xss_payload}"
-        )
+    @pytest.mark.parametrize("payload", [
+        "' OR '1'='1",  # SQL injection; the search text is a bound parameter
+        "<script>alert('XSS')</script>",
+    ], ids=["sql_injection", "xss"])
+    async def test_malicious_search_handled(self, async_client, payload):
+        """Test that SQL injection and XSS attempts in search are handled safely"""
+        response = await async_client.get("/api/v1/clubs/", params={"search": payload})
 
         # Should not cause an error
         assert response.status_code == 200
 
-    def test_pagination_validation(self):
+    async def test_pagination_validation(self, async_client):
         """Test that pagination parameters are validated"""
         # Test negative page number
-        response = client.get("/api/v1/clubs/?page=-1")
+        response = await async_client.get("/api/v1/clubs/?page=-1")
         assert response.status_code in [200, 422]
 
         # Test zero page number
-        response = client.get("/api/v1/clubs/?page=0")
+        response = await async_client.get("/api/v1/clubs/?page=0")
         assert response.status_code in [200, 422]
 
         # Test excessive per_page
-        response = client.get("/api/v1/clubs/?per_page=10000")
+        response = await async_client.get("/api/v1/clubs/?per_page=10000")
         assert response.status_code in [200, 422]
 
 
 class TestErrorHandling:
     """Test suite for error handling"""
 
-    def test_404_error_handled(self):
+    async def test_404_error_handled(self, async_client):
         """Test that 404 errors are handled properly"""
-        response = client.get("/api/v1/clubs/nonexistent-club-slug")
+        response = await async_client.get("/api/v1/clubs/nonexistent-club-slug")
 
         # Should return 404 or empty response
         assert response.status_code in [200, 404]
 
-    def test_405_method_not_allowed(self):
+    async def test_405_method_not_allowed(self, async_client):
         """Test that invalid HTTP methods return 405"""
         # Try to DELETE the clubs list endpoint
-        response = client.request("TRACE", "/api/v1/clubs/")
+        response = await async_client.request("TRACE", "/api/v1/clubs/")
 
         # Should return method not allowed
         assert response.status_code in [405, 422]
 
-    def test_error_response_format(self):
+    async def test_error_response_format(self, async_client):
         """Test that error responses have consistent format"""
         # Trigger an error by accessing non-existent endpoint
-        response = client.get("/api/v1/nonexistent")
+        response = await async_client.get("/api/v1/nonexistent")
 
         # Should return JSON error
         if response.status_code >= 400:
@@ -247,10 +248,10 @@ class TestErrorHandling:
 class TestAuthentication:
     """Test suite for authentication security"""
 
-    def test_protected_endpoints_require_auth(self):
+    async def test_protected_endpoints_require_auth(self, async_client):
         """Test that protected endpoints require authentication"""
         # Try to create a club without auth
-        response = client.post(
+        response = await async_client.post(
             "/api/v1/clubs/",
             json={
                 "name": "Test Club",
@@ -262,18 +263,18 @@ class TestAuthentication:
         # Should be unauthorized
         assert response.status_code in [401, 403, 422]
 
-    def test_invalid_token_rejected(self):
+    async def test_invalid_token_rejected(self, async_client):
         """Test that invalid auth tokens are rejected"""
         headers = {"Authorization": "Bearer invalid_token"}
-        response = client.get("/api/v1/users/me", headers=headers)
+        response = await async_client.get("/api/v1/users/me", headers=headers)
 
         # Should be unauthorized
         assert response.status_code == 401
 
-    def test_malformed_token_rejected(self):
+    async def test_malformed_token_rejected(self, async_client):
         """Test that malformed auth tokens are rejected"""
         headers = {"Authorization": "NotBearer token"}
-        response = client.get("/api/v1/users/me", headers=headers)
+        response = await async_client.get("/api/v1/users/me", headers=headers)
 
         # Should be unauthorized
         assert response.status_code in [401, 403]
@@ -0,0 +1,81 @@
+"""
+Unit tests for UserService, called directly without the HTTP layer
+"""
+import uuid
+
+import pytest
+
+from app.services.user_service import user_service
+
+
+pytestmark = pytest.mark.users
+
+
+class TestUserLookup:
+    """Tests for fetching users"""
+
+    def test_get_user_by_id(self, db_session, test_user):
+        """Test fetching an existing user by ID"""
+        user = user_service.get_user_by_id(db_session, test_user.id)
+
+        assert user is not None
+        assert user.id == test_user.id
+        assert user.email == test_user.email
+
+    def test_get_nonexistent_user(self, db_session):
+        """Test fetching an unknown ID returns None"""
+        assert user_service.get_user_by_id(db_session, uuid.uuid4()) is None
+
+    def test_get_user_by_email(self, db_session, test_user):
+        """Test fetching a user by email"""
+        user = user_service.get_user_by_email(db_session, test_user.email)
+
+        assert user is not None
+        assert user.id == test_user.id
+
+
+class TestUserListing:
+    """Tests for the admin user listing"""
+
+    def test_get_all_users_with_pagination(self, db_session, test_user, test_admin):
+        """Test that a page is limited but the total counts every user"""
+        users, total = user_service.get_all_users(db_session, skip=0, limit=1)
+
+        assert len(users) == 1
+        assert total == 2
+
+    def test_get_all_users_filtered(self, db_session, test_user, test_admin):
+        """Test filtering the listing by admin flag"""
+        users, total = user_service.get_all_users(db_session, is_admin=True)
+
+        assert [user.id for user in users] == [test_admin.id]
+        assert total == 1
+
+    def test_page_past_the_end_keeps_total(self, db_session, test_user, test_admin):
+        """Test that an empty page past the end still reports the total"""
+        users, total = user_service.get_all_users(db_session, skip=10, limit=10)
+
+        assert users == []
+        assert total == 2
+
+
+class TestUserFlags:
+    """Tests for admin status and role updates"""
+
+    def test_update_user_status(self, db_session, test_user):
+        """Test deactivating a user"""
+        user = user_service.update_user_status(db_session, test_user.id, False)
+
+        assert user is not None
+        assert user.is_active is False
+
+    def test_update_user_role(self, db_session, test_user):
+        """Test granting the admin role"""
+        user = user_service.update_user_role(db_session, test_user.id, True)
+
+        assert user is not None
+        assert user.is_admin is True
+
+    def test_update_nonexistent_user(self, db_session):
+        """Test updating an unknown ID returns None"""
+        assert user_service.update_user_status(db_session, uuid.uuid4(), False) is None
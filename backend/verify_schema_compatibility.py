@@ -5,10 +5,28 @@ Tests that Phase 3 schema changes don't break existing endpoints
 import sys
 from app.models.user import User
 from app.schemas.user import UserResponse
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
 
 
+# Fields that SHOULD be in UserResponse
+EXPECTED_RESPONSE_FIELDS = frozenset({
+    'id', 'email', 'full_name', 'created_at',
+    'updated_at', 'email_verified', 'is_active', 'is_admin'
+})
+
+# Sensitive fields that should NOT be in UserResponse
+SENSITIVE_FIELDS = frozenset({
+    'password_hash',
+    'reset_password_token',
+    'reset_password_token_expires',
+    'email_verification_token',
+    'email_verification_token_expires'
+})
+
+RESPONSE_FIELDS = frozenset(UserResponse.model_fields)
+
+
 def test_user_model_fields():
     """Verify User model has all required fields"""
     print("Testing User model fields...")
@@ -43,37 +61,19 @@ def test_user_response_schema():
     """Verify UserResponse schema does NOT expose token fields"""
     print("Testing UserResponse schema security...")
 
-    # Fields that SHOULD be in UserResponse
-    expected_fields = {
-        'id', 'email', 'full_name', 'created_at',
-        'updated_at', 'email_verified', 'is_active', 'is_admin'
-    }
-
-    # Sensitive fields that should NOT be in UserResponse
-    sensitive_fields = {
-        'password_hash',
-        'reset_password_token',
-        'reset_password_token_expires',
-        'email_verification_token',
-        'email_verification_token_expires'
-    }
-
-    # Get UserResponse model fields
-    response_fields = set(UserResponse.model_fields.keys())
-
     # Check expected fields are present
-    missing_expected = expected_fields - response_fields
+    missing_expected = EXPECTED_RESPONSE_FIELDS - RESPONSE_FIELDS
     if missing_expected:
-        print(f"  ❌ FAIL: Expected fields missing: {missing_expected}")
+        print(f"  ❌ FAIL: Expected fields missing: {set(missing_expected)}")
         return False
-    print(f"  ✅ All expected fields present: {expected_fields}")
+    print(f"  ✅ All expected fields present: {set(EXPECTED_RESPONSE_FIELDS)}")
 
     # Check sensitive fields are NOT present
-    exposed_sensitive = sensitive_fields & response_fields
-    if exposed_sensitive:
-        print(f"  ❌ CRITICAL FAIL: Sensitive fields exposed: {exposed_sensitive}")
+    if not SENSITIVE_FIELDS.isdisjoint(RESPONSE_FIELDS):
+        exposed_sensitive = SENSITIVE_FIELDS & RESPONSE_FIELDS
+        print(f"  ❌ CRITICAL FAIL: Sensitive fields exposed: {set(exposed_sensitive)}")
         return False
-    print(f"  ✅ Sensitive fields not exposed: {sensitive_fields}")
+    print(f"  ✅ Sensitive fields not exposed: {set(SENSITIVE_FIELDS)}")
 
     print("✅ UserResponse schema is secure\n")
     return True
@@ -84,13 +84,14 @@ def test_user_model_defaults():
     print("Testing User model field defaults...")
 
     # Create a mock user object (not saved to DB)
+    now = datetime.now(timezone.utc)
     test_user = User(
         id=uuid.uuid4(),
         email="test@bmsce.ac.in",
         password_hash="hashed_password",
         full_name="Test User",
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow()
+        created_at=now,
+        updated_at=now
     )
 
     # Check new fields default to None
@@ -118,20 +119,21 @@ def test_user_response_serialization():
 
     try:
         # Create a test user data dict
+        now = datetime.now(timezone.utc)
         user_data = {
             'id': uuid.uuid4(),
             'email': 'test@bmsce.ac.in',
             'full_name': 'Test User',
-            'created_at': datetime.utcnow(),
-            'updated_at': datetime.utcnow(),
+            'created_at': now,
+            'updated_at': now,
             'email_verified': False,
             'is_active': True,
             'is_admin': False,
             # New fields with values
             'reset_password_token': 'some_token_123',
-            'reset_password_token_expires': datetime.utcnow(),
+            'reset_password_token_expires': now,
             'email_verification_token': 'verify_token_456',
-            'email_verification_token_expires': datetime.utcnow(),
+            'email_verification_token_expires': now,
             # Should not be in response
             'password_hash': 'hashed_password'
         }
@@ -150,18 +152,10 @@ def test_user_response_serialization():
         # Verify sensitive fields are not in the response
         response_dict = user_response.model_dump()
 
-        sensitive_fields = [
-            'password_hash',
-            'reset_password_token',
-            'reset_password_token_expires',
-            'email_verification_token',
-            'email_verification_token_expires'
-        ]
-
-        for field in sensitive_fields:
-            if field in response_dict:
+        if not SENSITIVE_FIELDS.isdisjoint(response_dict):
+            for field in sorted(SENSITIVE_FIELDS & response_dict.keys()):
                 print(f"  ❌ CRITICAL FAIL: Sensitive field '{field}' in response!")
-                return False
+            return False
 
         print(f"  ✅ Serialized successfully")
         print(f"  ✅ Response fields: {list(response_dict.keys())}")